@@ -0,0 +1,87 @@
+import gc
+import sys
+import tracemalloc
+from json import dumps
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser, Namespace
+from typing import Callable, Dict, List, Optional
+from models.import_model import ImportModel
+from models.file_reader_model import FileReaderModel
+from models.file_collector_model import FileCollectorModel
+from utilities.import_store import ImportStore
+from .synthetic_repository import SyntheticRepositoryModel
+
+
+def _scan(paths: List[str]) -> Dict[str, dict]:
+    """Per-file import records as the scan produces them: a fresh dict of lists of strings per file."""
+    return {
+        path: ImportModel(imports=FileReaderModel(file_path=path).get_imports()).get_libraries(as_json=False)
+        for path in paths
+    }
+
+
+def _retained(build: Callable[[], object]) -> int:
+    """Bytes still allocated by build() once it returned and garbage was collected (allocations of its result)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        retained: int = tracemalloc.get_traced_memory()[0]
+        del result
+    finally:
+        tracemalloc.stop()
+    return retained
+
+
+def measure_import_storage(root_directory: str | Path) -> dict:
+    """
+    Memory held by DependencyModel.imports for every file of 'root_directory', stored as plain nested dicts (the
+    previous layout) and as an ImportStore. Both are measured on a fresh scan, so strings are counted as the
+    parser allocates them in the first case and once per distinct value in the second. What a scan retains
+    without keeping its result (interpreter caches) is measured separately and subtracted from both.
+    """
+    paths: List[str] = FileCollectorModel().collect_files(root_path=Path(root_directory).as_posix(), extension=".py", return_files=True)
+    paths = [str(path) for path in paths]
+    _scan(paths)  # warm up the classification caches, so neither measurement includes them
+
+    overhead: int = _retained(lambda: _scan(paths) and None)
+    plain: int = max(_retained(lambda: _scan(paths)) - overhead, 1)
+    compact: int = max(_retained(lambda: ImportStore(_scan(paths))) - overhead, 1)
+    files: int = max(len(paths), 1)
+    return {
+        "files": len(paths),
+        "plain_bytes_per_file": plain / files,
+        "store_bytes_per_file": compact / files,
+        "ratio": plain / compact,
+    }
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> Namespace:
+    parser = ArgumentParser(description="Memory per file of the import records, as plain dicts and as an ImportStore.")
+    parser.add_argument("--files", type=int, default=2000, help="number of generated modules")
+    parser.add_argument("--density", type=int, default=10, help="import statements per module")
+    parser.add_argument("--stdlib-ratio", type=float, default=0.5, help="share of imports that target the standard library")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--root", default=None, help="measure an existing tree instead of a synthetic repository")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    options: Namespace = parse_arguments(arguments)
+    if options.root:
+        results: dict = measure_import_storage(options.root)
+    else:
+        repository = SyntheticRepositoryModel(
+            file_count=options.files, import_density=options.density, stdlib_ratio=options.stdlib_ratio, seed=options.seed
+        )
+        with TemporaryDirectory() as directory:
+            repository.generate(directory)
+            results = measure_import_storage(directory)
+    print(dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import sys
+import platform
+from json import dumps, loads
+from pathlib import Path
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from argparse import ArgumentParser, Namespace
+from typing import Callable, Dict, List, Optional
+from models.graph_model import GraphModel
+from models.import_model import ImportModel
+from models.file_reader_model import FileReaderModel
+from models.file_collector_model import FileCollectorModel
+from .synthetic_repository import SyntheticRepositoryModel
+
+
+STAGES: List[str] = ["collect_files", "get_imports", "extract", "graph_build", "graph_save"]
+RESULTS_FORMAT_VERSION: int = 1
+
+# a stage regresses when it is slower than the baseline by more than the threshold and by more than this many seconds
+_MINIMUM_DELTA: float = 0.005
+
+
+def _best_of(repeat: int, stage: Callable[[], object]) -> float:
+    best: Optional[float] = None
+    for _ in range(max(repeat, 1)):
+        start: float = perf_counter()
+        stage()
+        elapsed: float = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_stages(root_directory: str | Path, repeat: Optional[int] = 3) -> Dict[str, float]:
+    """
+    Time every stage of a scan of 'root_directory' separately, keeping the best of 'repeat' runs, in seconds.
+    Each stage gets the output of the previous one, so only its own work is measured.
+    """
+    collector = FileCollectorModel()
+    paths: List[str] = collector.collect_files(root_path=root_directory, extension=".py")
+    statements: List[List[str]] = [FileReaderModel(file_path=path).get_imports() for path in paths]
+    libraries: List[dict] = [ImportModel(imports=imports).get_libraries(as_json=False) for imports in statements]
+    data: List[dict] = [
+        {"file": path, "import": sorted({*found["custom"], *found["standard"]})}
+        for path, found in zip(paths, libraries) if found["custom"] or found["standard"]
+    ]
+    graph = GraphModel(data=data)
+
+    with TemporaryDirectory() as directory:
+        return {
+            "collect_files": _best_of(repeat, lambda: collector.collect_files(root_path=root_directory, extension=".py")),
+            "get_imports": _best_of(repeat, lambda: [FileReaderModel(file_path=path).get_imports() for path in paths]),
+            "extract": _best_of(repeat, lambda: [ImportModel(imports=imports) for imports in statements]),
+            "graph_build": _best_of(repeat, lambda: GraphModel(data=data)),
+            "graph_save": _best_of(repeat, lambda: graph.save(local_save_path=directory, file_name="benchmark.png")),
+        }
+
+
+def run_benchmark(repository: SyntheticRepositoryModel, repeat: Optional[int] = 3) -> dict:
+    with TemporaryDirectory() as directory:
+        repository.generate(directory)
+        stages: Dict[str, float] = run_stages(directory, repeat=repeat)
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "repository": repository.model_dump(),
+        "environment": {"python": sys.version.split()[0], "platform": platform.platform()},
+        "stages": stages,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: Optional[float] = 0.25) -> List[str]:
+    """
+    Describe every stage that regressed against 'baseline' by more than 'threshold' (0.25: 25% slower).
+    Results of a different synthetic repository cannot be compared and raise a ValueError.
+    """
+    if results.get("repository") != baseline.get("repository"):
+        raise ValueError("The baseline was recorded for a different synthetic repository; record a new baseline.")
+
+    regressions: List[str] = []
+    for stage, seconds in results["stages"].items():
+        previous: Optional[float] = baseline.get("stages", {}).get(stage)
+        if previous is None:
+            continue
+        if seconds > previous * (1 + threshold) and seconds - previous > _MINIMUM_DELTA:
+            change: str = f" (+{(seconds / previous - 1) * 100:.0f}%)" if previous > 0 else ""
+            regressions.append(f"{stage}: {seconds:.4f}s vs baseline {previous:.4f}s{change}")
+    return regressions
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> Namespace:
+    parser = ArgumentParser(description="Time each scan stage on a synthetic repository and compare with a baseline.")
+    parser.add_argument("--files", type=int, default=500, help="number of generated modules")
+    parser.add_argument("--density", type=int, default=10, help="import statements per module")
+    parser.add_argument("--depth", type=int, default=3, help="package nesting depth")
+    parser.add_argument("--stdlib-ratio", type=float, default=0.5, help="share of imports that target the standard library")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the fastest one is kept")
+    parser.add_argument("--output", default="benchmark_results.json", help="where to write the results")
+    parser.add_argument("--baseline", default=None, help="results file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown per stage, 0.25 = 25%%")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to --baseline instead of comparing")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    options: Namespace = parse_arguments(arguments)
+    repository = SyntheticRepositoryModel(
+        file_count=options.files,
+        import_density=options.density,
+        nesting_depth=options.depth,
+        stdlib_ratio=options.stdlib_ratio,
+        seed=options.seed,
+    )
+    results: dict = run_benchmark(repository, repeat=options.repeat)
+    Path(options.output).write_text(dumps(results, indent=2), encoding="utf-8")
+    for stage in STAGES:
+        print(f"{stage:>14}: {results['stages'][stage]:.4f}s")
+
+    if not options.baseline:
+        return 0
+    if options.update_baseline:
+        Path(options.baseline).write_text(dumps(results, indent=2), encoding="utf-8")
+        return 0
+
+    try:
+        regressions: List[str] = compare(results, loads(Path(options.baseline).read_text(encoding="utf-8")), options.threshold)
+    except (OSError, ValueError) as error:
+        print(f"Cannot compare with the baseline: {error}")
+        return 2
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import random
+from pathlib import Path
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+STANDARD_MODULES: List[str] = [
+    "os", "sys", "json", "re", "math", "time", "typing", "pathlib", "functools", "itertools",
+    "collections", "datetime", "logging", "hashlib", "random", "subprocess", "threading", "string",
+]
+
+
+class SyntheticRepositoryModel(BaseModel):
+    """
+    Generates a reproducible Python tree to benchmark against: 'file_count' modules spread over packages nested up to
+    'nesting_depth' levels, each with 'import_density' import statements of which 'stdlib_ratio' import the standard
+    library and the rest import other generated modules (absolute and relative forms alike).
+    """
+    file_count: int = Field(default=500, ge=1)
+    import_density: int = Field(default=10, ge=0)
+    nesting_depth: int = Field(default=3, ge=0)
+    stdlib_ratio: float = Field(default=0.5, ge=0.0, le=1.0)
+    packages_per_level: int = Field(default=4, ge=1)
+    seed: Optional[int] = Field(default=0)
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __packages(self) -> List[List[str]]:
+        packages: List[List[str]] = [["synthetic"]]
+        level: List[List[str]] = [["synthetic"]]
+        for depth in range(self.nesting_depth):
+            level = [parent + [f"package_{depth}_{index}"] for parent in level for index in range(self.packages_per_level)]
+            packages.extend(level)
+        return packages
+
+    @staticmethod
+    def __custom_import(generator: random.Random, module: List[str], target: List[str]) -> str:
+        if module[:-1] == target[:-1] and generator.random() < 0.5:
+            return f"from . import {target[-1]}"
+        if generator.random() < 0.5:
+            return f"from {'.'.join(target[:-1])} import {target[-1]}"
+        return f"import {'.'.join(target)}"
+
+    # ----------------
+    # public methods
+    # ----------------
+    def modules(self) -> List[List[str]]:
+        """Dotted module paths (as parts) of every generated file, in creation order."""
+        packages: List[List[str]] = self.__packages()
+        return [packages[index % len(packages)] + [f"module_{index}"] for index in range(self.file_count)]
+
+    def generate(self, root_directory: str | Path) -> List[str]:
+        """Write the tree below 'root_directory' and return the generated module paths (posix)."""
+        generator = random.Random(self.seed)
+        root: Path = Path(root_directory)
+        modules: List[List[str]] = self.modules()
+
+        for package in self.__packages():
+            directory: Path = root.joinpath(*package)
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / "__init__.py").touch()
+
+        paths: List[str] = []
+        for module in modules:
+            lines: List[str] = ['"""Generated module."""']
+            for _ in range(self.import_density):
+                if generator.random() < self.stdlib_ratio or len(modules) == 1:
+                    lines.append(f"import {generator.choice(STANDARD_MODULES)}")
+                else:
+                    target: List[str] = generator.choice(modules)
+                    if target is not module:
+                        lines.append(self.__custom_import(generator, module, target))
+            lines.extend(["", "", f"def {module[-1]}_function(value):", "    return value", ""])
+
+            path: Path = root.joinpath(*module).with_suffix(".py")
+            path.write_text("\n".join(lines), encoding="utf-8")
+            paths.append(path.as_posix())
+        return paths
@@ -0,0 +1,73 @@
+import pytest
+from json import loads, dumps
+from ..stage_benchmark import STAGES, compare, main, run_stages
+from ..synthetic_repository import SyntheticRepositoryModel
+from ..memory_benchmark import measure_import_storage
+
+
+@pytest.mark.parametrize("file_count, nesting_depth", [(1, 0), (20, 2), (50, 3)])
+def test_generate(tmp_path, file_count, nesting_depth):
+    repository = SyntheticRepositoryModel(file_count=file_count, import_density=5, nesting_depth=nesting_depth, stdlib_ratio=0.5)
+    paths = repository.generate(tmp_path)
+    assert len(paths) == file_count
+    assert all((tmp_path / path).is_file() for path in paths)
+    assert max(len(module) for module in repository.modules()) == nesting_depth + 2
+
+
+def test_generate_is_reproducible(tmp_path):
+    repository = SyntheticRepositoryModel(file_count=10, seed=7)
+    first = [open(path).read() for path in repository.generate(tmp_path / "a")]
+    second = [open(path).read() for path in repository.generate(tmp_path / "b")]
+    assert first == second
+
+
+@pytest.mark.parametrize("stdlib_ratio, expected", [(1.0, "import "), (0.0, "synthetic")])
+def test_stdlib_ratio(tmp_path, stdlib_ratio, expected):
+    paths = SyntheticRepositoryModel(file_count=5, import_density=4, stdlib_ratio=stdlib_ratio).generate(tmp_path)
+    lines = [line for path in paths for line in open(path).read().splitlines() if "import" in line]
+    assert lines and all(expected in line or line.startswith("from .") for line in lines)
+
+
+def test_run_stages(tmp_path):
+    SyntheticRepositoryModel(file_count=10, import_density=3).generate(tmp_path)
+    stages = run_stages(tmp_path, repeat=1)
+    assert list(stages) == STAGES
+    assert all(seconds >= 0 for seconds in stages.values())
+
+
+@pytest.mark.parametrize("current, previous, expected", [
+    (1.0, 1.0, 0),
+    (1.2, 1.0, 0),
+    (1.5, 1.0, 1),
+    (0.003, 0.001, 0),
+])
+def test_compare(current, previous, expected):
+    repository = SyntheticRepositoryModel().model_dump()
+    results = {"repository": repository, "stages": {"extract": current}}
+    baseline = {"repository": repository, "stages": {"extract": previous}}
+    assert len(compare(results, baseline, threshold=0.25)) == expected
+
+
+def test_compare_rejects_other_repository():
+    with pytest.raises(ValueError):
+        compare({"repository": {"file_count": 1}, "stages": {}}, {"repository": {"file_count": 2}, "stages": {}})
+
+
+def test_main_fails_on_regression(tmp_path):
+    output, baseline = tmp_path / "results.json", tmp_path / "baseline.json"
+    arguments = ["--files", "5", "--repeat", "1", "--output", str(output), "--baseline", str(baseline)]
+    assert main(arguments + ["--update-baseline"]) == 0
+
+    recorded = loads(baseline.read_text())
+    recorded["stages"] = {stage: 0.0 for stage in STAGES}
+    baseline.write_text(dumps(recorded))
+    assert main(arguments + ["--threshold", "-1"]) == 1
+    assert set(loads(output.read_text())["stages"]) == set(STAGES)
+
+
+def test_import_storage_is_smaller_as_store(tmp_path):
+    SyntheticRepositoryModel(file_count=200, import_density=10).generate(tmp_path)
+    results = measure_import_storage(tmp_path)
+    assert results["files"] >= 200
+    assert results["store_bytes_per_file"] < results["plain_bytes_per_file"]
+    assert results["ratio"] > 1.3
@@ -0,0 +1,22 @@
+import pytest
+from pathlib import Path
+from typing import Dict, Optional
+
+
+@pytest.fixture
+def project_files() -> Dict[str, Optional[str]]:
+    """Files of the 'project' tree, relative path -> content (None for an empty directory); test modules override it."""
+    return {"a.py": "import os\nfrom b import run\n", "b.py": "import json\n"}
+
+
+@pytest.fixture
+def project(tmp_path, project_files) -> Path:
+    root: Path = tmp_path / "project"
+    root.mkdir()
+    for name, content in project_files.items():
+        if content is None:
+            (root / name).mkdir(parents=True, exist_ok=True)
+        else:
+            (root / name).parent.mkdir(parents=True, exist_ok=True)
+            (root / name).write_text(content)
+    return root
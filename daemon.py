@@ -0,0 +1,87 @@
+import sys
+from json import dumps
+from pathlib import Path
+from typing import List, Optional
+from argparse import ArgumentParser, Namespace
+from models.graph_model import GraphModel
+from models.daemon_model import DaemonModel
+from models.import_model import ImportModel
+from models.scan_cache_model import ScanCacheModel
+from models.file_reader_model import FileReaderModel
+from models.dependency_model import DependencyModel
+from models.file_collector_model import FileCollectorModel
+from utilities.daemon_client import DaemonClient
+
+
+DEFAULT_SOCKET: str = ".dependency-daemon.sock"
+# the positional values of 'query' are passed as this argument of the command
+QUERY_ARGUMENTS: dict = {
+    "find_by_library": "library",
+    "find_by_module": "module",
+    "transitive_dependencies": "path",
+    "transitive_dependents": "path",
+    "impacted_files": "paths",
+}
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> Namespace:
+    parser = ArgumentParser(
+        description="Keep the dependency index of a project in memory and answer queries over a Unix socket. "
+                    "Example: python daemon.py serve --root . & python daemon.py query find_by_library numpy"
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    commands = parser.add_subparsers(dest="action", required=True)
+
+    serve = commands.add_parser("serve", help="scan (or load a snapshot of) the project and serve queries")
+    serve.add_argument("--root", default=Path.cwd().as_posix(), help="project root directory to scan (default: current directory)")
+    serve.add_argument("--snapshot", default=None, help="snapshot loaded at start-up when it exists and written on shutdown")
+    serve.add_argument("--cache", default=None, help="scan cache file; reused between runs to skip unchanged files")
+    serve.add_argument("--workers", type=int, default=1, help="number of parallel workers, 0 uses all CPU cores")
+    serve.add_argument("--interval", type=float, default=1.0, help="seconds between incremental re-scans, 0 disables them")
+
+    query = commands.add_parser("query", help="send one command to a running daemon and print the JSON result")
+    query.add_argument("command", help=f"one of: {', '.join([*QUERY_ARGUMENTS, 'find_import_cycles', 'refresh', 'stats', 'ping', 'shutdown'])}")
+    query.add_argument("values", nargs="*", help="library, module or path(s); impacted_files reads paths from stdin when none are given")
+    return parser.parse_args(arguments)
+
+
+def build_daemon(options: Namespace) -> DaemonModel:
+    parameters: dict = {
+        "graph_class": GraphModel,
+        "file_import_class": ImportModel,
+        "file_reader_class": FileReaderModel,
+        "file_collector": FileCollectorModel(),
+        "root_directory": options.root,
+        "scan_cache": ScanCacheModel(cache_path=options.cache) if options.cache else None,
+        "workers": options.workers,
+    }
+    if options.snapshot and Path(options.snapshot).exists():
+        dependency_model: DependencyModel = DependencyModel.from_snapshot(options.snapshot, **parameters)
+        dependency_model.poll_changes()
+    else:
+        dependency_model = DependencyModel(**parameters)
+    return DaemonModel(
+        dependency_model=dependency_model,
+        socket_path=options.socket,
+        watch_interval=options.interval or None,
+        snapshot_path=options.snapshot,
+    )
+
+
+def query(options: Namespace):
+    arguments: dict = {}
+    name: Optional[str] = QUERY_ARGUMENTS.get(options.command)
+    if name == "paths":
+        arguments[name] = options.values or sys.stdin.read().splitlines()
+    elif name:
+        arguments[name] = options.values[0] if options.values else None
+    with DaemonClient(options.socket) as client:
+        return client.request(options.command, **arguments)
+
+
+if __name__ == "__main__":
+    parsed: Namespace = parse_arguments()
+    if parsed.action == "serve":
+        build_daemon(parsed).serve_forever()
+    else:
+        print(dumps(query(parsed), indent=2))
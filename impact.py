@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+from typing import List, Optional
+from argparse import ArgumentParser, Namespace
+from models.graph_model import GraphModel
+from models.import_model import ImportModel
+from models.scan_cache_model import ScanCacheModel
+from models.file_reader_model import FileReaderModel
+from models.dependency_model import DependencyModel
+from models.file_collector_model import FileCollectorModel
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> Namespace:
+    parser = ArgumentParser(
+        description="Print every file that imports one of the changed files read from stdin (one path per line), "
+                    "directly or transitively. Example: git diff --name-only main | python impact.py --root ."
+    )
+    parser.add_argument("--root", default=Path.cwd().as_posix(), help="project root directory to scan (default: current directory)")
+    parser.add_argument("--relative-to", default=None, help="directory the changed paths are relative to (default: --root)")
+    parser.add_argument("--cache", default=None, help="scan cache file; reused between runs to skip unchanged files")
+    parser.add_argument("--workers", type=int, default=1, help="number of parallel workers, 0 uses all CPU cores")
+    parser.add_argument("--exclude-changed", action="store_true", help="leave the changed files themselves out of the output")
+    parser.add_argument("--relative", action="store_true", help="print paths relative to --root")
+    return parser.parse_args(arguments)
+
+
+def impact(arguments: Optional[List[str]] = None) -> List[str]:
+    options: Namespace = parse_arguments(arguments)
+    dependency_collector = DependencyModel(
+        graph_class=GraphModel,
+        file_import_class=ImportModel,
+        file_reader_class=FileReaderModel,
+        file_collector=FileCollectorModel(),
+        root_directory=options.root,
+        scan_cache=ScanCacheModel(cache_path=options.cache) if options.cache else None,
+        workers=options.workers,
+    )
+    impacted: List[str] = dependency_collector.impacted_files(
+        sys.stdin.read().splitlines(),
+        include_changed=not options.exclude_changed,
+        relative_to=options.relative_to,
+    )
+    if options.relative:
+        root: Path = Path(options.root).resolve()
+        impacted = [Path(path).resolve().relative_to(root).as_posix() for path in impacted]
+    return impacted
+
+
+if __name__ == "__main__":
+    print("\n".join(impact()))
@@ -24,5 +24,7 @@ class AbstractDependencyModel(ABC):
         rotation: Optional[int] = 90,
         fontsize: Optional[int] = 8,
         cbar: Optional[bool] = True,
+        render_mode: Optional[str] = "auto",
+        time_budget: Optional[float] = 5.0,
     ):
         pass
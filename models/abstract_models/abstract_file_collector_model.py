@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 from pathlib import Path
 from abc import ABC, abstractmethod
 
@@ -15,3 +15,19 @@ class AbstractFileCollectorModel(ABC):
             return_files: bool = False
             ) -> List[str]:
         pass
+
+    def iter_files(
+            self,
+            root_path: str | Path = None,
+            extension: str = None,
+            exclude_start_characters: str = None,
+            exclude_end_characters: str = None
+            ) -> Iterator[str]:
+        """Lazy variant of collect_files(); collectors that can stream should override it."""
+        yield from self.collect_files(
+            root_path=root_path,
+            extension=extension,
+            exclude_start_characters=exclude_start_characters,
+            exclude_end_characters=exclude_end_characters,
+            return_files=True
+        )
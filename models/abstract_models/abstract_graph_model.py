@@ -1,4 +1,7 @@
+from pathlib import Path
 from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple
+from utilities.exporters import write_edges
 
 
 class AbstractGraphModel(ABC):
@@ -10,3 +13,14 @@ class AbstractGraphModel(ABC):
     @abstractmethod
     def save(self, local_save_path: str = None) -> None:
         pass
+
+    def update_edges(self, added: List[Tuple[str, str]], removed: List[Tuple[str, str]]) -> None:
+        """Patch the graph in place. Graphs that cannot do this are rebuilt by DependencyModel instead."""
+        raise NotImplementedError
+
+    def iter_edges(self) -> Iterator[Tuple[str, str]]:
+        raise NotImplementedError
+
+    def export_edges(self, file_path: str | Path, export_format: Optional[str] = None, compress: Optional[bool] = None) -> int:
+        """Stream the edges to JSONL, CSV, DOT or GraphML (format and gzip default to the file suffix); returns the edge count."""
+        return write_edges(self.iter_edges(), file_path, export_format=export_format, compress=compress)
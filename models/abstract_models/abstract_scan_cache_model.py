@@ -0,0 +1,25 @@
+from typing import List, Iterable, Optional
+from abc import ABC, abstractmethod
+
+
+class AbstractScanCacheModel(ABC):
+
+    @abstractmethod
+    def load(self, namespace: Optional[str] = None) -> None:
+        pass
+
+    @abstractmethod
+    def lookup(self, file_path: str) -> Optional[List[str]]:
+        pass
+
+    @abstractmethod
+    def store(self, file_path: str, imports: List[str], digest: Optional[str] = None) -> None:
+        pass
+
+    @abstractmethod
+    def prune(self, file_paths: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def save(self) -> None:
+        pass
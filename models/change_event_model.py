@@ -0,0 +1,13 @@
+from typing import List, Tuple
+from pydantic import BaseModel, Field
+
+
+class ChangeEventModel(BaseModel):
+    added_files: List[str] = Field(default_factory=list)
+    modified_files: List[str] = Field(default_factory=list)
+    removed_files: List[str] = Field(default_factory=list)
+    added_edges: List[Tuple[str, str]] = Field(default_factory=list)
+    removed_edges: List[Tuple[str, str]] = Field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added_files or self.modified_files or self.removed_files)
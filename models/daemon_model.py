@@ -0,0 +1,183 @@
+import os
+import socket
+import socketserver
+from json import dumps, loads
+from pathlib import Path
+from threading import Event, RLock, Thread
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from .dependency_model import DependencyModel
+from .change_event_model import ChangeEventModel
+
+
+_COMMANDS: Dict[str, Callable[..., Any]] = {
+    "ping": lambda model: "pong",
+    "find_by_library": lambda model, library, file_only=False, match="exact": list(
+        model.find_by_library(library, file_only=file_only, match=match)
+    ),
+    "find_by_module": lambda model, module, file_only=False, match="exact": list(
+        model.find_by_module(module, file_only=file_only, match=match)
+    ),
+    "transitive_dependencies": lambda model, path: model.transitive_dependencies(path),
+    "transitive_dependents": lambda model, path: model.transitive_dependents(path),
+    "impacted_files": lambda model, paths, include_changed=True, relative_to=None: model.impacted_files(
+        paths, include_changed=include_changed, relative_to=relative_to
+    ),
+    "find_import_cycles": lambda model: model.find_import_cycles(),
+}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers JSON lines until the client disconnects, so editors and hooks can keep one connection open."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(self.server.daemon_model.handle_request(line) + b"\n")
+            self.wfile.flush()
+
+
+class DaemonModel(BaseModel):
+    """
+    Keeps a DependencyModel in memory and serves queries over a Unix domain socket, one JSON object per line:
+    {"command": "find_by_library", "arguments": {"library": "numpy"}} -> {"ok": true, "result": [...]}.
+    A background thread polls the tree every 'watch_interval' seconds and applies incremental re-scans; the tree
+    is walked without blocking queries, applying changes is serialised with them, and the reachability index is
+    rebuilt by the watcher, not by the next query.
+    """
+    dependency_model: DependencyModel
+    socket_path: str | Path
+    watch_interval: Optional[float] = Field(default=1.0)
+    snapshot_path: Optional[str | Path] = Field(default=None)
+    requests_served: int = Field(default=0)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    _lock: RLock = PrivateAttr(default_factory=RLock)
+    _stop: Event = PrivateAttr(default_factory=Event)
+    _stopped: Event = PrivateAttr(default_factory=Event)
+    _server: Optional[socketserver.BaseServer] = PrivateAttr(default=None)
+    _threads: list = PrivateAttr(default_factory=list)
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __warm_up(self) -> None:
+        """Resolve file dependencies and build the reachability index ahead of the first query."""
+        with self._lock:
+            self.dependency_model.impacted_files([])
+
+    def __refresh(self) -> ChangeEventModel:
+        """Walk and stat the tree while queries are served; the lock is only taken to apply changes, if any."""
+        changed, removed = self.dependency_model.find_changes()
+        if not (changed or removed):
+            return ChangeEventModel()
+        with self._lock:
+            event: ChangeEventModel = self.dependency_model.refresh_paths(changed, removed_paths=removed)
+            if not event.is_empty():
+                self.__warm_up()
+        return event
+
+    def __watch(self) -> None:
+        while not self._stop.wait(self.watch_interval):
+            self.__refresh()
+
+    @staticmethod
+    def __is_served(socket_path: Path) -> bool:
+        """Whether a process accepts connections on 'socket_path'; connecting to a stale socket is refused."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(1.0)
+        try:
+            probe.connect(str(socket_path))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    def __create_server(self) -> socketserver.BaseServer:
+        server_class = getattr(socketserver, "ThreadingUnixStreamServer", None)
+        if server_class is None:
+            raise RuntimeError("The dependency daemon needs Unix domain sockets, which this platform does not provide.")
+        socket_path: Path = Path(self.socket_path)
+        if socket_path.exists():
+            if self.__is_served(socket_path):
+                raise RuntimeError(f"A dependency daemon is already serving {socket_path}.")
+            # a socket left behind by a daemon that did not shut down cleanly
+            socket_path.unlink()
+        server = server_class(str(socket_path), _RequestHandler)
+        server.daemon_threads = True
+        server.daemon_model = self
+        return server
+
+    # ----------------
+    # public methods
+    # ----------------
+    def handle_request(self, line: bytes | str) -> bytes:
+        """Answer one request line; errors are reported in the response, never raised."""
+        started: float = perf_counter()
+        try:
+            request: dict = loads(line)
+            command: str = request.get("command")
+            if command == "stats":
+                result = self.stats()
+            elif command == "refresh":
+                result = self.__refresh().model_dump()
+            elif command == "shutdown":
+                Thread(target=self.stop, daemon=True).start()
+                result = "stopping"
+            elif command in _COMMANDS:
+                with self._lock:
+                    result = _COMMANDS[command](self.dependency_model, **(request.get("arguments") or {}))
+            else:
+                raise ValueError(f"Unknown command '{command}'. Options: {', '.join(sorted([*_COMMANDS, 'stats', 'refresh', 'shutdown']))}.")
+            response: dict = {"ok": True, "result": result}
+        except Exception as error:
+            response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+        self.requests_served += 1
+        response["elapsed_ms"] = round((perf_counter() - started) * 1000, 3)
+        return dumps(response).encode("utf-8")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "root_directory": str(self.dependency_model.root_directory),
+                "files": len(self.dependency_model.imports),
+                "requests_served": self.requests_served,
+                "stages": dict(self.dependency_model.stats.stages),
+            }
+
+    def start(self) -> None:
+        """Bind the socket and serve in background threads; returns once queries are accepted."""
+        self.__warm_up()
+        self._stop.clear()
+        self._stopped.clear()
+        self._server = self.__create_server()
+        self._threads = [Thread(target=self._server.serve_forever, daemon=True)]
+        if self.watch_interval:
+            self._threads.append(Thread(target=self.__watch, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def serve_forever(self) -> None:
+        """start(), then block until stop() is called (e.g. by a 'shutdown' request) or the process is interrupted."""
+        self.start()
+        try:
+            self._stopped.wait()
+        except KeyboardInterrupt:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serving, remove the socket and write the snapshot (if configured) so the next start skips the scan."""
+        if self._server is None:
+            return
+        self._stop.set()
+        server, self._server = self._server, None
+        server.shutdown()
+        server.server_close()
+        Path(self.socket_path).unlink(missing_ok=True)
+        if self.snapshot_path:
+            with self._lock:
+                self.dependency_model.save_snapshot(self.snapshot_path)
+        self._stopped.set()
@@ -1,16 +1,127 @@
+import asyncio
 from json import dumps
-from gc import collect
+from collections import deque
+from time import perf_counter
+from os import cpu_count, stat
+from threading import Event, RLock, Thread
 from pathlib import Path
-from itertools import islice
-from pydantic import BaseModel, ConfigDict, Field
-from typing import Tuple, Generator, List, Type, Optional
+from functools import partial
+from itertools import chain, islice
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from typing import Callable, Dict, Tuple, Generator, Iterable, Iterator, List, Type, Optional
+from utilities.graph_analysis import find_cycles
+from utilities.module_index import project_root_scope, register_project_root
+from utilities.reachability import ReachabilityIndex
+from utilities.imports import classification_cache_info
+from utilities.shared_tasks import SharedTaskRegistry
+from utilities.import_store import ImportStore, iter_entries
+from utilities.batch_extraction import extract_file
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from .change_event_model import ChangeEventModel
+from .scan_stats_model import ScanStatsModel
+from utilities.snapshot import Snapshot, SnapshotMapping, write_snapshot
+from utilities.exporters import write_edges, write_records
+from .import_model import ImportModel
+from .file_reader_model import FileReaderModel
+from .import_index_model import ImportIndexModel, _flatten
+from .module_resolver_model import ModuleResolverModel
 from .abstract_models.abstract_graph_model import AbstractGraphModel
 from .abstract_models.abstract_import_model import AbstractImportModel
+from .abstract_models.abstract_scan_cache_model import AbstractScanCacheModel
 from .abstract_models.abstract_dependency_model import AbstractDependencyModel
 from .abstract_models.abstract_file_reader_model import AbstractFileReaderModel
 from .abstract_models.abstract_file_collector_model import AbstractFileCollectorModel
 
 
+_PROCESS_CHUNKSIZE: int = 16
+_THREAD_BATCH: int = 64
+_ASYNC_CONCURRENCY: int = 32
+_ASYNC_BATCH: int = 64
+# in-flight ascan_root() scans, shared by concurrent callers asking for the same root
+_SHARED_SCANS: SharedTaskRegistry = SharedTaskRegistry()
+
+
+def _uses_plain_extraction(file_reader_class: Type[AbstractFileReaderModel], file_import_class: Type[AbstractImportModel]) -> bool:
+    """
+    Whether the configured classes are FileReaderModel and ImportModel themselves, so that files can go through
+    utilities.batch_extraction without building (and validating) two models each. Any subclass keeps the per-file
+    models, since validators, model_post_init or field defaults can change what it reads or how it classifies.
+    """
+    return file_reader_class is FileReaderModel and file_import_class is ImportModel
+
+
+def _process_file(
+        file_reader_class: Type[AbstractFileReaderModel],
+        file_import_class: Type[AbstractImportModel],
+        job: Tuple[str, Optional[List[str]]]
+    ) -> Tuple[str, List[str | None], dict, bool, dict]:
+    """
+    Extract (unless the cached statements are given) and classify one file. Returns the path, its statements,
+    its libraries, whether the file was parsed and its metrics for ScanStatsModel. Module-level, so that it can be
+    pickled into process pool workers.
+    """
+    if _uses_plain_extraction(file_reader_class, file_import_class):
+        return extract_file(*job)
+
+    path, imports = job
+    parsed: bool = imports is None
+    metrics: dict = {}
+    start: float = perf_counter()
+    if parsed:
+        reader = file_reader_class(file_path=path)
+        imports = reader.get_imports()
+        metrics["bytes_read"] = getattr(reader, "bytes_read", 0)
+        metrics["parse_failed"] = getattr(reader, "parse_failed", False)
+        metrics["digest"] = getattr(reader, "digest", None)
+        metrics["read"] = perf_counter() - start
+        start = perf_counter()
+    libraries: dict = file_import_class(imports=imports).get_libraries(as_json=False)
+    metrics["classify"] = perf_counter() - start
+    return path, imports, libraries, parsed, metrics
+
+
+def _file_state(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        status = stat(path)
+        return status.st_mtime_ns, status.st_size
+    except OSError:
+        return None
+
+
+def _process_file_with_state(
+        file_reader_class: Type[AbstractFileReaderModel],
+        file_import_class: Type[AbstractImportModel],
+        job: Tuple[str, Optional[List[str]]]
+    ) -> Tuple[Tuple[str, List[str | None], dict, bool, dict], Optional[Tuple[int, int]]]:
+    """
+    _process_file() plus the file's (mtime, size), taken before the file is read: a change made while it is read
+    leaves a state that no longer matches, so the next find_changes() picks the file up again.
+    """
+    state: Optional[Tuple[int, int]] = _file_state(job[0])
+    return _process_file(file_reader_class, file_import_class, job), state
+
+
+def _process_batch(
+        file_reader_class: Type[AbstractFileReaderModel],
+        file_import_class: Type[AbstractImportModel],
+        jobs: List[Tuple[str, Optional[List[str]]]]
+    ) -> List[Tuple[Tuple[str, List[str | None], dict, bool, dict], Optional[Tuple[int, int]]]]:
+    """_process_file_with_state() for a batch of jobs in one call, so a pool runs one task per batch rather than per file."""
+    return [_process_file_with_state(file_reader_class, file_import_class, job) for job in jobs]
+
+
+def _process_path_with_state(
+        scan_cache: Optional[AbstractScanCacheModel],
+        file_reader_class: Type[AbstractFileReaderModel],
+        file_import_class: Type[AbstractImportModel],
+        path: str
+    ) -> Tuple[Tuple[str, List[str | None], dict, bool, dict], Optional[Tuple[int, int]]]:
+    """_process_file_with_state() around the scan cache lookup of 'path', so its stat (and hash) also run in the worker."""
+    state: Optional[Tuple[int, int]] = _file_state(path)
+    job: Tuple[str, Optional[List[str]]] = (path, scan_cache.lookup(path) if scan_cache else None)
+    return _process_file(file_reader_class, file_import_class, job), state
+
+
 class DependencyModel(BaseModel, AbstractDependencyModel):
     graph_class: Type[AbstractGraphModel]
     file_collector: AbstractFileCollectorModel
@@ -22,11 +133,43 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
     extension: Optional[str] = Field(default=".py")
     exclude_start_characters: str = Field(default=None)
     exclude_end_characters: str = Field(default=None)
-    imports: dict = Field(default_factory=dict)
+    imports: ImportStore = Field(default_factory=ImportStore)
+    import_statements: dict = Field(default_factory=dict)
+    file_dependencies: dict = Field(default_factory=dict)
+    module_resolver: Optional[ModuleResolverModel] = Field(default=None)
+    file_graph_instance: AbstractGraphModel = Field(default=None)
     graph_instance: AbstractGraphModel = Field(default=None)
     import_type: Optional[str] = Field(default=None)
     remove_from_root_path: str = Field(default=None)
     autobuild: bool = Field(default=False)
+    autoscan: bool = Field(default=True)
+    scan_cache: Optional[AbstractScanCacheModel] = Field(default=None)
+    workers: Optional[int] = Field(default=1)
+    import_index: ImportIndexModel = Field(default_factory=ImportIndexModel)
+    stats: ScanStatsModel = Field(default_factory=ScanStatsModel)
+    profile: Optional[bool] = Field(default=False)
+    trace_memory: Optional[bool] = Field(default=False)
+    _lock: RLock = PrivateAttr(default_factory=RLock)
+    _stop_watching: Event = PrivateAttr(default_factory=Event)
+    _subscribers: List[Callable] = PrivateAttr(default_factory=list)
+    _file_states: Dict[str, Optional[Tuple[int, int]]] = PrivateAttr(default_factory=dict)
+    _graph_parameters: Optional[Tuple[str, Optional[str]]] = PrivateAttr(default=None)
+    _reachability: Optional[ReachabilityIndex] = PrivateAttr(default=None)
+    _dependency_snapshot: Optional[Snapshot] = PrivateAttr(default=None)
+    _async_scans: SharedTaskRegistry = PrivateAttr(default_factory=SharedTaskRegistry)
+    executor_type: Optional[str] = Field(default="thread")
+
+    @field_validator("imports", mode="before")
+    @classmethod
+    def __to_import_store(cls, imports):
+        return imports if isinstance(imports, ImportStore) else ImportStore(imports or {})
+
+    def __setattr__(self, name: str, value) -> None:
+        # assignments are not validated (validate_assignment would copy the snapshot-backed mappings into dicts),
+        # so convert imports here as the validator does on construction
+        if name == "imports":
+            value = self.__to_import_store(value)
+        super().__setattr__(name, value)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -36,29 +179,95 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
 
         if not self.root_directory:
             self.root_directory = Path.cwd().as_posix()
-        self.__run()
+
+        if self.executor_type not in ["thread", "process"]:
+            self.executor_type = "thread"
+
+        if self.autoscan:
+            self.__run()
 
         if self.autobuild:
             self.build_graph()
 
     def __run(self) -> str:
-        collected_paths: List[str] = self.file_collector.collect_files(
-            root_path=self.root_directory,
-            extension=self.extension,
-            exclude_start_characters=self.exclude_start_characters,
-            exclude_end_characters=self.exclude_end_characters,
-            return_files=True
-        )
+        self.stats = ScanStatsModel()
+        with project_root_scope(self.root_directory):
+            hits, misses = classification_cache_info()
+
+            with self.stats.capture(profile=self.profile, trace_memory=self.trace_memory), self.stats.stage("scan"):
+                if self.scan_cache:
+                    with self.stats.stage("cache_load"):
+                        self.scan_cache.load(namespace=f"{self.file_reader_class.__module__}.{self.file_reader_class.__qualname__}")
+
+                collected_paths: List[str] = []
+                for path, libraries, state in self.__process_files(self.__timed(self.__iter_paths(), "collect_files")):
+                    collected_paths.append(path)
+                    self.__add_imports(path=path, imports=libraries)
+                    self._file_states[path] = state
+
+                if self.scan_cache:
+                    with self.stats.stage("cache_save"):
+                        self.scan_cache.prune(collected_paths)
+                        self.scan_cache.save()
+
+                with self.stats.stage("index"):
+                    self.refresh_index()
+
+            current_hits, current_misses = classification_cache_info()
+            self.stats.record_classification(current_hits - hits, current_misses - misses)
+
+    def __timed(self, iterator: Iterable, stage: str) -> Iterator:
+        """Pass items through, adding the time spent producing them to a stage of self.stats."""
+        iterator = iter(iterator)
+        while True:
+            start: float = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.stats.add_time(stage, perf_counter() - start)
+                return
+            self.stats.add_time(stage, perf_counter() - start)
+            yield item
 
-        for path in collected_paths:
-            if path:
-                reader = self.file_reader_class(file_path=path)
-                imports: List[str | None] = reader.get_imports()
-                import_model = self.file_import_class(imports=imports)
-                self.__add_imports(path=path, imports=import_model.get_libraries(as_json=False))
-                del import_model
-                collect()
-    
+    def __resolve_workers(self) -> int:
+        if self.workers is None or self.workers < 1:
+            return cpu_count() or 1
+        return self.workers
+
+    def __process_files(self, paths: Iterable[str]) -> Iterator[Tuple[str, dict, Optional[Tuple[int, int]]]]:
+        """
+        Extract and classify files, yielding (path, libraries, state taken before the read) in input order. Files
+        found in the scan cache skip the reader.
+        Paths are consumed lazily, so with a pool the workers start while the collector is still walking; results
+        are still yielded in input order, so the merge into self.imports is deterministic.
+        """
+        with project_root_scope(self.root_directory):
+            jobs = ((path, self.scan_cache.lookup(path) if self.scan_cache else None) for path in paths if path)
+            task = partial(_process_file_with_state, self.file_reader_class, self.file_import_class)
+            workers: int = self.__resolve_workers()
+
+            if workers == 1:
+                yield from self.__collect_results(map(task, jobs))
+            elif self.executor_type == "process":
+                with ProcessPoolExecutor(
+                    max_workers=workers, initializer=register_project_root, initargs=(self.root_directory,)
+                ) as executor:
+                    yield from self.__collect_results(executor.map(task, jobs, chunksize=_PROCESS_CHUNKSIZE))
+            else:
+                batches = iter(lambda: list(islice(jobs, _THREAD_BATCH)), [])
+                batch_task = partial(_process_batch, self.file_reader_class, self.file_import_class)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    yield from self.__collect_results(chain.from_iterable(executor.map(batch_task, batches)))
+
+    def __collect_results(
+            self, results: Iterator[Tuple[Tuple[str, List[str | None], dict, bool, dict], Optional[Tuple[int, int]]]]
+        ) -> Iterator[Tuple[str, dict, Optional[Tuple[int, int]]]]:
+        for (path, imports, libraries, parsed, metrics), state in results:
+            self.stats.record_file(path, parsed, metrics)
+            if self.scan_cache and parsed:
+                self.scan_cache.store(path, imports, digest=metrics.get("digest"))
+            self.import_statements[path] = imports
+            yield path, libraries, state
 
     def __path_to_posix(self, path: str) -> str:
         try:
@@ -70,24 +279,35 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
         path = self.__path_to_posix(path)
         return self.imports.get(path, {})
 
-    def __iterate_by_values(self, items: dict, file: str, module: str, module_type: str) -> Generator:
-        """items.values() is a List[List[str]] and needs to be flattened."""
-        for item in sum(items.values(), []):
-            if item == module:
-                yield {"file": file, "module": module, "type": module_type}
+    def __get_import_index(self) -> ImportIndexModel:
+        if not self.import_index.is_built_from(self.imports):
+            self.refresh_index()
+        return self.import_index
 
     def __add_imports(self, path: str, imports: dict):
         if path not in self.imports:
             self.imports[path] = imports
         else:
-            self.imports[path]["standard"].extend(imports["standard"])
-            self.imports[path]["custom"].extend(imports["custom"])
+            merged: dict = self.imports[path]
+            merged["standard"].extend(imports["standard"])
+            merged["custom"].extend(imports["custom"])
+            self.imports[path] = merged
 
     def __modify_root_path(self, file_path: str, remove_from_root_path: Optional[str] = None) -> str:
         if remove_from_root_path:
             return file_path.replace(remove_from_root_path, "")
         return file_path
 
+    def __parse_file_for_graph(self, full_path: str, import_type: str, remove_from_root_path: Optional[str]) -> Generator:
+        entries = iter_entries(self.imports, full_path, import_type)
+        full_path = self.__modify_root_path(full_path, remove_from_root_path)
+        for k, v in entries:
+            if not v:
+                yield {"file": full_path, "import": "*"}
+            else:
+                for module in v:
+                    yield {"file": full_path, "import": module}
+
     def __parse_imports_for_graph(
             self, 
             import_type: Optional[str] = "custom", 
@@ -96,16 +316,182 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
         if import_type not in ["standard", "custom"]:
             import_type = "custom"
 
-        for full_path, data in self.imports.items():
-            data = data[import_type]
-            full_path = self.__modify_root_path(full_path, remove_from_root_path)
-            if data:
-                for k, v in data.items():
-                    if not v:
-                        yield {"file": full_path, "import": "*"}
-                    else:
-                        for module in v:
-                            yield {"file": full_path, "import": module}
+        for full_path in self.imports:
+            yield from self.__parse_file_for_graph(full_path, import_type, remove_from_root_path)
+
+    def __graph_edges_of(self, path: str) -> set:
+        """The graph edges contributed by one file, for the parameters of the last build_graph() call."""
+        if path not in self.imports:
+            return set()
+
+        import_type, remove_from_root_path = self._graph_parameters or (self.import_type, self.remove_from_root_path)
+        import_types: List[str] = ["custom", "standard"] if import_type == "all" else [import_type]
+        edges: set = set()
+        for kind in import_types:
+            for edge in self.__parse_file_for_graph(path, kind, remove_from_root_path):
+                modules = edge["import"] if isinstance(edge["import"], list) else [edge["import"]]
+                edges.update((edge["file"], module) for module in modules)
+        return edges
+
+    def __iter_paths(self) -> Iterator[str]:
+        return self.file_collector.iter_files(
+            root_path=self.root_directory,
+            extension=self.extension,
+            exclude_start_characters=self.exclude_start_characters,
+            exclude_end_characters=self.exclude_end_characters
+        )
+
+    def __collect_paths(self) -> List[str]:
+        return [path for path in self.__iter_paths() if path]
+
+    def __get_module_resolver(self) -> ModuleResolverModel:
+        if self.module_resolver is None:
+            self.module_resolver = ModuleResolverModel(root_directory=self.root_directory, extension=self.extension)
+            self.module_resolver.build(self.imports)
+        return self.module_resolver
+
+    def __refresh_file_dependencies(self, paths: List[str], files_changed: bool) -> None:
+        """Keep file_dependencies current after an incremental update, once they have been resolved."""
+        if not self.file_dependencies and self.module_resolver is None:
+            return
+        self._reachability = None
+        self._dependency_snapshot = None
+        if files_changed:
+            # a new or deleted file can change how any other file's imports resolve
+            self.module_resolver = None
+            self.resolve_file_dependencies()
+            return
+        resolver: ModuleResolverModel = self.__get_module_resolver()
+        for path in paths:
+            self.file_dependencies[path] = resolver.resolve_file(path, self.import_statements.get(path, []))
+
+    def __get_reachability(self) -> ReachabilityIndex:
+        with self._lock:
+            snapshot: Optional[Snapshot] = self._dependency_snapshot
+            if self._reachability is None and snapshot is not None:
+                # the file dependencies are still the snapshot's, so index its stored graph arrays
+                self._reachability = ReachabilityIndex.from_adjacency(snapshot.paths(), snapshot.dependency_lists())
+            if self._reachability is None:
+                if not self.file_dependencies:
+                    self.resolve_file_dependencies()
+                self._reachability = ReachabilityIndex(
+                    ((path, target) for path, targets in self.file_dependencies.items() for target in targets),
+                    nodes=self.file_dependencies,
+                )
+            return self._reachability
+
+    def __locate_paths(self, paths: Iterable[str], relative_to: Optional[str | Path]) -> List[str]:
+        """Map user-supplied paths (absolute, or relative to 'relative_to') onto scanned paths; unknown paths are dropped."""
+        reachability: ReachabilityIndex = self.__get_reachability()
+        root: str = str(Path(self.root_directory)).replace("\\", "/")
+        base: Path = Path(relative_to if relative_to is not None else self.root_directory).resolve()
+        resolved_root: Path = Path(root).resolve()
+        located: List[str] = []
+        for path in paths:
+            path = self.__path_to_posix(path.strip())
+            if not path:
+                continue
+            if path in reachability:
+                located.append(path)
+                continue
+            try:
+                relative: str = (base / path).resolve().relative_to(resolved_root).as_posix()
+            except ValueError:
+                continue
+            candidate: str = relative if root == "." else f"{root}/{relative}"
+            if candidate in reachability:
+                located.append(candidate)
+        return located
+
+    def __publish(self, event: ChangeEventModel) -> None:
+        for subscriber in list(self._subscribers):
+            subscriber(event)
+
+    def __commit_scan(self, stats: ScanStatsModel, imports: dict, statements: dict, states: dict) -> None:
+        with self._lock, stats.stage("index"):
+            self.stats = stats
+            self.load_results(imports, statements, states)
+
+    async def __ascan(self, concurrency: int, executor: Optional[Executor]) -> "DependencyModel":
+        """
+        The async counterpart of __run(): paths are discovered in batches in a worker thread, files are read,
+        parsed and classified in 'executor' with at most 'concurrency' files in flight, and results are merged in
+        discovery order on the event loop. The model is only updated once the whole scan succeeded, so a cancelled
+        scan leaves the previous state in place.
+        """
+        loop = asyncio.get_running_loop()
+        stats = ScanStatsModel()
+        semaphore = asyncio.Semaphore(concurrency)
+        if self.scan_cache and isinstance(executor, ProcessPoolExecutor):
+            # pool processes cannot update this process's scan cache: look files up in a thread, then submit them
+            task = partial(_process_file_with_state, self.file_reader_class, self.file_import_class)
+
+            async def submit(path: str) -> Tuple[Tuple[str, List[str | None], dict, bool, dict], Optional[Tuple[int, int]]]:
+                return await loop.run_in_executor(executor, task, (path, await asyncio.to_thread(self.scan_cache.lookup, path)))
+
+            start = lambda path: asyncio.ensure_future(submit(path))
+        else:
+            task = partial(_process_path_with_state, self.scan_cache, self.file_reader_class, self.file_import_class)
+            start = lambda path: loop.run_in_executor(executor, task, path)
+        imports, statements, states = ImportStore(), {}, {}
+        pending: deque = deque()
+        started: float = perf_counter()
+
+        def merge(outcome: Tuple[Tuple[str, List[str | None], dict, bool, dict], Optional[Tuple[int, int]]]) -> None:
+            (path, file_imports, libraries, parsed, metrics), state = outcome
+            stats.record_file(path, parsed, metrics)
+            if self.scan_cache and parsed:
+                self.scan_cache.store(path, file_imports, digest=metrics.get("digest"))
+            imports[path] = libraries
+            statements[path] = file_imports
+            states[path] = state
+
+        with project_root_scope(self.root_directory):
+            hits, misses = classification_cache_info()
+            try:
+                if self.scan_cache:
+                    with stats.stage("cache_load"):
+                        await asyncio.to_thread(
+                            self.scan_cache.load,
+                            namespace=f"{self.file_reader_class.__module__}.{self.file_reader_class.__qualname__}",
+                        )
+
+                paths: Iterator[str] = iter(self.__iter_paths())
+                while True:
+                    with stats.stage("collect_files"):
+                        batch: List[str] = await asyncio.to_thread(lambda: list(islice(paths, _ASYNC_BATCH)))
+                    if not batch:
+                        break
+                    for path in batch:
+                        if not path:
+                            continue
+                        await semaphore.acquire()
+                        future = start(path)
+                        future.add_done_callback(lambda _: semaphore.release())
+                        pending.append(future)
+                        while pending and pending[0].done():
+                            merge(pending.popleft().result())
+                while pending:
+                    merge(await pending.popleft())
+
+                if self.scan_cache:
+                    with stats.stage("cache_save"):
+                        self.scan_cache.prune(imports)
+                        await asyncio.to_thread(self.scan_cache.save)
+            except BaseException:
+                # cancelled, or a file failed: drop the queued work, in-flight reads finish in the background
+                for future in pending:
+                    future.cancel()
+                raise
+            current_hits, current_misses = classification_cache_info()
+
+        stats.record_classification(current_hits - hits, current_misses - misses)
+        await asyncio.to_thread(self.__commit_scan, stats, imports, statements, states)
+        stats.add_time("scan", perf_counter() - started)
+        stats.record_memory()
+        if self.autobuild:
+            await self.abuild_graph()
+        return self
 
     # ----------------
     # public methods
@@ -114,29 +500,163 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
         data = {k: self.imports[k] for k in islice(self.imports, number_of_elements)}
         return dumps(data, indent=4) if as_json else data
 
+    def iter_import_records(self) -> Iterator[dict]:
+        """One {"file", "type", "library", "module"} record per imported name (module is None for plain imports)."""
+        for path in self.imports:
+            for import_type in ("standard", "custom"):
+                for library, names in iter_entries(self.imports, path, import_type):
+                    names = list(_flatten(names))
+                    for name in names or [None]:
+                        yield {"file": path, "type": import_type, "library": library, "module": name}
+
+    def export_imports(self, file_path: str | Path, export_format: Optional[str] = None, compress: Optional[bool] = None) -> int:
+        """Stream the per-file import records to JSONL or CSV (format and gzip default to the file suffix); returns the record count."""
+        return write_records(self.iter_import_records(), file_path, export_format=export_format, compress=compress)
+
+    def export_graph(
+            self,
+            file_path: str | Path,
+            export_format: Optional[str] = None,
+            compress: Optional[bool] = None,
+            file_graph: Optional[bool] = False
+        ) -> int:
+        """
+        Stream the import graph (built first if needed) or, with file_graph, the file-to-file dependencies to JSONL,
+        CSV, DOT or GraphML. Returns the number of edges written.
+        """
+        if file_graph:
+            if not self.file_dependencies:
+                self.resolve_file_dependencies()
+            edges = ((path, target) for path, targets in self.file_dependencies.items() for target in targets)
+            return write_edges(edges, file_path, export_format=export_format, compress=compress)
+
+        if self.graph_instance is None:
+            self.build_graph()
+        if self.graph_instance is None:
+            return write_edges([], file_path, export_format=export_format, compress=compress)
+        return self.graph_instance.export_edges(file_path, export_format=export_format, compress=compress)
+
+    def save_snapshot(self, file_path: str | Path) -> None:
+        """
+        Persist the scan (imports, statements, resolved file dependencies and file states) as a memory-mappable
+        binary snapshot; see utilities.snapshot for the format.
+        """
+        with self._lock:
+            write_snapshot(
+                file_path,
+                imports=self.imports,
+                import_statements=self.import_statements,
+                file_dependencies=self.file_dependencies,
+                file_states=self._file_states,
+                metadata={
+                    "root_directory": Path(self.root_directory).as_posix(),
+                    "extension": self.extension,
+                    "import_type": self.import_type,
+                },
+            )
+
+    @classmethod
+    def from_snapshot(cls, file_path: str | Path, **kwargs) -> "DependencyModel":
+        """
+        Create a model from a snapshot instead of scanning; keyword arguments are the usual fields (root_directory
+        and extension default to the snapshot's). The graph is built when autobuild is set; poll_changes() and
+        watch() pick up files changed since the snapshot was written.
+        Nothing is decoded up front: a file's imports, statements and dependencies are read from the memory-mapped
+        snapshot when first used, library and name queries use its stored inverted index and the reachability
+        index is built from its dependency arrays.
+        """
+        snapshot = Snapshot(file_path)
+        kwargs.setdefault("root_directory", snapshot.metadata.get("root_directory"))
+        kwargs.setdefault("extension", snapshot.metadata.get("extension", ".py"))
+        autobuild: bool = kwargs.pop("autobuild", False)
+
+        model: "DependencyModel" = cls(autoscan=False, **kwargs)
+        paths: List[str] = snapshot.paths()
+        model.load_results(
+            ImportStore.deferred(paths, snapshot.record),
+            SnapshotMapping(paths, snapshot.statements_of),
+            snapshot.file_states(),
+            SnapshotMapping(paths, snapshot.dependencies_of) if len(snapshot.sections["dependencies"]) else None,
+            snapshot=snapshot,
+        )
+        model.autobuild = autobuild
+        if autobuild:
+            model.build_graph()
+        return model
+
+    def load_results(
+            self,
+            imports: dict,
+            import_statements: dict,
+            file_states: Optional[Dict[str, Optional[Tuple[int, int]]]] = None,
+            file_dependencies: Optional[dict] = None,
+            snapshot: Optional[Snapshot] = None
+        ) -> None:
+        """
+        Replace the scan results with ones produced elsewhere (a snapshot, merged shards) and rebuild the index;
+        results read from 'snapshot' are indexed by the arrays stored in it instead.
+        """
+        with self._lock:
+            self.imports = imports
+            self.import_statements = import_statements
+            self.file_dependencies = file_dependencies or {}
+            self._file_states = dict(file_states or {})
+            self.module_resolver = None
+            self._reachability = None
+            self._dependency_snapshot = snapshot if self.file_dependencies else None
+            if snapshot is not None:
+                self.import_index.attach(snapshot, self.imports)
+            else:
+                self.refresh_index()
+
+    def file_states(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """(mtime in ns, size) of every scanned file when it was last read; None for files that could not be read."""
+        return dict(self._file_states)
+
     def get_all_paths(self, sorted_keys: Optional[bool] = False) -> list:
         return sorted(self.imports.keys()) if sorted_keys else list(self.imports.keys())
 
     def find_imports_by_path(self, path: str = None) -> dict:
         return self.__filter_by_path(path) if path else {}
 
-    def find_by_library(self, library: Optional[str] = None, file_only: Optional[bool] = False) -> Generator:
+    def refresh_index(self) -> None:
+        """Rebuild the inverted library/module index; queries also rebuild it once self.imports was written to."""
+        self.import_index.build(self.imports)
+
+    def find_by_library(
+            self,
+            library: Optional[str] = None,
+            file_only: Optional[bool] = False,
+            match: Optional[str] = "exact"
+        ) -> Generator:
+        """
+        Files importing a library (an import root). match="prefix" matches every library starting with the query,
+        match="submodule" matches the library itself and everything below it, e.g. 'models' -> 'models.graph_model'.
+        """
         if library:
             library = library.strip()
-            for key, value in self.imports.items():
-                for k in value["standard"].keys():
-                    if k == library:
-                        yield {"file": key, "import": library, "type": "standard"}
-                for k in value["custom"].keys():
-                    if k == library:
-                        yield {"file": key, "import": library, "type": "custom"}
-
-    def find_by_module(self, module: Optional[str] = None, file_only: Optional[bool] = False) -> Generator:
+            found = self.__get_import_index().find_libraries(library, match=match)
+            if file_only:
+                yield from dict.fromkeys(path for _, path, _ in found)
+            else:
+                for name, path, import_type in found:
+                    yield {"file": path, "import": name, "type": import_type}
+
+    def find_by_module(
+            self,
+            module: Optional[str] = None,
+            file_only: Optional[bool] = False,
+            match: Optional[str] = "exact"
+        ) -> Generator:
+        """Files importing a name (e.g. 'Path' from 'from pathlib import Path'), with the same match modes as find_by_library()."""
         if module:
             module = module.strip()
-            for key, value in self.imports.items():
-                yield from self.__iterate_by_values(items=value["standard"], file=key, module=module, module_type="standard")
-                yield from self.__iterate_by_values(items=value["custom"], file=key, module=module, module_type="custom")
+            found = self.__get_import_index().find_modules(module, match=match)
+            if file_only:
+                yield from dict.fromkeys(path for _, path, _ in found)
+            else:
+                for name, path, import_type in found:
+                    yield {"file": path, "module": name, "type": import_type}
 
     def build_graph(
             self, 
@@ -153,14 +673,231 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
         if import_type not in ["standard", "custom", "all"]:
             import_type = "all"
 
-        if import_type == "all":
-            collected_imports = list(self.__parse_imports_for_graph("custom", remove_from_root_path))
-            collected_imports.extend(list(self.__parse_imports_for_graph("standard", remove_from_root_path)))
-        else:
-            collected_imports = list(self.__parse_imports_for_graph(import_type, remove_from_root_path))
+        with self.stats.stage("build_graph"):
+            if import_type == "all":
+                collected_imports = list(self.__parse_imports_for_graph("custom", remove_from_root_path))
+                collected_imports.extend(list(self.__parse_imports_for_graph("standard", remove_from_root_path)))
+            else:
+                collected_imports = list(self.__parse_imports_for_graph(import_type, remove_from_root_path))
+
+            self._graph_parameters = (import_type, remove_from_root_path)
+            self.stats.edges_emitted = len(collected_imports)
+            if collected_imports:
+                self.graph_instance = self.graph_class(data=collected_imports, top_n_imports=self.top_n_imports)
+        self.stats.record_memory()
+
+    async def ascan(self, concurrency: Optional[int] = None, executor: Optional[Executor] = None) -> "DependencyModel":
+        """
+        Scan root_directory without blocking the event loop and return the model; meant for models created with
+        autoscan=False inside async services. Reading, parsing and classifying run in 'executor' (default: the
+        loop's default executor) with at most 'concurrency' files in flight. Concurrent calls on the same model share
+        one scan. Cancelling the call cancels the scan (once no other caller waits for it) and keeps the old results.
+        """
+        return await self._async_scans.run(
+            "scan", partial(self.__ascan, max(concurrency or _ASYNC_CONCURRENCY, 1), executor)
+        )
+
+    @classmethod
+    async def ascan_root(
+            cls,
+            root_directory: str | Path,
+            concurrency: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            **kwargs
+        ) -> "DependencyModel":
+        """
+        Create and asynchronously scan a model for 'root_directory'. Concurrent calls for the same root, extension
+        and exclusion filters share one in-flight scan and receive the same model.
+        """
+        key: tuple = (
+            cls,
+            Path(root_directory).resolve().as_posix(),
+            kwargs.get("extension", ".py"),
+            kwargs.get("exclude_start_characters"),
+            kwargs.get("exclude_end_characters"),
+        )
+
+        async def scan() -> "DependencyModel":
+            model: "DependencyModel" = cls(autoscan=False, root_directory=root_directory, **kwargs)
+            return await model.ascan(concurrency=concurrency, executor=executor)
 
+        return await _SHARED_SCANS.run(key, scan)
+
+    async def abuild_graph(self, remove_from_root_path: Optional[str] = None, import_type: Optional[str] = None) -> None:
+        """build_graph() in a worker thread."""
+        await asyncio.to_thread(self.build_graph, remove_from_root_path, import_type)
+
+    def resolve_file_dependencies(self) -> dict:
+        """
+        Map every scanned file to the project files it imports, resolving absolute and relative imports (including
+        '..' levels) against root_directory. Imports of anything outside the project are left out.
+        """
+        with self.stats.stage("resolve_file_dependencies"):
+            resolver: ModuleResolverModel = self.__get_module_resolver()
+            self._reachability = None
+            self._dependency_snapshot = None
+            self.file_dependencies = {
+                path: resolver.resolve_file(path, self.import_statements.get(path, [])) for path in self.imports
+            }
+        return self.file_dependencies
+
+    def build_file_graph(self, remove_from_root_path: Optional[str] = None) -> None:
+        """File-to-file dependency graph: every edge goes from an importing file to an imported project file."""
+        if not remove_from_root_path:
+            remove_from_root_path = self.remove_from_root_path
+        if not self.file_dependencies:
+            self.resolve_file_dependencies()
+
+        collected_imports: List[dict] = [
+            {
+                "file": self.__modify_root_path(path, remove_from_root_path),
+                "import": [self.__modify_root_path(target, remove_from_root_path) for target in targets],
+            }
+            for path, targets in self.file_dependencies.items() if targets
+        ]
         if collected_imports:
-            self.graph_instance = self.graph_class(data=collected_imports, top_n_imports=self.top_n_imports)
+            self.file_graph_instance = self.graph_class(data=collected_imports, top_n_imports=self.top_n_imports)
+
+    def find_import_cycles(self) -> List[dict]:
+        """
+        Import cycles between project files, largest first, each with its smallest cycle. Runs in linear time on the
+        resolved file dependencies, which are computed first when needed.
+        """
+        if not self.file_dependencies:
+            self.resolve_file_dependencies()
+        return find_cycles((path, target) for path, targets in self.file_dependencies.items() for target in targets)
+
+    def transitive_dependencies(self, path: str) -> List[str]:
+        """
+        Every project file 'path' depends on, directly or through other files. Reachability is computed lazily as
+        bitsets and memoised per file until the file dependencies change, so repeated queries are lookups.
+        """
+        return list(self.__get_reachability().descendants(self.__path_to_posix(path)))
+
+    def transitive_dependents(self, path: str) -> List[str]:
+        """Every project file that depends on 'path', directly or through other files."""
+        return list(self.__get_reachability().ancestors(self.__path_to_posix(path)))
+
+    def depends_on(self, path: str, dependency: str) -> bool:
+        return self.__get_reachability().reaches(self.__path_to_posix(path), self.__path_to_posix(dependency))
+
+    def impacted_files(
+            self,
+            changed_paths: Iterable[str],
+            include_changed: Optional[bool] = True,
+            relative_to: Optional[str | Path] = None
+        ) -> List[str]:
+        """
+        Every scanned file that imports one of 'changed_paths', directly or transitively, e.g. to select the tests
+        affected by a change. Changed paths may be absolute or relative to 'relative_to' (default: root_directory),
+        as printed by 'git diff --name-only' when run from there; paths that were not scanned are ignored.
+        """
+        changed: List[str] = self.__locate_paths(changed_paths, relative_to)
+        impacted: set = set(self.__get_reachability().ancestors_of(changed))
+        if include_changed:
+            impacted.update(changed)
+        return sorted(impacted)
+
+    def subscribe(self, callback: Callable[[ChangeEventModel], None]) -> None:
+        """Register a callback that receives a ChangeEventModel after every incremental update."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEventModel], None]) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def refresh_paths(self, paths: Iterable[str], removed_paths: Optional[Iterable[str]] = None) -> ChangeEventModel:
+        """
+        Re-extract only the given files and patch self.imports, the import index and graph_instance in place.
+        Paths must be spelled like the keys of self.imports; a path that no longer exists is treated as removed.
+        """
+        with self._lock:
+            paths = list(dict.fromkeys(paths))
+            existing: List[str] = [path for path in paths if _file_state(path) is not None]
+            removed: List[str] = [path for path in paths if path not in existing] + list(removed_paths or [])
+            removed = [path for path in dict.fromkeys(removed) if path in self.imports]
+
+            event = ChangeEventModel(
+                added_files=[path for path in existing if path not in self.imports],
+                modified_files=[path for path in existing if path in self.imports],
+                removed_files=removed,
+            )
+            old_edges: set = set().union(*(self.__graph_edges_of(path) for path in existing + removed))
+
+            indexed: bool = self.import_index.is_built_from(self.imports)
+            for path, libraries, state in self.__process_files(existing):
+                self.imports[path] = libraries
+                self.import_index.update(path, libraries)
+                self._file_states[path] = state
+            for path in removed:
+                del self.imports[path]
+                self.import_statements.pop(path, None)
+                self.import_index.update(path, None)
+                self._file_states.pop(path, None)
+            if indexed:
+                self.import_index.mark_built_from(self.imports)
+            self.__refresh_file_dependencies(existing, files_changed=bool(event.added_files or event.removed_files))
+            if self.scan_cache:
+                self.scan_cache.prune(self.imports)
+                self.scan_cache.save()
+
+            new_edges: set = set().union(*(self.__graph_edges_of(path) for path in existing))
+            event.added_edges = sorted(new_edges - old_edges)
+            event.removed_edges = sorted(old_edges - new_edges)
+
+            if self.graph_instance and (event.added_edges or event.removed_edges):
+                try:
+                    self.graph_instance.update_edges(added=event.added_edges, removed=event.removed_edges)
+                except NotImplementedError:
+                    import_type, remove_from_root_path = self._graph_parameters
+                    self.build_graph(remove_from_root_path=remove_from_root_path, import_type=import_type)
+
+        if not event.is_empty():
+            self.__publish(event)
+        return event
+
+    def find_changes(self) -> Tuple[List[str], List[str]]:
+        """
+        (changed or added paths, removed paths) since the last scan, from walking the tree and comparing mtimes/sizes.
+        The lock is only held to copy the known states, so queries are not blocked while the tree is walked.
+        """
+        with self._lock:
+            states: Dict[str, Optional[Tuple[int, int]]] = dict(self._file_states)
+            known: List[str] = list(self.imports)
+        collected_paths: List[str] = self.__collect_paths()
+        changed: List[str] = [path for path in collected_paths if states.get(path) != _file_state(path)]
+        collected: set = set(collected_paths)
+        return changed, [path for path in known if path not in collected]
+
+    def poll_changes(self) -> ChangeEventModel:
+        """One watch cycle: walk the tree, compare mtimes/sizes with the last scan and refresh what changed."""
+        changed, removed = self.find_changes()
+        return self.refresh_paths(changed, removed_paths=removed)
+
+    def watch(
+            self,
+            interval: Optional[float] = 1.0,
+            stop_event: Optional[Event] = None,
+            max_cycles: Optional[int] = None
+        ) -> None:
+        """Poll the root directory every 'interval' seconds until stop_event is set or max_cycles polls were made."""
+        stop_event = stop_event or self._stop_watching
+        cycles: int = 0
+        while not stop_event.is_set() and (max_cycles is None or cycles < max_cycles):
+            self.poll_changes()
+            cycles += 1
+            stop_event.wait(interval)
+
+    def start_watching(self, interval: Optional[float] = 1.0) -> Thread:
+        """Run watch() in a daemon thread; stop it with stop_watching()."""
+        self._stop_watching.clear()
+        thread = Thread(target=self.watch, kwargs={"interval": interval}, daemon=True)
+        thread.start()
+        return thread
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
 
     def display_graph_matrix(
             self,
@@ -170,7 +907,9 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
             ylabel_tag: Optional[str] = "Paths",
             rotation: Optional[int] = 90,
             fontsize: Optional[int] = 8,
-            cbar: Optional[bool] = True
+            cbar: Optional[bool] = True,
+            render_mode: Optional[str] = "auto",
+            time_budget: Optional[float] = 5.0
     ) -> None:
         if not self.graph_instance:
             raise RuntimeError("You need to provide run build_graph() to create the graph first before displaying it.")
@@ -182,7 +921,9 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
             ylabel_tag=ylabel_tag,
             rotation=rotation,
             fontsize=fontsize,
-            cbar=cbar
+            cbar=cbar,
+            render_mode=render_mode,
+            time_budget=time_budget
         )
 
     def save_graph_matrix(            
@@ -196,6 +937,8 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
         rotation: Optional[int] = 90,
         fontsize: Optional[int] = 8,
         cbar: Optional[bool] = False,
+        render_mode: Optional[str] = "auto",
+        time_budget: Optional[float] = 5.0,
     ):
         if not self.graph_instance:
             raise RuntimeError("You need to provide run build_graph() to create the graph first before saving it.")
@@ -209,5 +952,7 @@ class DependencyModel(BaseModel, AbstractDependencyModel):
             rotation=rotation,
             fontsize=fontsize,
             cbar=cbar,
-            local_save_path=local_save_path
+            local_save_path=local_save_path,
+            render_mode=render_mode,
+            time_budget=time_budget
         )
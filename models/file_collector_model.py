@@ -1,12 +1,30 @@
-from os import walk
 from pathlib import Path
-from typing import Optional, List
+from os import scandir, stat
+from os.path import exists
 from pydantic import BaseModel, Field
+from typing import Iterator, Optional, List, Tuple
+from utilities.ignore_patterns import IgnoreRule, is_ignored, parse_ignore_patterns, read_ignore_file
+from utilities.sharding import shard_of
 from .abstract_models.abstract_file_collector_model import AbstractFileCollectorModel
 
 
+DEFAULT_EXCLUDED_DIRECTORIES: List[str] = [
+    ".git", ".hg", ".svn", "__pycache__", "node_modules", ".venv", "venv", ".tox", ".nox",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", ".eggs", ".idea", ".vscode",
+]
+
+
 class FileCollectorModel(BaseModel, AbstractFileCollectorModel):
     files: List[str] = Field(default_factory=list)
+    exclude_directories: List[str] = Field(default_factory=lambda: list(DEFAULT_EXCLUDED_DIRECTORIES))
+    ignore_patterns: List[str] = Field(default_factory=list)
+    use_gitignore: bool = Field(default=True)
+    follow_symlinks: bool = Field(default=False)
+    # with a shard_index, only files of that shard are collected (see utilities.sharding)
+    shard_index: Optional[int] = Field(default=None)
+    shard_count: int = Field(default=1)
+    shard_strategy: str = Field(default="hash")
+    shard_depth: int = Field(default=1)
 
     def __keep_file_by_extension(self, file: str, extension: str) -> bool:
         
@@ -27,7 +45,9 @@ class FileCollectorModel(BaseModel, AbstractFileCollectorModel):
             starts_with: Optional[str] = None, 
             ends_with: Optional[str] = None
         ) -> bool:
-        
+        if not starts_with and not ends_with:
+            return True
+
         file = Path(path).name
         if starts_with and file.startswith(starts_with):
             return False
@@ -42,6 +62,90 @@ class FileCollectorModel(BaseModel, AbstractFileCollectorModel):
                self.__remove_file_by_characters(file, starts_with, ends_with)
         ]
 
+    def __in_shard(self, relative_path: str) -> bool:
+        return self.shard_index is None or shard_of(relative_path, self.shard_count, self.shard_strategy, self.shard_depth) == self.shard_index
+
+    def __keep_directory(self, entry, relative_path: str, rule_sets: List[Tuple[str, List[IgnoreRule]]]) -> bool:
+        if entry.name in self.exclude_directories:
+            return False
+        if exists(f"{entry.path}/pyvenv.cfg"):
+            return False
+        if self.shard_strategy == "subtree" and relative_path.count("/") + 1 == self.shard_depth and not self.__in_shard(relative_path):
+            # the whole subtree belongs to another shard
+            return False
+        return not is_ignored(rule_sets, relative_path, True)
+
+    def __keep_file(self, relative_path: str, rule_sets: List[Tuple[str, List[IgnoreRule]]]) -> bool:
+        """Shard and ignore rules; names were already filtered by __filter_files()."""
+        if not self.__in_shard(relative_path):
+            return False
+        return not is_ignored(rule_sets, relative_path, False)
+
+    def __walk(
+            self,
+            root_path: str | Path,
+            extension: Optional[str] = None,
+            starts_with: Optional[str] = None,
+            ends_with: Optional[str] = None
+        ) -> Iterator[str]:
+        """
+        Depth-first os.scandir walk yielding file paths as soon as they are found. Excluded, virtualenv and
+        ignored directories are pruned before being entered; with follow_symlinks, directories already visited
+        (by device and inode) are skipped, which breaks symlink loops.
+        """
+        root: str = str(Path(root_path)).replace("\\", "/")
+        base_rules: List[IgnoreRule] = parse_ignore_patterns(self.ignore_patterns)
+        stack: List[Tuple[str, str, List[Tuple[str, List[IgnoreRule]]]]] = [(root, "", [("", base_rules)] if base_rules else [])]
+        visited: set = set()
+
+        while stack:
+            directory, relative, rule_sets = stack.pop()
+            try:
+                status = stat(directory)
+                if (status.st_dev, status.st_ino) in visited:
+                    continue
+                visited.add((status.st_dev, status.st_ino))
+                with scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            if self.use_gitignore and any(entry.name == ".gitignore" for entry in entries):
+                rule_sets = rule_sets + [(relative, read_ignore_file(f"{directory}/.gitignore"))]
+
+            subdirectories: list = []
+            files: List[str] = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=self.follow_symlinks):
+                        relative_path: str = f"{relative}/{entry.name}" if relative else entry.name
+                        if self.__keep_directory(entry, relative_path, rule_sets):
+                            path: str = entry.name if directory == "." else f"{directory}/{entry.name}"
+                            subdirectories.append((path, relative_path, rule_sets))
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+
+            for name in self.__filter_files(files, extension, starts_with, ends_with):
+                relative_path = f"{relative}/{name}" if relative else name
+                if self.__keep_file(relative_path, rule_sets):
+                    yield name if directory == "." else f"{directory}/{name}"
+            stack.extend(reversed(subdirectories))
+
+    def iter_files(
+            self,
+            root_path: str | Path,
+            extension: Optional[str] = None,
+            exclude_start_characters: Optional[str] = None,
+            exclude_end_characters: Optional[str] = None
+        ) -> Iterator[str]:
+        if type(self).collect_files is not FileCollectorModel.collect_files:
+            # a subclass customised collect_files(); respect it instead of walking on our own
+            yield from super().iter_files(root_path, extension, exclude_start_characters, exclude_end_characters)
+            return
+        yield from self.__walk(root_path, extension, exclude_start_characters, exclude_end_characters)
+
     def collect_files(
             self,
             root_path: str | Path,
@@ -51,20 +155,14 @@ class FileCollectorModel(BaseModel, AbstractFileCollectorModel):
             return_files: Optional[bool] = False
         ) -> List[str]:
 
-        collected_files = [
-            str(Path(root) / file).replace("\\", "/")
-            for root, _, files in walk(root_path)
-            for file in files
-        ]
-
-        collected_files = self.__filter_files(
-            collected_files, 
-            extension, 
-            exclude_start_characters, 
+        collected_files: List[str] = list(self.__walk(
+            root_path,
+            extension,
+            exclude_start_characters,
             exclude_end_characters
-        )
+        ))
 
         if return_files:
-            return list(set(collected_files))
-        self.files = list(set(collected_files))
+            return collected_files
+        self.files = collected_files
         return self.files
@@ -1,7 +1,7 @@
 from typing import List
 from pathlib import Path
 from pydantic import BaseModel, Field
-from ast import parse, Import, ImportFrom
+from utilities.extraction import ImportStatement, read_import_statements
 from .abstract_models.abstract_file_reader_model import AbstractFileReaderModel
 
 
@@ -9,30 +9,23 @@ class FileReaderModel(BaseModel, AbstractFileReaderModel):
     line_separator: str = Field(default="\n")
     file_path: str | Path = Field(min_length=1)
     file_imports: List[str] = Field(default_factory=list)
+    import_records: List[ImportStatement] = Field(default_factory=list)
     import_tags: List[str] = Field(default_factory=lambda: ["import", "from"])
+    bytes_read: int = Field(default=0)
+    parse_failed: bool = Field(default=False)
+    digest: str = Field(default="")
 
-    def __is_import_statement(self, line: str) -> bool:
-        try:
-            tree = parse(line)
-            return isinstance(tree.body[0], Import) or isinstance(tree.body[0], ImportFrom)
-        except (SyntaxError, IndexError):
-            return False
+    def __extract_imports(self) -> List[ImportStatement]:
+        records, self.bytes_read, parsed, self.digest = read_import_statements(self.file_path)
+        self.parse_failed = not parsed
+        return records
 
-    def __extract_content(self) -> str:
-        try:
-            with open(self.file_path, 'rb') as file:
-                content = file.read().decode('utf-8')
-                return content
-        except FileNotFoundError:
-            return ""
-
-    def __extract_imports(self) -> List[str]:
-        lines = self.__extract_content().split(self.line_separator)
-        return [
-            line.split(" as ")[0].strip() if "as" in line else line.strip()
-            for line in lines if self.__is_import_statement(line.strip())
-        ]
+    def get_import_records(self) -> List[ImportStatement]:
+        """Every import statement of the file together with the line number it starts on."""
+        self.import_records = self.__extract_imports()
+        self.file_imports = [record.statement for record in self.import_records]
+        return self.import_records
 
     def get_imports(self) -> List[str | None]:
-        self.file_imports = self.__extract_imports()
+        self.get_import_records()
         return self.file_imports
@@ -1,34 +1,63 @@
 from os import path
+from math import ceil
+from bisect import bisect_left, insort
 from pathlib import Path
-from seaborn import heatmap
-from pandas import DataFrame
-from networkx import DiGraph
-from numpy import ndarray, zeros
-from typing import List, Tuple, Optional
-from pydantic import BaseModel, ConfigDict, Field
+from numpy import ndarray, array, zeros, full, ones, unique, lexsort, bincount, concatenate, cumsum, repeat, arange, diff, delete, insert, nonzero, searchsorted, int32, int64
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from utilities.graph_core import GraphCore
+from utilities.graph_analysis import find_cycles, strongly_connected_components
 from .abstract_models.abstract_graph_model import AbstractGraphModel
-from matplotlib.pyplot import savefig, figure, title, xlabel, ylabel, xticks, yticks, tight_layout, show
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from networkx import DiGraph
+
+
+_RENDER_MODES: List[str] = ["auto", "heatmap", "raster"]
+# Rough per-item costs of a seaborn heatmap, used by the 'auto' render mode to stay within the time budget.
+_CELL_SECONDS: float = 2e-6
+_ANNOTATION_SECONDS: float = 1e-3
+_TICK_LABEL_SECONDS: float = 2e-3
+_RASTER_DPI: int = 100
 
 
 class GraphModel(BaseModel, AbstractGraphModel):
-    data: List[dict]
-    graph: Optional[DiGraph] = DiGraph()
+    """
+    Dependency graph of files and the modules they import. Edges are held once, in a GraphCore (interned names,
+    int32 edge arrays with CSR/CSC offsets) owned by this instance; 'graph' is a networkx export made on demand.
+    Edges are passed as 'data' records ({"file": ..., "import": name or [names]}) or as (source, target) pairs
+    through from_edges(); either way they are read once while building and neither validated nor kept.
+    """
     top_n_imports: Optional[int] = Field(default=0)
     is_built: Optional[bool] = Field(default=False)
-    nodes: Optional[List[str]] = Field(default_factory=list)
     paths: Optional[List[str]] = Field(default_factory=list)
+    dense_matrix: Optional[bool] = Field(default=True)
     adjacency_matrix: Optional[ndarray] = Field(default=None)
+    adjacency_indptr: Optional[ndarray] = Field(default=None)
+    adjacency_indices: Optional[ndarray] = Field(default=None)
     imports: Optional[List[str]] = Field(default_factory=list)
-    edges: Optional[List[Tuple[str, str]]] = Field(default_factory=list)
     model_config: Optional[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+    _core: GraphCore = PrivateAttr(default_factory=GraphCore)
+    _networkx: Optional["DiGraph"] = PrivateAttr(default=None)
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+            self,
+            *args,
+            data: Optional[Iterable[dict]] = None,
+            edges: Optional[Iterable[Tuple[str, str]]] = None,
+            **kwargs
+        ) -> None:
         super().__init__(*args, **kwargs)
         
         if not isinstance(self.top_n_imports, int):
             self.top_n_imports = 0
             
-        self.__build()
+        self.__build(edges if edges is not None else self.__iter_data_edges(data or []))
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]], **kwargs) -> "GraphModel":
+        return cls(edges=edges, **kwargs)
 
     # -------------------
     # protected methods
@@ -46,50 +75,262 @@ class GraphModel(BaseModel, AbstractGraphModel):
         return file_name.replace(" ", "_")
 
     def __get_nodes(self) -> List[str]:
-        return list(self.graph.nodes)
+        return list(self._core.names)
 
     def __get_edges(self) -> List[Tuple[str, str]]:
-        return list(self.graph.edges)
+        return self._core.edge_list()
+
+    def __to_edge_list(self) -> "DataFrame":
+        from pandas import DataFrame
 
-    def __to_edge_list(self) -> DataFrame:
         if self.is_built:
             return DataFrame(self.edges, columns=["source", "target"])
         return DataFrame(columns=["source", "target"])
 
     def __get_paths_and_imports(self) -> Tuple[List[str], List[str]]:
-        paths = sorted(set(edge[0] for edge in self.edges))
-        imports = sorted(set(edge[1] for edge in self.edges))
+        names: List[str] = self._core.names
+        paths = sorted(names[node] for node in unique(self._core.sources).tolist())
+        imports = sorted(names[node] for node in unique(self._core.targets).tolist())
         return paths, imports
 
-    def __to_custom_adjacency_matrix(self) -> ndarray:
-        paths, imports = self.__get_paths_and_imports()
-        
+    def __rank(self, node_ids: ndarray) -> Tuple[ndarray, List[str]]:
+        """Sorted names of the distinct nodes in 'node_ids', and the position in that order of every entry."""
+        names: List[str] = self._core.names
+        distinct: List[int] = sorted(unique(node_ids).tolist(), key=names.__getitem__)
+        positions: ndarray = full(len(names), -1, dtype=int64)
+        positions[distinct] = arange(len(distinct))
+        return positions[node_ids], [names[node] for node in distinct]
+
+    def __to_sparse_adjacency(self) -> Tuple[ndarray, ndarray, List[str], List[str]]:
+        """
+        CSR form of the paths x imports matrix, built from the core's integer edge arrays: node ids are ranked by
+        name once, so no string comparison per edge, no dense matrix and no per-cell lookup is needed.
+        """
+        if not self._core.number_of_edges():
+            return zeros(1, dtype=int64), zeros(0, dtype=int32), [], []
+
+        rows, paths = self.__rank(self._core.sources)
+        columns, imports = self.__rank(self._core.targets)
+
         if self.top_n_imports > 0:
-            paths = paths[:self.top_n_imports]
-            imports = imports[:self.top_n_imports]
-            
-        matrix = zeros((len(paths), len(imports)))
-        for i, p in enumerate(paths):
-            for j, imp in enumerate(imports):
-                if self.graph.has_edge(p, imp):
-                    matrix[i, j] = 1
-        return matrix, paths, imports
+            paths, imports = paths[:self.top_n_imports], imports[:self.top_n_imports]
+            keep = (rows < len(paths)) & (columns < len(imports))
+            rows, columns = rows[keep], columns[keep]
+
+        order = lexsort((columns, rows))
+        rows, columns = rows[order], columns[order]
+        indptr: ndarray = concatenate(([0], cumsum(bincount(rows, minlength=len(paths))))).astype(int64)
+        return indptr, columns.astype(int32), paths, imports
+
+    def __to_dense_matrix(self, indptr: ndarray, indices: ndarray, rows: int, columns: int) -> ndarray:
+        matrix: ndarray = zeros((rows, columns))
+        matrix[repeat(arange(rows), diff(indptr)), indices] = 1
+        return matrix
+
+    def __to_custom_adjacency_matrix(self) -> Tuple[ndarray, List[str], List[str]]:
+        indptr, indices, paths, imports = self.__to_sparse_adjacency()
+        return self.__to_dense_matrix(indptr, indices, len(paths), len(imports)), paths, imports
     
-    def __build(self) -> DiGraph:
-        for dep in self.data:
+    def __get_matrix(self) -> ndarray:
+        return self.get_adjacency_matrix() if self.dense_matrix else self.to_dense_matrix()
+
+    @staticmethod
+    def __iter_data_edges(data: Iterable[dict]) -> Iterator[Tuple[str, str]]:
+        for dep in data:
             file = dep['file']
             imported_module = dep['import']
             if isinstance(imported_module, list):
                 for module in imported_module:
-                    self.graph.add_edge(file, module)
+                    yield file, module
             else:
-                self.graph.add_edge(file, imported_module)
+                yield file, imported_module
 
-        self.nodes = self.__get_nodes()
-        self.edges = self.__get_edges()
-        self.adjacency_matrix, self.paths, self.imports = self.__to_custom_adjacency_matrix()
+    def __build(self, edges: Iterable[Tuple[str, str]]) -> GraphCore:
+        self._core = GraphCore(edges)
+        self.__refresh()
         self.is_built = True
-        return self.graph
+        return self._core
+
+    def __refresh(self) -> None:
+        self._networkx = None
+        self.adjacency_indptr, self.adjacency_indices, self.paths, self.imports = self.__to_sparse_adjacency()
+        if self.dense_matrix:
+            self.adjacency_matrix = self.to_dense_matrix()
+
+    @staticmethod
+    def __remap(names: List[str], dropped: List[str], inserted: List[str]) -> Tuple[List[str], ndarray]:
+        """Sorted names without 'dropped' and with 'inserted', and the new position of every old one (-1: dropped)."""
+        keep: ndarray = ones(len(names), dtype=bool)
+        keep[[bisect_left(names, name) for name in dropped]] = False
+        remapped: List[str] = [name for name, kept in zip(names, keep.tolist()) if kept] if dropped else list(names)
+        for name in inserted:
+            insort(remapped, name)
+        is_new: ndarray = zeros(len(remapped), dtype=bool)
+        is_new[[bisect_left(remapped, name) for name in inserted]] = True
+        positions: ndarray = full(len(names), -1, dtype=int64)
+        positions[keep] = nonzero(~is_new)[0]
+        return remapped, positions
+
+    @staticmethod
+    def __is_listed(names: List[str], name: str) -> bool:
+        position: int = bisect_left(names, name)
+        return position < len(names) and names[position] == name
+
+    def __has_edges(self, name: str, offsets: ndarray) -> bool:
+        node: Optional[int] = self._core.ids.get(name)
+        return node is not None and bool(offsets[node + 1] > offsets[node])
+
+    @staticmethod
+    def __row_offsets(rows: List[int], count: int) -> ndarray:
+        return concatenate(([0], cumsum(bincount(array(rows, dtype=int64), minlength=count)))).astype(int64)
+
+    def __patch_adjacency(self, added: List[Tuple[str, str]], removed: List[Tuple[str, str]]) -> None:
+        """
+        Apply the edges the core added and removed to the CSR arrays, in place of ranking every node again:
+        entries are deleted from and inserted into their rows (kept sorted by column), and only when paths or
+        imports appear or disappear are rows and columns renumbered, with one vectorised pass over the arrays.
+        """
+        indptr, indices, paths, imports = self.adjacency_indptr, self.adjacency_indices, self.paths, self.imports
+
+        if removed:
+            rows: List[int] = [bisect_left(paths, path) for path, _ in removed]
+            positions: List[int] = [
+                int(indptr[row] + searchsorted(indices[indptr[row]:indptr[row + 1]], bisect_left(imports, imported)))
+                for row, (_, imported) in zip(rows, removed)
+            ]
+            indices = delete(indices, positions)
+            indptr = indptr - self.__row_offsets(rows, len(paths))
+
+        dropped_paths: List[str] = sorted({path for path, _ in removed if not self.__has_edges(path, self._core.out_indptr)})
+        dropped_imports: List[str] = sorted({name for _, name in removed if not self.__has_edges(name, self._core.in_indptr)})
+        new_paths: List[str] = sorted({path for path, _ in added if not self.__is_listed(paths, path)})
+        new_imports: List[str] = sorted({name for _, name in added if not self.__is_listed(imports, name)})
+
+        if dropped_imports or new_imports:
+            imports, columns = self.__remap(imports, dropped_imports, new_imports)
+            indices = columns[indices]
+        if dropped_paths or new_paths:
+            paths, moved = self.__remap(paths, dropped_paths, new_paths)
+            kept: ndarray = moved >= 0
+            counts: ndarray = zeros(len(paths), dtype=int64)
+            counts[moved[kept]] = diff(indptr)[kept]
+            indptr = concatenate(([0], cumsum(counts))).astype(int64)
+
+        if added:
+            entries: List[Tuple[int, int]] = sorted((bisect_left(paths, path), bisect_left(imports, name)) for path, name in added)
+            positions = [int(indptr[row] + searchsorted(indices[indptr[row]:indptr[row + 1]], column)) for row, column in entries]
+            indices = insert(indices, positions, [column for _, column in entries])
+            indptr = indptr + self.__row_offsets([row for row, _ in entries], len(paths))
+
+        self.adjacency_indptr, self.adjacency_indices = indptr.astype(int64), indices.astype(int32)
+        self.paths, self.imports = paths, imports
+
+    # -------------------
+    # rendering
+    # -------------------
+    def __choose_render_mode(
+            self,
+            render_mode: str,
+            annot_threshold: int,
+            max_tick_labels: int,
+            time_budget: float
+        ) -> Tuple[str, bool]:
+        """
+        Pick 'heatmap' (optionally annotated) or 'raster' for the matrix size. In 'auto' mode the estimated
+        seaborn cost (cells, annotations and tick labels) must fit the time budget, otherwise it falls back
+        to raster drawing. Annotations are only ever drawn up to annot_threshold cells.
+        """
+        rows, columns = len(self.paths), len(self.imports)
+        cells: int = rows * columns
+        annotate: bool = cells <= (annot_threshold or 0)
+
+        if render_mode not in _RENDER_MODES:
+            render_mode = "auto"
+        if render_mode != "auto":
+            return render_mode, annotate and render_mode == "heatmap"
+
+        labels: int = min(rows, max_tick_labels) + min(columns, max_tick_labels)
+        heatmap_cost: float = cells * _CELL_SECONDS + labels * _TICK_LABEL_SECONDS
+        if annotate and heatmap_cost + cells * _ANNOTATION_SECONDS <= time_budget:
+            return "heatmap", True
+        if heatmap_cost <= time_budget:
+            return "heatmap", False
+        return "raster", False
+
+    @staticmethod
+    def __thin_labels(labels: List[str], max_tick_labels: int) -> List[str]:
+        step: int = max(1, ceil(len(labels) / max(max_tick_labels, 1)))
+        return [label if i % step == 0 else "" for i, label in enumerate(labels)]
+
+    def __block_aggregate(self, target_rows: int, target_columns: int) -> Tuple[ndarray, int, int]:
+        """
+        Count edges per (row block, column block) so that the matrix fits the target pixel grid. Works on the
+        CSR arrays directly, so the full dense matrix is never allocated.
+        """
+        rows, columns = len(self.paths), len(self.imports)
+        row_block: int = max(1, ceil(rows / max(target_rows, 1)))
+        column_block: int = max(1, ceil(columns / max(target_columns, 1)))
+        shape: Tuple[int, int] = (ceil(rows / row_block), ceil(columns / column_block))
+
+        edge_rows: ndarray = repeat(arange(rows), diff(self.adjacency_indptr))
+        cells: ndarray = (edge_rows // row_block) * shape[1] + self.adjacency_indices // column_block
+        return bincount(cells, minlength=shape[0] * shape[1]).reshape(shape), row_block, column_block
+
+    @staticmethod
+    def __block_ticks(labels: List[str], block: int, max_tick_labels: int) -> Tuple[List[int], List[str]]:
+        blocks: int = ceil(len(labels) / block)
+        step: int = max(1, ceil(blocks / max(max_tick_labels, 1)))
+        positions: List[int] = list(range(0, blocks, step))
+        return positions, [labels[position * block] for position in positions]
+
+    def __draw(
+            self,
+            figure_size: Tuple[int, int],
+            img_title: str,
+            xlabel_tag: str,
+            ylabel_tag: str,
+            rotation: int,
+            fontsize: int,
+            cbar: bool,
+            render_mode: str,
+            annot_threshold: int,
+            max_tick_labels: int,
+            max_pixels: Optional[Tuple[int, int]],
+            time_budget: float
+        ) -> None:
+        from matplotlib import pyplot
+
+        mode, annotate = self.__choose_render_mode(render_mode, annot_threshold, max_tick_labels, time_budget)
+        pyplot.figure(figsize=figure_size)
+
+        if mode == "heatmap":
+            from seaborn import heatmap
+
+            heatmap(
+                self.__get_matrix(),
+                annot=annotate,
+                fmt="g",
+                cmap='viridis',
+                xticklabels=self.__thin_labels(self.imports, max_tick_labels),
+                yticklabels=self.__thin_labels(self.paths, max_tick_labels),
+                cbar=cbar
+            )
+            pyplot.xticks(rotation=rotation, fontsize=fontsize)
+            pyplot.yticks(fontsize=fontsize)
+        else:
+            if not max_pixels:
+                max_pixels = (int(figure_size[1] * _RASTER_DPI), int(figure_size[0] * _RASTER_DPI))
+            matrix, row_block, column_block = self.__block_aggregate(*max_pixels)
+            pyplot.imshow(matrix, aspect="auto", interpolation="nearest", cmap='viridis')
+            if cbar:
+                pyplot.colorbar()
+            pyplot.xticks(*self.__block_ticks(self.imports, column_block, max_tick_labels), rotation=rotation, fontsize=fontsize)
+            pyplot.yticks(*self.__block_ticks(self.paths, row_block, max_tick_labels), fontsize=fontsize)
+
+        pyplot.title(img_title)
+        pyplot.xlabel(xlabel_tag)
+        pyplot.ylabel(ylabel_tag)
+        pyplot.tight_layout()
 
     # ----------------
     # public methods
@@ -103,26 +344,22 @@ class GraphModel(BaseModel, AbstractGraphModel):
             rotation: Optional[int] = 90,
             fontsize: Optional[int] = 8,
             cbar: Optional[bool] = True,
+            render_mode: Optional[str] = "auto",
+            annot_threshold: Optional[int] = 400,
+            max_tick_labels: Optional[int] = 100,
+            max_pixels: Optional[Tuple[int, int]] = None,
+            time_budget: Optional[float] = 5.0,
     ) -> None:
         if not self.is_built:
             raise RuntimeError("The graph must be built using the '__build()' method before calling 'display()'.")
 
-        figure(figsize=figure_size)
-        heatmap(
-            self.adjacency_matrix, 
-            annot=True, fmt="g", 
-            cmap='viridis', 
-            xticklabels=self.imports, 
-            yticklabels=self.paths,
-            cbar=cbar
+        self.__draw(
+            figure_size, img_title, xlabel_tag, ylabel_tag, rotation, fontsize, cbar,
+            render_mode, annot_threshold, max_tick_labels, max_pixels, time_budget
         )
-        title(img_title)
-        xlabel(xlabel_tag)
-        ylabel(ylabel_tag)
-        xticks(rotation=rotation, fontsize=fontsize)
-        yticks(fontsize=fontsize)
-        tight_layout()
-        show()
+        from matplotlib import pyplot
+
+        pyplot.show()
 
     def save(            
         self,
@@ -134,29 +371,98 @@ class GraphModel(BaseModel, AbstractGraphModel):
         ylabel_tag: Optional[str] = "Paths",
         rotation: Optional[int] = 90,
         fontsize: Optional[int] = 8,
-        cbar: Optional[bool] = True
+        cbar: Optional[bool] = True,
+        render_mode: Optional[str] = "auto",
+        annot_threshold: Optional[int] = 400,
+        max_tick_labels: Optional[int] = 100,
+        max_pixels: Optional[Tuple[int, int]] = None,
+        time_budget: Optional[float] = 5.0,
     ) -> None:
         if not self.is_built:
             raise RuntimeError("The graph must be built using the '__sbuild()' method before calling 'save()'.")
 
-        figure(figsize=figure_size)
-        heatmap(
-            self.adjacency_matrix, 
-            annot=True, 
-            fmt="g", 
-            cmap='viridis', 
-            xticklabels=self.imports, 
-            yticklabels=self.paths,
-            cbar=cbar
+        self.__draw(
+            figure_size, img_title, xlabel_tag, ylabel_tag, rotation, fontsize, cbar,
+            render_mode, annot_threshold, max_tick_labels, max_pixels, time_budget
         )
-        title(img_title)
-        xlabel(xlabel_tag)
-        ylabel(ylabel_tag)
-        xticks(rotation=rotation, fontsize=fontsize)
-        yticks(fontsize=fontsize)
-        tight_layout()
         file_name: str = self.__validate_file_name(file_name)
-        savefig(self.__join_paths(local_save_path, file_name), format="png")
+        from matplotlib import pyplot
+
+        pyplot.savefig(self.__join_paths(local_save_path, file_name), format="png")
+        pyplot.close()
     
+    @property
+    def core(self) -> GraphCore:
+        return self._core
+
+    @property
+    def nodes(self) -> List[str]:
+        return self.__get_nodes()
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        return self.__get_edges()
+
+    @property
+    def graph(self) -> "DiGraph":
+        """networkx view of the graph, exported on first access and cached until the edges change."""
+        if self._networkx is None:
+            self._networkx = self.to_networkx()
+        return self._networkx
+
+    def to_networkx(self) -> "DiGraph":
+        return self._core.to_networkx()
+
+    def update_edges(self, added: List[Tuple[str, str]], removed: List[Tuple[str, str]]) -> None:
+        """
+        Add and remove edges in place; nodes left without any edge are dropped. The core and the CSR arrays are
+        patched rather than rebuilt; the dense matrix is only dropped, get_adjacency_matrix() builds it again
+        when it is read. With top_n_imports the kept rows and columns can change anywhere, so the CSR arrays
+        are rebuilt instead.
+        """
+        added, removed = self._core.update(added=added, removed=removed)
+        self._networkx = None
+        self.adjacency_matrix = None
+        if self.top_n_imports > 0:
+            self.adjacency_indptr, self.adjacency_indices, self.paths, self.imports = self.__to_sparse_adjacency()
+        elif added or removed:
+            self.__patch_adjacency(added, removed)
+
+    def get_adjacency_matrix(self) -> Optional[ndarray]:
+        """The dense paths x imports matrix, built on first use after the edges changed; None with dense_matrix off."""
+        if self.adjacency_matrix is None and self.dense_matrix:
+            self.adjacency_matrix = self.to_dense_matrix()
+        return self.adjacency_matrix
+
+    def get_adjacency_arrays(self) -> Tuple[ndarray, ndarray, List[str], List[str]]:
+        """
+        Raw CSR arrays for numeric work: row i (self.paths[i]) imports self.imports[j]
+        for every j in indices[indptr[i]:indptr[i + 1]]. Returns (indptr, indices, paths, imports).
+        """
+        if not self.is_built:
+            raise RuntimeError("The graph must be built before its adjacency arrays can be read.")
+        return self.adjacency_indptr, self.adjacency_indices, self.paths, self.imports
+
+    def to_dense_matrix(self) -> ndarray:
+        return self.__to_dense_matrix(self.adjacency_indptr, self.adjacency_indices, len(self.paths), len(self.imports))
+
     def list_edges(self) -> list:
         return self.__to_edge_list()
+
+    def iter_edges(self) -> Iterator[Tuple[str, str]]:
+        """Edges straight from the core's CSR arrays, one source at a time, without building an edge list."""
+        names: List[str] = self._core.names
+        indptr: List[int] = self._core.out_indptr.tolist()
+        targets = self._core.targets
+        for source in range(len(names)):
+            if indptr[source] != indptr[source + 1]:
+                for target in targets[indptr[source]:indptr[source + 1]].tolist():
+                    yield names[source], names[target]
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Every strongly connected component of the graph (single nodes included), in reverse topological order."""
+        return strongly_connected_components(self._core.edge_list())
+
+    def find_cycles(self) -> List[dict]:
+        """Components that contain a cycle, largest first, each with its smallest cycle: {"component", "shortest_cycle"}."""
+        return find_cycles(self._core.edge_list())
@@ -0,0 +1,194 @@
+from bisect import bisect_left
+from functools import partial
+from heapq import merge
+from itertools import groupby
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from utilities.import_store import ImportStore, iter_entries
+from utilities.snapshot import Snapshot, IMPORT_TYPES
+
+
+_MATCH_MODES: List[str] = ["exact", "prefix", "submodule"]
+_IMPORT_TYPES: Tuple[str, str] = ("standard", "custom")
+_SNAPSHOT_KINDS: Dict[str, str] = {"libraries": "library", "modules": "module"}
+
+
+def _flatten(names) -> Iterator[str]:
+    for name in names:
+        if isinstance(name, (list, tuple)):
+            yield from _flatten(name)
+        elif name:
+            yield name
+
+
+def _generation(imports) -> int:
+    """Version of 'imports' an index is built from; plain dicts only tell their size."""
+    return imports.generation() if isinstance(imports, ImportStore) else len(imports)
+
+
+def _entries(libraries) -> Iterator[Tuple[str, list]]:
+    if isinstance(libraries, dict):
+        yield from libraries.items()
+    else:
+        yield from ((library, []) for library in libraries or [])
+
+
+class ImportIndexModel(BaseModel):
+    """
+    Inverted index over DependencyModel.imports: library (root) -> files and imported name -> files.
+    Every posting is keyed on (file, import type), so a file can be removed or re-indexed in O(its imports).
+    An index attached to a snapshot answers from the snapshot's stored postings; files re-indexed or removed
+    afterwards shadow theirs and are kept in memory.
+    """
+    libraries: Dict[str, Dict[Tuple[str, str], int]] = Field(default_factory=dict)
+    modules: Dict[str, Dict[Tuple[str, str], int]] = Field(default_factory=dict)
+    files: Dict[str, List[Tuple[str, str, str]]] = Field(default_factory=dict)
+    _source_id: Optional[int] = PrivateAttr(default=None)
+    _source_generation: int = PrivateAttr(default=0)
+    _sorted_keys: Dict[str, Optional[List[str]]] = PrivateAttr(default_factory=lambda: {"libraries": None, "modules": None})
+    _snapshot: Optional[Snapshot] = PrivateAttr(default=None)
+    _shadowed: Set[str] = PrivateAttr(default_factory=set)
+
+    # -------------------
+    # protected methods
+    # -------------------
+    @staticmethod
+    def __add_posting(index: dict, key: str, posting: Tuple[str, str]) -> bool:
+        postings: Optional[dict] = index.get(key)
+        if postings is None:
+            index[key] = {posting: 1}
+            return True
+        postings[posting] = postings.get(posting, 0) + 1
+        return False
+
+    @staticmethod
+    def __remove_posting(index: dict, key: str, posting: Tuple[str, str]) -> bool:
+        postings: dict = index[key]
+        postings[posting] -= 1
+        if postings[posting] <= 0:
+            del postings[posting]
+            if not postings:
+                del index[key]
+                return True
+        return False
+
+    def __keys(self, kind: str) -> List[str]:
+        if self._sorted_keys[kind] is None:
+            self._sorted_keys[kind] = sorted(getattr(self, kind))
+        return self._sorted_keys[kind]
+
+    def __keys_with_prefix(self, kind: str, prefix: str) -> Iterator[str]:
+        keys: List[str] = self.__keys(kind)
+        for position in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[position].startswith(prefix):
+                break
+            yield keys[position]
+
+    def __has_key(self, kind: str, key: str) -> bool:
+        if key in getattr(self, kind):
+            return True
+        return self._snapshot is not None and len(self._snapshot.postings(_SNAPSHOT_KINDS[kind], key)) > 0
+
+    def __matching_keys(self, kind: str, query: str, match: str) -> Iterator[str]:
+        if match not in _MATCH_MODES:
+            match = "exact"
+
+        if match == "exact":
+            if self.__has_key(kind, query):
+                yield query
+            return
+
+        prefix: str = query if match == "prefix" else f"{query}."
+        if match == "submodule" and self.__has_key(kind, query):
+            yield query
+
+        keys: Iterator[str] = self.__keys_with_prefix(kind, prefix)
+        if self._snapshot is not None:
+            keys = (key for key, _ in groupby(merge(keys, self._snapshot.keys(_SNAPSHOT_KINDS[kind], prefix))))
+        yield from keys
+
+    def __snapshot_postings(self, kind: str, key: str) -> Iterator[Tuple[str, str]]:
+        """(file, import type) of every stored posting of 'key' whose file was not re-indexed or removed since."""
+        if self._snapshot is None:
+            return
+        paths: List[str] = self._snapshot.paths()
+        for file, import_type in self._snapshot.postings(_SNAPSHOT_KINDS[kind], key).tolist():
+            if paths[file] not in self._shadowed:
+                yield paths[file], IMPORT_TYPES[import_type]
+
+    def __in_snapshot(self, path: str) -> bool:
+        return self._snapshot is not None and path not in self._shadowed and self._snapshot.file_index(path) is not None
+
+    def __add(self, path: str, entries: Callable[[str], Iterable[Tuple[str, list]]]) -> None:
+        postings: List[Tuple[str, str, str]] = self.files.setdefault(path, [])
+        for import_type in _IMPORT_TYPES:
+            posting: Tuple[str, str] = (path, import_type)
+            for library, names in entries(import_type):
+                if self.__add_posting(self.libraries, library, posting):
+                    self._sorted_keys["libraries"] = None
+                postings.append(("libraries", library, import_type))
+                for name in _flatten(names):
+                    if self.__add_posting(self.modules, name, posting):
+                        self._sorted_keys["modules"] = None
+                    postings.append(("modules", name, import_type))
+
+    # ----------------
+    # public methods
+    # ----------------
+    def is_built_from(self, imports: dict) -> bool:
+        """Whether the index reflects 'imports' as it is now: the same mapping, not written to since."""
+        return self._source_id == id(imports) and self._source_generation == _generation(imports)
+
+    def mark_built_from(self, imports: dict) -> None:
+        """Record that 'imports' is indexed as it is now, after its changes were applied with update()."""
+        self._source_id, self._source_generation = id(imports), _generation(imports)
+
+    def build(self, imports: dict) -> None:
+        """Index every file; an ImportStore is read entry by entry, without decoding whole records."""
+        self.libraries, self.modules, self.files = {}, {}, {}
+        self._sorted_keys = {"libraries": None, "modules": None}
+        self._snapshot, self._shadowed = None, set()
+        for path in imports:
+            self.__add(path, partial(iter_entries, imports, path))
+        self.mark_built_from(imports)
+
+    def attach(self, snapshot: Snapshot, imports: dict) -> None:
+        """Index 'imports', loaded from 'snapshot', by the postings stored in the snapshot instead of building them."""
+        self.libraries, self.modules, self.files = {}, {}, {}
+        self._sorted_keys = {"libraries": None, "modules": None}
+        self._snapshot, self._shadowed = snapshot, set()
+        self.mark_built_from(imports)
+
+    def add(self, path: str, data: dict) -> None:
+        self.__add(path, lambda import_type: _entries(data.get(import_type)))
+
+    def remove(self, path: str) -> None:
+        if self.__in_snapshot(path):
+            self._shadowed.add(path)
+        for kind, key, import_type in self.files.pop(path, []):
+            if self.__remove_posting(getattr(self, kind), key, (path, import_type)):
+                self._sorted_keys[kind] = None
+
+    def update(self, path: str, data: Optional[dict]) -> None:
+        """Re-index one file; None removes it."""
+        if path in self.files or self.__in_snapshot(path):
+            self.remove(path)
+        if data is not None:
+            self.add(path, data)
+
+    def find_libraries(self, query: str, match: Optional[str] = "exact") -> Iterator[Tuple[str, str, str]]:
+        """(library, file, import type) for every matching library; O(number of results)."""
+        for library in self.__matching_keys("libraries", query, match):
+            for path, import_type in self.__snapshot_postings("libraries", library):
+                yield library, path, import_type
+            for (path, import_type) in self.libraries.get(library, ()):
+                yield library, path, import_type
+
+    def find_modules(self, query: str, match: Optional[str] = "exact") -> Iterator[Tuple[str, str, str]]:
+        """(imported name, file, import type) once per occurrence of every matching name."""
+        for name in self.__matching_keys("modules", query, match):
+            for path, import_type in self.__snapshot_postings("modules", name):
+                yield name, path, import_type
+            for (path, import_type), count in self.modules.get(name, {}).items():
+                for _ in range(count):
+                    yield name, path, import_type
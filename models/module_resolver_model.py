@@ -0,0 +1,126 @@
+import re
+from pathlib import Path
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+_FROM_IMPORT = re.compile(r"^\s*from\s+(\.*)\s*([\w.]*)\s+import\s+\(?(.+?)\)?\s*$")
+_IMPORT = re.compile(r"^\s*import\s+(.+?)\s*$")
+
+
+class ModuleResolverModel(BaseModel):
+    """
+    Maps import statements of project files to the project files they load.
+
+    The module-path table (dotted module name -> file) is built once from the scanned paths for every source root:
+    the root directory, its 'src' directory and, when the root is itself a package, its parent (so that imports
+    spelled with the package name resolve too). Resolutions are memoised per (package, statement).
+    """
+    root_directory: str | Path
+    extension: Optional[str] = Field(default=".py")
+    source_roots: List[str] = Field(default_factory=list)
+    modules: Dict[str, str] = Field(default_factory=dict)
+    _file_modules: Dict[str, Tuple[Tuple[str, ...], bool]] = PrivateAttr(default_factory=dict)
+    _memo: Dict[Tuple[Tuple[str, ...], str], Tuple[str, ...]] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if not self.source_roots:
+            self.source_roots = self.__default_source_roots()
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __default_source_roots(self) -> List[str]:
+        root: Path = Path(self.root_directory)
+        roots: List[str] = [root.as_posix()]
+        if (root / "src").is_dir():
+            roots.append((root / "src").as_posix())
+        if (root / "__init__.py").is_file():
+            roots.append(root.parent.as_posix())
+        return roots
+
+    def __module_parts(self, path: str, source_root: str) -> Optional[Tuple[Tuple[str, ...], bool]]:
+        prefix: str = source_root.rstrip("/") + "/"
+        if source_root not in (".", "") and not path.startswith(prefix):
+            return None
+        relative: str = path[len(prefix):] if source_root not in (".", "") else path
+        if self.extension and relative.endswith(self.extension):
+            relative = relative[:-len(self.extension)]
+        parts: List[str] = relative.split("/")
+        is_package: bool = parts[-1] == "__init__"
+        if is_package:
+            parts.pop()
+        if not parts or not all(part.isidentifier() for part in parts):
+            return None
+        return tuple(parts), is_package
+
+    def __lookup(self, parts: Iterable[str]) -> Optional[str]:
+        return self.modules.get(".".join(parts))
+
+    def __resolve_statement(self, package: Tuple[str, ...], statement: str) -> Tuple[str, ...]:
+        match = _FROM_IMPORT.match(statement)
+        if match:
+            dots, module, names = match.groups()
+            level: int = len(dots)
+            if level:
+                if level - 1 > len(package):
+                    return ()
+                base: Tuple[str, ...] = package[:len(package) - (level - 1)]
+            else:
+                base = ()
+            target: Tuple[str, ...] = base + (tuple(module.split(".")) if module else ())
+
+            resolved: List[str] = []
+            for name in names.split(","):
+                name = name.strip().split(" as ")[0].strip()
+                submodule: Optional[str] = self.__lookup(target + (name,)) if name and name != "*" else None
+                found: Optional[str] = submodule or self.__lookup(target)
+                if found and found not in resolved:
+                    resolved.append(found)
+            return tuple(resolved)
+
+        match = _IMPORT.match(statement)
+        if match:
+            resolved = []
+            for name in match.group(1).split(","):
+                name = name.strip().split(" as ")[0].strip()
+                found = self.__lookup(name.split(".")) if name else None
+                if found and found not in resolved:
+                    resolved.append(found)
+            return tuple(resolved)
+        return ()
+
+    # ----------------
+    # public methods
+    # ----------------
+    def build(self, paths: Iterable[str]) -> None:
+        """(Re)build the module-path table from the scanned file paths and drop memoised resolutions."""
+        self.modules, self._file_modules, self._memo = {}, {}, {}
+        paths = list(paths)
+        for source_root in self.source_roots:
+            for path in paths:
+                parts = self.__module_parts(path, source_root)
+                if parts is None:
+                    continue
+                self.modules.setdefault(".".join(parts[0]), path)
+                self._file_modules.setdefault(path, parts)
+
+    def module_of(self, path: str) -> Optional[str]:
+        parts = self._file_modules.get(path)
+        return ".".join(parts[0]) if parts else None
+
+    def resolve(self, path: str, statement: str) -> List[str]:
+        """Project files loaded by one import statement of 'path'; imports of anything outside the project resolve to nothing."""
+        if path not in self._file_modules and statement.lstrip().startswith("from ."):
+            return []
+        parts, is_package = self._file_modules.get(path, ((), False))
+        package: Tuple[str, ...] = parts if is_package else parts[:-1]
+        key: Tuple[Tuple[str, ...], str] = (package, statement)
+        if key not in self._memo:
+            self._memo[key] = self.__resolve_statement(package, statement)
+        return list(self._memo[key])
+
+    def resolve_file(self, path: str, statements: Iterable[str]) -> List[str]:
+        """Sorted, de-duplicated project files imported by 'path', excluding the file itself."""
+        return sorted({target for statement in statements for target in self.resolve(path, statement) if target != path})
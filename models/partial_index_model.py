@@ -0,0 +1,168 @@
+from os import replace
+from pathlib import Path
+from json import dumps, loads
+from typing import Dict, Iterable, List, Optional
+from pydantic import BaseModel, Field
+from utilities.snapshot import record_digest
+from utilities.sharding import SHARD_STRATEGIES
+from .dependency_model import DependencyModel
+from .file_collector_model import FileCollectorModel
+
+
+PARTIAL_INDEX_VERSION: int = 1
+
+
+def _root_prefix(root_directory: str | Path) -> str:
+    """The prefix DependencyModel puts in front of root-relative paths (the file collector joins with '/')."""
+    root: str = str(Path(root_directory)).replace("\\", "/")
+    return "" if root == "." else f"{root.rstrip('/')}/"
+
+
+def _entry_key(entry: dict) -> tuple:
+    """Total order over entries of one path, so that merging picks the same winner whatever the merge order."""
+    return record_digest({"imports": entry["imports"], "statements": entry["statements"]}), tuple(entry.get("state") or ())
+
+
+class PartialIndexModel(BaseModel):
+    """
+    Scan result of one or more shards of a tree, keyed by root-relative path so that shards scanned on different
+    machines (with different checkout directories) can be combined. merge() is a union of files and covered
+    shards; when two partials hold the same path, the entry with the larger content digest wins, which makes
+    merging associative, commutative and idempotent. The JSON form is what jobs hand to the merging step.
+    """
+    version: int = Field(default=PARTIAL_INDEX_VERSION)
+    extension: str = Field(default=".py")
+    shard_count: int = Field(default=1)
+    shard_strategy: str = Field(default="hash")
+    shard_depth: int = Field(default=1)
+    shards: List[int] = Field(default_factory=list)
+    files: Dict[str, dict] = Field(default_factory=dict)
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __check_compatible(self, other: "PartialIndexModel") -> None:
+        for name in ("version", "extension", "shard_count", "shard_strategy", "shard_depth"):
+            if getattr(self, name) != getattr(other, name):
+                raise ValueError(f"Cannot merge partial indexes with different {name}: {getattr(self, name)!r} != {getattr(other, name)!r}.")
+
+    # ----------------
+    # public methods
+    # ----------------
+    @classmethod
+    def from_model(
+            cls,
+            model: DependencyModel,
+            shards: Optional[Iterable[int]] = None,
+            shard_count: Optional[int] = 1,
+            shard_strategy: Optional[str] = "hash",
+            shard_depth: Optional[int] = 1
+        ) -> "PartialIndexModel":
+        """Partial index of a scanned model; 'shards' defaults to all of them (an unsharded scan)."""
+        prefix: str = _root_prefix(model.root_directory)
+        states: dict = model.file_states()
+        return cls(
+            extension=model.extension,
+            shard_count=shard_count,
+            shard_strategy=shard_strategy,
+            shard_depth=shard_depth,
+            shards=sorted(set(range(shard_count) if shards is None else shards)),
+            files={
+                (path[len(prefix):] if path.startswith(prefix) else path): {
+                    "imports": libraries,
+                    "statements": model.import_statements.get(path, []),
+                    "state": list(states[path]) if states.get(path) else None,
+                }
+                for path, libraries in model.imports.items()
+            },
+        )
+
+    @classmethod
+    def scan(
+            cls,
+            root_directory: str | Path,
+            shard_index: int,
+            shard_count: int,
+            shard_strategy: Optional[str] = "hash",
+            shard_depth: Optional[int] = 1,
+            **kwargs
+        ) -> "PartialIndexModel":
+        """
+        Scan one shard of 'root_directory'. Keyword arguments are DependencyModel fields; the file collector
+        (a FileCollectorModel by default) keeps its filters and only gets the shard settings added.
+        """
+        if shard_strategy not in SHARD_STRATEGIES:
+            raise ValueError(f"Unsupported shard strategy '{shard_strategy}'. Options: {', '.join(SHARD_STRATEGIES)}.")
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(f"shard_index must be between 0 and {shard_count - 1}.")
+        collector: FileCollectorModel = kwargs.pop("file_collector", None) or FileCollectorModel()
+        kwargs["file_collector"] = collector.model_copy(update={
+            "shard_index": shard_index,
+            "shard_count": shard_count,
+            "shard_strategy": shard_strategy,
+            "shard_depth": shard_depth,
+        })
+        kwargs.pop("autobuild", None)
+        model = DependencyModel(root_directory=root_directory, **kwargs)
+        return cls.from_model(model, [shard_index], shard_count, shard_strategy, shard_depth)
+
+    def merge(self, *others: "PartialIndexModel") -> "PartialIndexModel":
+        """A new partial index holding this one and 'others'; neither input is modified."""
+        files: Dict[str, dict] = dict(self.files)
+        shards: set = set(self.shards)
+        for other in others:
+            self.__check_compatible(other)
+            shards.update(other.shards)
+            for path, entry in other.files.items():
+                current: Optional[dict] = files.get(path)
+                if current is None or _entry_key(entry) > _entry_key(current):
+                    files[path] = entry
+        return self.model_copy(update={"shards": sorted(shards), "files": dict(sorted(files.items()))})
+
+    @classmethod
+    def merge_all(cls, partials: Iterable["PartialIndexModel"]) -> "PartialIndexModel":
+        partials = list(partials)
+        if not partials:
+            raise ValueError("At least one partial index is required.")
+        return partials[0].merge(*partials[1:])
+
+    def missing_shards(self) -> List[int]:
+        return sorted(set(range(self.shard_count)) - set(self.shards))
+
+    def is_complete(self) -> bool:
+        return not self.missing_shards()
+
+    def to_dependency_model(self, root_directory: str | Path, **kwargs) -> DependencyModel:
+        """
+        Load the merged index into a DependencyModel for 'root_directory' without scanning; keyword arguments are
+        the usual fields. File states are restored too, so poll_changes() re-scans files that differ locally.
+        """
+        prefix: str = _root_prefix(root_directory)
+        kwargs.setdefault("extension", self.extension)
+        autobuild: bool = kwargs.pop("autobuild", False)
+        model = DependencyModel(root_directory=root_directory, autoscan=False, **kwargs)
+        model.load_results(
+            imports={f"{prefix}{path}": entry["imports"] for path, entry in self.files.items()},
+            import_statements={f"{prefix}{path}": entry["statements"] for path, entry in self.files.items()},
+            file_states={
+                f"{prefix}{path}": tuple(entry["state"]) if entry.get("state") else None for path, entry in self.files.items()
+            },
+        )
+        model.autobuild = autobuild
+        if autobuild:
+            model.build_graph()
+        return model
+
+    def save(self, file_path: str | Path) -> None:
+        temporary: Path = Path(f"{file_path}.tmp")
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(dumps(self.model_dump()))
+        replace(temporary, file_path)
+
+    @classmethod
+    def load(cls, file_path: str | Path) -> "PartialIndexModel":
+        with open(file_path, "r", encoding="utf-8") as file:
+            data: dict = loads(file.read())
+        if data.get("version") != PARTIAL_INDEX_VERSION:
+            raise ValueError(f"Unsupported partial index version {data.get('version')} in {file_path}.")
+        return cls(**data)
@@ -0,0 +1,139 @@
+from os import stat, replace
+from pathlib import Path
+from threading import Lock
+from json import dumps, loads
+from typing import Dict, List, Iterable, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from utilities.extraction import EXTRACTOR_VERSION, content_digest
+from .abstract_models.abstract_scan_cache_model import AbstractScanCacheModel
+
+
+CACHE_FORMAT_VERSION: int = 1
+
+
+class ScanCacheModel(BaseModel, AbstractScanCacheModel):
+    """
+    On-disk cache of extracted import statements, keyed on file path.
+
+    An entry is reused when the file's mtime and size are unchanged, or when they changed but the content hash
+    did not (e.g. after a checkout or a 'touch'). The file stores the cache format version, the extractor version
+    and a caller-provided namespace; a mismatch on any of them discards the whole cache.
+    """
+    cache_path: str | Path = Field(min_length=1)
+    entries: Dict[str, dict] = Field(default_factory=dict)
+    namespace: Optional[str] = Field(default=None)
+    hits: int = Field(default=0)
+    misses: int = Field(default=0)
+    _pending: Dict[str, Tuple[int, int, Optional[str]]] = PrivateAttr(default_factory=dict)
+    _is_dirty: bool = PrivateAttr(default=False)
+    # lookup() may run concurrently in executor threads (see DependencyModel.ascan) while store() runs elsewhere
+    _lock: Lock = PrivateAttr(default_factory=Lock)
+
+    # -------------------
+    # protected methods
+    # -------------------
+    @staticmethod
+    def __digest(file_path: str) -> str:
+        try:
+            with open(file_path, 'rb') as file:
+                return content_digest(file.read())
+        except FileNotFoundError:
+            return ""
+
+    def __miss(self, file_path: str, signature: Tuple[int, int, Optional[str]]) -> None:
+        with self._lock:
+            self._pending[file_path] = signature
+            self.misses += 1
+
+    def __header(self) -> dict:
+        return {"version": CACHE_FORMAT_VERSION, "extractor": EXTRACTOR_VERSION, "namespace": self.namespace}
+
+    def __read(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                return loads(file.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    # ----------------
+    # public methods
+    # ----------------
+    def load(self, namespace: Optional[str] = None) -> None:
+        self.namespace = namespace
+        data: dict = self.__read()
+        header: dict = {key: data.get(key) for key in self.__header()}
+        with self._lock:
+            self.entries = data.get("entries", {}) if header == self.__header() else {}
+            self._is_dirty = not self.entries and bool(data)
+            self._pending.clear()
+            self.hits = self.misses = 0
+
+    def lookup(self, file_path: str) -> Optional[List[str]]:
+        """Return the cached import statements of an unchanged file, or None when the file must be parsed again."""
+        try:
+            status = stat(file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entry: Optional[dict] = self.entries.get(file_path)
+            if entry and entry["mtime_ns"] == status.st_mtime_ns and entry["size"] == status.st_size:
+                self.hits += 1
+                return entry["imports"]
+        if not entry:
+            # new file: it is parsed anyway, store() takes the digest of the bytes the reader read
+            self.__miss(file_path, (status.st_mtime_ns, status.st_size, None))
+            return None
+
+        digest: str = self.__digest(file_path)
+        if entry["digest"] == digest:
+            with self._lock:
+                entry["mtime_ns"], entry["size"] = status.st_mtime_ns, status.st_size
+                self._is_dirty = True
+                self.hits += 1
+            return entry["imports"]
+
+        self.__miss(file_path, (status.st_mtime_ns, status.st_size, digest))
+        return None
+
+    def store(self, file_path: str, imports: List[str], digest: Optional[str] = None) -> None:
+        """
+        Remember the statements of a file. The signature is the one taken in lookup(), i.e. before the file was
+        read; 'digest' is the content hash of the bytes that were parsed, which spares reading the file again.
+        """
+        with self._lock:
+            signature: Optional[Tuple[int, int, Optional[str]]] = self._pending.pop(file_path, None)
+        if signature is None:
+            try:
+                status = stat(file_path)
+            except OSError:
+                return
+            signature = (status.st_mtime_ns, status.st_size, None)
+
+        mtime_ns, size, pending_digest = signature
+        digest = pending_digest or digest or self.__digest(file_path)
+        with self._lock:
+            self.entries[file_path] = {"mtime_ns": mtime_ns, "size": size, "digest": digest, "imports": list(imports)}
+            self._is_dirty = True
+
+    def prune(self, file_paths: Iterable[str]) -> None:
+        """Drop the entries of files that no longer exist in the scanned tree."""
+        keep: set = set(file_paths)
+        with self._lock:
+            removed: List[str] = [path for path in self.entries if path not in keep]
+            for path in removed:
+                del self.entries[path]
+            self._is_dirty = self._is_dirty or bool(removed)
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._is_dirty:
+                return
+            data: str = dumps({**self.__header(), "entries": self.entries})
+            self._is_dirty = False
+        path: Path = Path(self.cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary: Path = path.with_name(path.name + ".tmp")
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(data)
+        replace(temporary, path)
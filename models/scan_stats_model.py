@@ -0,0 +1,132 @@
+import io
+import sys
+import pstats
+import cProfile
+import tracemalloc
+from json import dumps
+from pathlib import Path
+from time import perf_counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+try:
+    from resource import getrusage, RUSAGE_SELF
+except ImportError:  # not available on Windows
+    getrusage = None
+
+
+_PROFILE_LINES: int = 30
+_MEMORY_LINES: int = 15
+
+
+def _peak_rss() -> int:
+    """Peak resident set size of the process in bytes, 0 where unknown."""
+    if getrusage is None:
+        return 0
+    peak: int = getrusage(RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ScanStatsModel(BaseModel):
+    """
+    Timings (seconds, by stage) and counters of one DependencyModel scan. Stage times of work done per file
+    (reading, classifying) are summed over files, so with several workers they can exceed the wall-clock 'scan'.
+    Classification cache counters only see the calling process, i.e. not process pool workers.
+    """
+    stages: Dict[str, float] = Field(default_factory=dict)
+    files_walked: int = Field(default=0)
+    files_skipped: int = Field(default=0)
+    files_parsed: int = Field(default=0)
+    bytes_read: int = Field(default=0)
+    parse_failures: int = Field(default=0)
+    failed_files: List[str] = Field(default_factory=list)
+    classification_hits: int = Field(default=0)
+    classification_misses: int = Field(default=0)
+    edges_emitted: int = Field(default=0)
+    peak_memory: int = Field(default=0)
+    traced_peak_memory: Optional[int] = Field(default=None)
+    profile_report: Optional[str] = Field(default=None)
+    memory_report: Optional[str] = Field(default=None)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    _profile: Optional[pstats.Stats] = PrivateAttr(default=None)
+
+    # ----------------
+    # public methods
+    # ----------------
+    def add_time(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, perf_counter() - start)
+
+    def record_file(self, path: str, parsed: bool, metrics: Optional[dict] = None) -> None:
+        """Count one walked file: parsed, or skipped because its imports came from the scan cache."""
+        self.files_walked += 1
+        if not parsed:
+            self.files_skipped += 1
+            return
+        metrics = metrics or {}
+        self.files_parsed += 1
+        self.bytes_read += metrics.get("bytes_read", 0)
+        if metrics.get("parse_failed"):
+            self.parse_failures += 1
+            self.failed_files.append(path)
+        for stage in ("read", "classify"):
+            self.add_time(stage, metrics.get(stage, 0.0))
+
+    def record_classification(self, hits: int, misses: int) -> None:
+        self.classification_hits += hits
+        self.classification_misses += misses
+
+    def record_memory(self) -> None:
+        self.peak_memory = max(self.peak_memory, _peak_rss())
+
+    @contextmanager
+    def capture(self, profile: Optional[bool] = False, trace_memory: Optional[bool] = False) -> Iterator[None]:
+        """
+        Optionally run the enclosed code under cProfile and/or tracemalloc; the top entries end up in profile_report
+        and memory_report, the full profile is available through dump_profile().
+        """
+        profiler: Optional[cProfile.Profile] = cProfile.Profile() if profile else None
+        started_tracing: bool = bool(trace_memory) and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+                stream = io.StringIO()
+                self._profile = pstats.Stats(profiler, stream=stream)
+                self._profile.sort_stats("cumulative").print_stats(_PROFILE_LINES)
+                self.profile_report = stream.getvalue()
+            if trace_memory and tracemalloc.is_tracing():
+                snapshot = tracemalloc.take_snapshot()
+                self.traced_peak_memory = tracemalloc.get_traced_memory()[1]
+                self.memory_report = "\n".join(str(line) for line in snapshot.statistics("lineno")[:_MEMORY_LINES])
+                if started_tracing:
+                    tracemalloc.stop()
+            self.record_memory()
+
+    def dump_profile(self, file_path: str | Path) -> None:
+        """Write the captured cProfile data in pstats format (e.g. for snakeviz)."""
+        if self._profile is None:
+            raise RuntimeError("No profile was captured; scan with profile=True first.")
+        self._profile.dump_stats(str(file_path))
+
+    def to_dict(self) -> dict:
+        return self.model_dump()
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return dumps(self.to_dict(), indent=indent)
+
+    def save(self, file_path: str | Path) -> None:
+        Path(file_path).write_text(self.to_json(), encoding="utf-8")
@@ -0,0 +1,36 @@
+from json import dumps
+from pathlib import Path
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field
+from utilities.snapshot import Snapshot
+from utilities.snapshot_diff import diff_snapshots
+
+
+class SnapshotDiffModel(BaseModel):
+    """
+    Difference between two scan snapshots, e.g. main versus a pull request branch. Files are paths relative to the
+    scanned root directory. Edges are (file, library, import type); dependencies are file-to-file edges and are
+    only compared when both snapshots were saved after resolve_file_dependencies().
+    """
+    added_files: List[str] = Field(default_factory=list)
+    removed_files: List[str] = Field(default_factory=list)
+    modified_files: List[str] = Field(default_factory=list)
+    added_edges: List[Tuple[str, str, str]] = Field(default_factory=list)
+    removed_edges: List[Tuple[str, str, str]] = Field(default_factory=list)
+    added_dependencies: List[Tuple[str, str]] = Field(default_factory=list)
+    removed_dependencies: List[Tuple[str, str]] = Field(default_factory=list)
+    new_libraries: List[str] = Field(default_factory=list)
+    new_third_party_libraries: List[str] = Field(default_factory=list)
+    new_cycles: List[dict] = Field(default_factory=list)
+
+    @classmethod
+    def compare(cls, base: str | Path | Snapshot, head: str | Path | Snapshot) -> "SnapshotDiffModel":
+        base = base if isinstance(base, Snapshot) else Snapshot(base)
+        head = head if isinstance(head, Snapshot) else Snapshot(head)
+        return cls(**diff_snapshots(base, head))
+
+    def is_empty(self) -> bool:
+        return not (self.added_files or self.removed_files or self.modified_files)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return dumps(self.model_dump(), indent=indent)
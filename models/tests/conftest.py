@@ -0,0 +1,25 @@
+import pytest
+from typing import Callable
+from ..graph_model import GraphModel
+from ..import_model import ImportModel
+from ..dependency_model import DependencyModel
+from ..file_reader_model import FileReaderModel
+from ..file_collector_model import FileCollectorModel
+
+
+@pytest.fixture
+def model_classes() -> dict:
+    return {
+        "graph_class": GraphModel,
+        "file_collector": FileCollectorModel(),
+        "file_import_class": ImportModel,
+        "file_reader_class": FileReaderModel,
+    }
+
+
+@pytest.fixture
+def scan(project, model_classes) -> Callable[..., DependencyModel]:
+    """Builds (and by default scans) a DependencyModel of 'project'; keyword arguments replace any default."""
+    def build(**kwargs) -> DependencyModel:
+        return DependencyModel(**{**model_classes, "root_directory": project.as_posix(), **kwargs})
+    return build
@@ -0,0 +1,139 @@
+import time
+import asyncio
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock, current_thread
+from typing import ClassVar, List
+from ..dependency_model import DependencyModel
+from ..scan_cache_model import ScanCacheModel
+from ..file_reader_model import FileReaderModel
+
+
+class SlowReaderModel(FileReaderModel):
+    delay: ClassVar[float] = 0.01
+    reads: ClassVar[int] = 0
+    active: ClassVar[int] = 0
+    peak: ClassVar[int] = 0
+    counter_lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def reset(cls, delay: float = 0.01) -> None:
+        cls.delay, cls.reads, cls.active, cls.peak = delay, 0, 0, 0
+
+    def get_imports(self) -> List[str | None]:
+        with SlowReaderModel.counter_lock:
+            SlowReaderModel.reads += 1
+            SlowReaderModel.active += 1
+            SlowReaderModel.peak = max(SlowReaderModel.peak, SlowReaderModel.active)
+        time.sleep(SlowReaderModel.delay)
+        with SlowReaderModel.counter_lock:
+            SlowReaderModel.active -= 1
+        return super().get_imports()
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {
+        f"module_{number}.py": f"import json\nfrom pathlib import Path\nfrom module_{(number + 1) % 24} import value\n"
+        for number in range(24)
+    }
+
+
+@pytest.fixture(autouse=True)
+def slow_reader():
+    SlowReaderModel.reset()
+
+
+def test_ascan_matches_synchronous_scan(scan):
+    scanned = scan()
+    model = scan(autoscan=False)
+    assert asyncio.run(model.ascan(concurrency=4)) is model
+    assert model.imports == scanned.imports
+    assert model.import_statements == scanned.import_statements
+    assert list(model.find_by_library("json", file_only=True)) == list(scanned.find_by_library("json", file_only=True))
+    assert model.stats.files_parsed == 24
+
+
+def test_ascan_keeps_event_loop_responsive_with_bounded_concurrency(scan):
+    model = scan(autoscan=False, file_reader_class=SlowReaderModel)
+
+    async def main() -> int:
+        ticks: int = 0
+        scanning = asyncio.ensure_future(model.ascan(concurrency=3))
+        while not scanning.done():
+            ticks += 1
+            await asyncio.sleep(0.005)
+        await scanning
+        return ticks
+
+    ticks: int = asyncio.run(main())
+    assert len(model.imports) == 24
+    assert SlowReaderModel.peak <= 3
+    assert ticks >= 5
+
+
+def test_concurrent_requests_share_one_scan(model_classes, project):
+    async def main():
+        return await asyncio.gather(*(
+            DependencyModel.ascan_root(project.as_posix(), **{**model_classes, "file_reader_class": SlowReaderModel})
+            for _ in range(3)
+        ))
+
+    first, second, third = asyncio.run(main())
+    assert first is second is third
+    assert SlowReaderModel.reads == 24
+
+
+def test_cancelled_scan_keeps_previous_state(scan):
+    model = scan(autoscan=False, file_reader_class=SlowReaderModel)
+    SlowReaderModel.reset(delay=0.05)
+
+    async def main() -> None:
+        scanning = asyncio.ensure_future(model.ascan(concurrency=2))
+        await asyncio.sleep(0.08)
+        scanning.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await scanning
+
+    asyncio.run(main())
+    assert model.imports == {}
+    assert SlowReaderModel.reads < 24
+
+    SlowReaderModel.reset(delay=0)
+    asyncio.run(model.ascan())
+    assert len(model.imports) == 24
+
+
+def test_scan_cache_lookups_run_off_the_event_loop(scan, tmp_path, monkeypatch):
+    lookup_threads, lookup = [], ScanCacheModel.lookup
+    monkeypatch.setattr(ScanCacheModel, "lookup", lambda self, path: lookup_threads.append(current_thread()) or lookup(self, path))
+    cache = ScanCacheModel(cache_path=str(tmp_path / "cache" / "scan.json"))
+    model = scan(autoscan=False, scan_cache=cache)
+
+    asyncio.run(model.ascan(concurrency=4))
+    asyncio.run(model.ascan(concurrency=4))
+    assert len(lookup_threads) == 48
+    assert current_thread() not in lookup_threads
+    assert (cache.hits, cache.misses) == (24, 0)
+
+
+def test_ascan_in_a_process_pool_uses_the_scan_cache(scan, tmp_path):
+    cache = ScanCacheModel(cache_path=str(tmp_path / "cache" / "scan.json"))
+    model = scan(autoscan=False, scan_cache=cache)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        asyncio.run(model.ascan(executor=executor))
+        assert model.stats.files_parsed == 24 and len(cache.entries) == 24
+        asyncio.run(model.ascan(executor=executor))
+    assert model.stats.files_parsed == 0
+    assert cache.hits == 24
+
+
+def test_abuild_graph(scan, project):
+    model = scan(autoscan=False, import_type="standard")
+
+    async def main() -> None:
+        await model.ascan()
+        await model.abuild_graph()
+
+    asyncio.run(main())
+    assert model.graph_instance.core.has_edge(f"{project.as_posix()}/module_0.py", "Path")
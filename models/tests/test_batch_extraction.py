@@ -0,0 +1,54 @@
+import pytest
+from pydantic import field_validator
+from utilities.batch_extraction import extract_batch, extract_file
+from ..import_model import ImportModel
+from ..file_reader_model import FileReaderModel
+
+
+class SkipOsImportModel(ImportModel):
+    @field_validator("imports")
+    @classmethod
+    def skip_os(cls, imports):
+        return [statement for statement in imports if "os" not in statement.split()]
+
+
+SOURCES = [
+    "import os\nimport numpy as np, sys\n",
+    "from os import path, sep\nfrom .graph_model import GraphModel\nfrom os import getcwd\n",
+    "from typing import (\n    List,\n    Optional,\n)\nimport custom_library\n",
+    "import os\ndef broken(:\nfrom json import dumps\n",
+    "",
+]
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for index, source in enumerate(SOURCES):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(source)
+        paths.append(str(path))
+    return paths + [str(tmp_path / "missing.py")]
+
+
+def test_batch_matches_models(files):
+    results = extract_batch(files)
+    assert [result[0] for result in results] == files
+    for path, statements, libraries, parsed, metrics in results:
+        reader = FileReaderModel(file_path=path)
+        assert statements == reader.get_imports()
+        assert libraries == ImportModel(imports=statements).get_libraries(as_json=False)
+        assert list(libraries["standard"]) == list(ImportModel(imports=statements).standard_libraries)
+        assert parsed
+        assert (metrics["bytes_read"], metrics["parse_failed"]) == (reader.bytes_read, reader.parse_failed)
+
+
+def test_cached_statements_skip_the_reader(tmp_path):
+    path, statements, libraries, parsed, metrics = extract_file(str(tmp_path / "missing.py"), ["import os"])
+    assert statements == ["import os"] and libraries["standard"] == {"os": []}
+    assert not parsed and "read" not in metrics
+
+
+def test_subclasses_keep_the_per_file_models(scan, project):
+    model = scan(file_import_class=SkipOsImportModel)
+    assert model.imports[f"{project.as_posix()}/a.py"] == {"standard": {}, "custom": {"b": ["run"]}}
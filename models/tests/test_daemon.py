@@ -0,0 +1,146 @@
+import time
+import socket
+import pytest
+from threading import Event
+from typing import Callable, Optional
+from ..daemon_model import DaemonModel
+from ..dependency_model import DependencyModel
+from ..file_collector_model import FileCollectorModel
+from utilities.daemon_client import DaemonClient
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {
+        "app/__init__.py": "",
+        "app/core.py": "import json\n",
+        "app/service.py": "from app import core\nfrom pathlib import Path\n",
+        "app/cli.py": "from app.service import Path\n",
+    }
+
+
+@pytest.fixture
+def build_daemon(scan, project) -> Callable[..., DaemonModel]:
+    def build(watch_interval: Optional[float] = None) -> DaemonModel:
+        return DaemonModel(dependency_model=scan(), socket_path=project / "daemon.sock", watch_interval=watch_interval)
+    return build
+
+
+@pytest.fixture
+def daemon(build_daemon):
+    daemon = build_daemon()
+    daemon.start()
+    yield daemon
+    daemon.stop()
+
+
+def test_queries_over_the_socket(project, daemon):
+    root: str = project.as_posix()
+    with DaemonClient(daemon.socket_path) as client:
+        assert client.request("ping") == "pong"
+        assert client.request("find_by_library", library="json", file_only=True) == [f"{root}/app/core.py"]
+        assert sorted(client.request("find_by_module", module="Path", file_only=True)) == [
+            f"{root}/app/cli.py", f"{root}/app/service.py"
+        ]
+        assert client.request("transitive_dependents", path=f"{root}/app/core.py") == [
+            f"{root}/app/cli.py", f"{root}/app/service.py"
+        ]
+        assert client.request("impacted_files", paths=["app/service.py"], include_changed=False) == [f"{root}/app/cli.py"]
+        assert client.request("stats")["files"] == 4
+
+
+def test_errors_are_reported_without_closing_the_connection(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        with pytest.raises(RuntimeError, match="Unknown command"):
+            client.request("drop_everything")
+        with pytest.raises(RuntimeError, match="TypeError"):
+            client.request("find_by_library", unknown_argument=1)
+        assert client.request("ping") == "pong"
+
+
+def test_refresh_applies_incremental_rescan(project, daemon):
+    root: str = project.as_posix()
+    with DaemonClient(daemon.socket_path) as client:
+        (project / "app" / "worker.py").write_text("import json\nfrom app import cli\n")
+        event = client.request("refresh")
+        assert event["added_files"] == [f"{root}/app/worker.py"]
+        assert f"{root}/app/worker.py" in client.request("find_by_library", library="json", file_only=True)
+        assert f"{root}/app/worker.py" in client.request("transitive_dependents", path=f"{root}/app/core.py")
+
+
+def test_watcher_keeps_index_current(build_daemon, project):
+    daemon = build_daemon(watch_interval=0.05)
+    daemon.start()
+    try:
+        with DaemonClient(daemon.socket_path) as client:
+            (project / "app" / "core.py").write_text("import csv\n")
+            deadline: float = time.monotonic() + 5
+            while client.request("find_by_library", library="csv", file_only=True) == [] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert client.request("find_by_library", library="csv", file_only=True) == [f"{project.as_posix()}/app/core.py"]
+    finally:
+        daemon.stop()
+
+
+def test_queries_are_answered_while_the_watcher_walks_the_tree(build_daemon, project, monkeypatch):
+    daemon = build_daemon(watch_interval=0.01)
+    walking, release = Event(), Event()
+    iter_files = FileCollectorModel.iter_files
+
+    def blocked_walk(self, **kwargs):
+        walking.set()
+        release.wait(5)
+        yield from iter_files(self, **kwargs)
+
+    monkeypatch.setattr(FileCollectorModel, "iter_files", blocked_walk)
+    daemon.start()
+    try:
+        assert walking.wait(5)
+        with DaemonClient(daemon.socket_path, timeout=1.0) as client:
+            assert client.request("find_by_library", library="json", file_only=True) == [f"{project.as_posix()}/app/core.py"]
+    finally:
+        release.set()
+        daemon.stop()
+
+
+def test_refuses_to_replace_a_running_daemon(build_daemon, daemon):
+    with pytest.raises(RuntimeError, match="already serving"):
+        build_daemon().start()
+    with DaemonClient(daemon.socket_path) as client:
+        assert client.request("ping") == "pong"
+
+
+def test_replaces_a_stale_socket(build_daemon, project):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(project / "daemon.sock"))
+    stale.close()
+    daemon = build_daemon()
+    daemon.start()
+    try:
+        with DaemonClient(daemon.socket_path) as client:
+            assert client.request("ping") == "pong"
+    finally:
+        daemon.stop()
+
+
+def test_warm_queries_take_milliseconds(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        client.request("ping")
+        started: float = time.perf_counter()
+        for _ in range(50):
+            client.request("find_by_library", library="json")
+        assert (time.perf_counter() - started) / 50 < 0.01
+
+
+def test_shutdown_removes_socket_and_writes_snapshot(build_daemon, model_classes, project):
+    daemon = build_daemon()
+    daemon.snapshot_path = project / "index.snapshot"
+    daemon.start()
+    with DaemonClient(daemon.socket_path) as client:
+        assert client.request("shutdown") == "stopping"
+    deadline: float = time.monotonic() + 5
+    while not (project / "index.snapshot").exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not (project / "daemon.sock").exists()
+    restored = DependencyModel.from_snapshot(project / "index.snapshot", **model_classes)
+    assert sorted(restored.imports) == sorted(daemon.dependency_model.imports)
@@ -5,6 +5,8 @@ from ..import_model import ImportModel
 from ..dependency_model import DependencyModel
 from ..file_reader_model import FileReaderModel
 from ..file_collector_model import FileCollectorModel
+from utilities.import_store import ImportStore
+from utilities.module_index import get_module_index
 
 class MockGraphModel(GraphModel):
     pass
@@ -82,3 +84,44 @@ def test_save_graph_matrix(dependency_model, tmp_path):
     except RuntimeError:
         pytest.fail("save_graph_matrix() raised RuntimeError unexpectedly!")
     assert file_path.exists()
+
+
+def test_imports_are_kept_in_an_import_store(dependency_model):
+    assert isinstance(dependency_model.imports, ImportStore)
+    assert dependency_model.get_all_paths(sorted_keys=True) == ['file1.py', 'file2.py']
+    assert dependency_model.find_imports_by_path('file1.py') == {'standard': ['os'], 'custom': ['custom_module']}
+    assert dependency_model.peek(1) == {'file1.py': {'standard': ['os'], 'custom': ['custom_module']}}
+    restored = DependencyModel(
+        graph_class=MockGraphModel,
+        file_collector=MockFileCollectorModel(),
+        file_import_class=MockImportModel,
+        file_reader_class=MockFileReaderModel,
+        imports={'file3.py': {'standard': {'os': []}, 'custom': {}}},
+        autoscan=False,
+    )
+    assert isinstance(restored.imports, ImportStore)
+    assert restored.imports == {'file3.py': {'standard': {'os': []}, 'custom': {}}}
+
+    restored.imports = {'file4.py': {'standard': {}, 'custom': {'models': ['GraphModel']}}}
+    assert isinstance(restored.imports, ImportStore)
+    assert list(restored.find_by_library('models', file_only=True)) == ['file4.py']
+
+    restored.imports['file4.py']['custom']['utilities'] = []
+    assert restored.imports['file4.py'] == {'standard': {}, 'custom': {'models': ['GraphModel'], 'utilities': []}}
+    assert list(restored.find_by_library('utilities', file_only=True)) == ['file4.py']
+
+
+def test_project_roots_are_released_after_a_scan(tmp_path):
+    (tmp_path / "pandas").mkdir()
+    (tmp_path / "pandas" / "__init__.py").write_text("")
+    (tmp_path / "main.py").write_text("import pandas\n")
+    model = DependencyModel(
+        graph_class=GraphModel,
+        file_collector=FileCollectorModel(),
+        file_import_class=ImportModel,
+        file_reader_class=FileReaderModel,
+        root_directory=str(tmp_path),
+    )
+    assert "pandas" in model.imports[(tmp_path / "main.py").as_posix()]["custom"]
+    assert tmp_path.as_posix() not in get_module_index().project_roots
+    assert "pandas" in ImportModel(imports=["import pandas"]).standard_libraries
@@ -0,0 +1,41 @@
+import json
+import pytest
+from ..dependency_model import DependencyModel
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {"a.py": "import os\nfrom pathlib import Path, PurePath\nimport b\n", "b.py": "import json\n"}
+
+
+@pytest.fixture
+def model(scan) -> DependencyModel:
+    return scan()
+
+
+def test_iter_import_records(model, tmp_path):
+    a: str = f"{(tmp_path / 'project').as_posix()}/a.py"
+    records = [record for record in model.iter_import_records() if record["file"] == a]
+    assert {"file": a, "type": "standard", "library": "os", "module": None} in records
+    assert {"file": a, "type": "standard", "library": "pathlib", "module": "PurePath"} in records
+    assert {"file": a, "type": "custom", "library": "b", "module": None} in records
+
+
+def test_export_imports(model, tmp_path):
+    count: int = model.export_imports(tmp_path / "imports.jsonl")
+    lines = (tmp_path / "imports.jsonl").read_text().splitlines()
+    assert count == len(lines) == len(list(model.iter_import_records()))
+    assert all(set(json.loads(line)) == {"file", "type", "library", "module"} for line in lines)
+
+
+def test_export_graph_builds_it_on_demand(model, tmp_path):
+    count: int = model.export_graph(tmp_path / "graph.dot")
+    assert model.graph_instance is not None
+    assert count == len(model.graph_instance.edges)
+    assert (tmp_path / "graph.dot").read_text().count(" -> ") == count
+
+
+def test_export_file_graph(model, tmp_path):
+    root: str = (tmp_path / "project").as_posix()
+    assert model.export_graph(tmp_path / "files.jsonl", file_graph=True) == 1
+    assert json.loads((tmp_path / "files.jsonl").read_text()) == {"source": f"{root}/a.py", "target": f"{root}/b.py"}
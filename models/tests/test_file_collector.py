@@ -83,3 +83,66 @@ def test__reduce_by_character(collected_files, starts_with, ends_with, expected)
 def test__filter_files(collector_instance, files, extension, starts_with, ends_with, expected):
     filtered_files = collector_instance._FileCollectorModel__filter_files(files, extension, starts_with, ends_with)
     assert filtered_files == expected
+
+
+@pytest.fixture
+def tree(tmp_path):
+    files: List[str] = [
+        'main.py',
+        'README.md',
+        '__init__.py',
+        'package/module.py',
+        'package/generated_pb2.py',
+        'package/nested/deep.py',
+        'package/nested/scratch.py',
+        'package/nested/keep_scratch.py',
+        '.git/hooks/hook.py',
+        '.venv/lib/site.py',
+        'env/lib/site.py',
+        'node_modules/tool/index.py',
+        'package/__pycache__/module.py',
+        'build/output.py',
+    ]
+    for file in files:
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).write_text('')
+    (tmp_path / 'env' / 'pyvenv.cfg').write_text('')
+    (tmp_path / '.gitignore').write_text('# comment\nbuild/\n*_pb2.py\n')
+    (tmp_path / 'package' / 'nested' / '.gitignore').write_text('scratch.py\n!keep_scratch.py\n')
+    return tmp_path
+
+
+def relative(paths: List[str], root) -> List[str]:
+    return sorted(path[len(root.as_posix()) + 1:] for path in paths)
+
+
+def test_collect_files_prunes_excluded_and_ignored_directories(tree):
+    collected = FileCollectorModel().collect_files(tree, extension='.py')
+    assert relative(collected, tree) == ['__init__.py', 'main.py', 'package/module.py', 'package/nested/deep.py', 'package/nested/keep_scratch.py']
+
+
+def test_collect_files_without_gitignore_and_with_extra_patterns(tree):
+    collector = FileCollectorModel(use_gitignore=False, ignore_patterns=['package/nested/'])
+    collected = collector.collect_files(tree, extension='.py', exclude_start_characters='__')
+    assert relative(collected, tree) == ['build/output.py', 'main.py', 'package/generated_pb2.py', 'package/module.py']
+
+
+def test_iter_files_is_lazy(tree):
+    iterator = FileCollectorModel().iter_files(tree, extension='.py')
+    assert next(iterator).endswith('.py')
+
+
+@pytest.mark.skipif(not hasattr(__import__('os'), 'symlink'), reason='symlinks not supported')
+def test_symlink_loops_are_detected(tree):
+    (tree / 'package' / 'nested' / 'loop').symlink_to(tree / 'package', target_is_directory=True)
+    followed = FileCollectorModel(follow_symlinks=True).collect_files(tree, extension='.py')
+    not_followed = FileCollectorModel().collect_files(tree, extension='.py')
+    assert relative(followed, tree) == relative(not_followed, tree)
+
+
+def test_iter_files_respects_custom_collect_files():
+    class StaticCollectorModel(FileCollectorModel):
+        def collect_files(self, root_path=None, extension=None, exclude_start_characters=None, exclude_end_characters=None, return_files=False):
+            return ['a.py', 'b.py']
+
+    assert list(StaticCollectorModel().iter_files('anywhere')) == ['a.py', 'b.py']
@@ -61,3 +61,127 @@ def test_list_edges(graph_instance):
     assert 'source' in edge_list.columns
     assert 'target' in edge_list.columns
     assert ('file1.py', 'module1') in edge_list.values
+
+
+def test_adjacency_arrays_match_dense_matrix(graph_instance):
+    indptr, indices, paths, imports = graph_instance.get_adjacency_arrays()
+    assert len(indptr) == len(paths) + 1
+    assert indptr[-1] == len(indices)
+    for i, path in enumerate(paths):
+        row = {imports[j] for j in indices[indptr[i]:indptr[i + 1]]}
+        assert row == {imp for imp in imports if graph_instance.graph.has_edge(path, imp)}
+        assert list(graph_instance.adjacency_matrix[i].nonzero()[0]) == sorted(imports.index(imp) for imp in row)
+
+
+def test_sparse_only_graph_skips_dense_allocation(graph_data):
+    graph = GraphModel(data=graph_data, dense_matrix=False)
+    assert graph.adjacency_matrix is None
+    assert graph.to_dense_matrix().shape == (len(graph.paths), len(graph.imports))
+
+
+def test_top_n_imports_limits_adjacency(graph_data):
+    graph = GraphModel(data=graph_data, top_n_imports=2)
+    indptr, indices, paths, imports = graph.get_adjacency_arrays()
+    assert len(paths) <= 2 and len(imports) <= 2
+    assert graph.adjacency_matrix.shape == (len(paths), len(imports))
+    assert all(index < len(imports) for index in indices)
+
+
+@pytest.fixture
+def large_graph_instance() -> GraphModel:
+    data = [{'file': f'large/file_{i}.py', 'import': [f'large_module_{(i * 7 + k) % 900}' for k in range(3)]} for i in range(3000)]
+    return GraphModel(data=data, dense_matrix=False)
+
+
+@pytest.mark.parametrize("render_mode, expected", [
+    ("auto", ("raster", False)),
+    ("unknown", ("raster", False)),
+    ("heatmap", ("heatmap", False)),
+    ("raster", ("raster", False)),
+])
+def test_choose_render_mode_for_large_matrix(large_graph_instance, render_mode, expected):
+    assert large_graph_instance._GraphModel__choose_render_mode(render_mode, 400, 100, 5.0) == expected
+
+
+def test_choose_render_mode_for_small_matrix(graph_instance):
+    mode, annotate = graph_instance._GraphModel__choose_render_mode("auto", 10**9, 100, 10**6)
+    assert mode == "heatmap" and annotate
+    assert graph_instance._GraphModel__choose_render_mode("auto", 0, 100, 10**6) == ("heatmap", False)
+
+
+def test_block_aggregate_keeps_every_edge(large_graph_instance):
+    matrix, row_block, column_block = large_graph_instance._GraphModel__block_aggregate(100, 50)
+    assert matrix.shape[0] <= 100 and matrix.shape[1] <= 50
+    assert matrix.sum() == len(large_graph_instance.adjacency_indices)
+
+
+def test_thin_labels():
+    labels = GraphModel._GraphModel__thin_labels([str(i) for i in range(10)], 5)
+    assert labels == ['0', '', '2', '', '4', '', '6', '', '8', '']
+
+
+def test_save_large_matrix_as_raster(large_graph_instance, tmp_path):
+    large_graph_instance.save(local_save_path=str(tmp_path), file_name="large.png", max_pixels=(200, 200))
+    assert (tmp_path / "large.png").exists()
+
+def test_find_cycles():
+    graph = GraphModel(data=[
+        {'file': 'cycle_a.py', 'import': ['cycle_b.py']},
+        {'file': 'cycle_b.py', 'import': ['cycle_c.py', 'cycle_a.py']},
+        {'file': 'cycle_c.py', 'import': ['cycle_a.py']},
+    ])
+    cycle = next(cycle for cycle in graph.find_cycles() if 'cycle_a.py' in cycle['component'])
+    assert cycle == {
+        'component': ['cycle_a.py', 'cycle_b.py', 'cycle_c.py'],
+        'shortest_cycle': ['cycle_a.py', 'cycle_b.py', 'cycle_a.py'],
+    }
+    assert ['cycle_a.py', 'cycle_b.py', 'cycle_c.py'] in graph.strongly_connected_components()
+
+def test_instances_do_not_share_the_graph():
+    first = GraphModel(data=[{'file': 'only_first.py', 'import': 'os'}])
+    second = GraphModel(data=[{'file': 'only_second.py', 'import': 'os'}])
+    assert first.edges == [('only_first.py', 'os')]
+    assert second.edges == [('only_second.py', 'os')]
+    assert not second.graph.has_edge('only_first.py', 'os')
+
+def test_networkx_view_follows_updates(graph_instance):
+    assert graph_instance.graph.has_edge('file1.py', 'module1')
+    graph_instance.update_edges(added=[('file1.py', 'module9')], removed=[('file1.py', 'module1')])
+    assert graph_instance.graph.has_edge('file1.py', 'module9')
+    assert 'module1' not in graph_instance.nodes
+    assert graph_instance.core.successors('file1.py') == ['module9']
+
+def test_iter_edges_and_export(graph_instance, tmp_path):
+    assert list(graph_instance.iter_edges()) == graph_instance.edges
+    assert graph_instance.export_edges(tmp_path / 'edges.csv.gz') == len(graph_instance.edges)
+
+def test_patched_adjacency_equals_a_rebuild():
+    import random
+    generator = random.Random(5)
+    files = [f'file_{index}.py' for index in range(30)]
+    modules = [f'module_{index}' for index in range(20)] + files[:5]
+    graph = GraphModel(data=[{'file': file, 'import': generator.sample(modules, 3)} for file in files], dense_matrix=False)
+    for _ in range(40):
+        present = graph.edges
+        removed = generator.sample(present, min(len(present), generator.randrange(5)))
+        added = [(generator.choice(files + ['new.py']), generator.choice(modules + ['module_new'])) for _ in range(generator.randrange(5))]
+        graph.update_edges(added=added, removed=removed)
+
+        rebuilt = GraphModel(data=[{'file': source, 'import': target} for source, target in graph.edges], dense_matrix=False)
+        indptr, indices, paths, imports = graph.get_adjacency_arrays()
+        expected_indptr, expected_indices, expected_paths, expected_imports = rebuilt.get_adjacency_arrays()
+        assert (paths, imports) == (expected_paths, expected_imports)
+        assert indptr.tolist() == expected_indptr.tolist() and indices.tolist() == expected_indices.tolist()
+
+def test_dense_matrix_is_rebuilt_on_read_after_updates(graph_instance):
+    graph_instance.update_edges(added=[('file4.py', 'module1')], removed=[('file3.py', 'module4')])
+    assert graph_instance.adjacency_matrix is None
+    matrix = graph_instance.get_adjacency_matrix()
+    assert (matrix == graph_instance.to_dense_matrix()).all()
+    assert graph_instance.adjacency_matrix is matrix
+
+def test_from_edges_keeps_no_input(graph_data):
+    graph = GraphModel.from_edges([('file1.py', 'module1'), ('file2.py', 'module2'), ('file1.py', 'module1')])
+    assert graph.edges == [('file1.py', 'module1'), ('file2.py', 'module2')]
+    assert 'data' not in GraphModel(data=graph_data).model_dump()
+    assert GraphModel(data=iter(graph_data)).edges == GraphModel(data=graph_data).edges
@@ -0,0 +1,93 @@
+import pytest
+from ..dependency_model import DependencyModel
+from ..import_index_model import ImportIndexModel
+from utilities.import_store import ImportStore
+from utilities.snapshot import Snapshot, write_snapshot
+
+
+@pytest.fixture
+def imports() -> dict:
+    return {
+        "a.py": {"standard": {"os": [], "pathlib": ["Path"]}, "custom": {"models.graph_model": ["GraphModel"]}},
+        "b.py": {"standard": {"os.path": ["join", "sep"]}, "custom": {"models": ["graph_model"], "modelsx": ["Path"]}},
+        "c.py": {"standard": {"pathlib": ["Path", "PurePath"]}, "custom": {}},
+    }
+
+
+@pytest.fixture(params=["built", "attached"])
+def index(request, imports, tmp_path) -> ImportIndexModel:
+    index = ImportIndexModel()
+    if request.param == "built":
+        index.build(imports)
+        return index
+    write_snapshot(tmp_path / "scan.snapshot", imports=imports)
+    snapshot = Snapshot(tmp_path / "scan.snapshot")
+    index.attach(snapshot, ImportStore.deferred(snapshot.paths(), snapshot.record))
+    return index
+
+
+@pytest.mark.parametrize("query, match, expected", [
+    ("os", "exact", [("os", "a.py", "standard")]),
+    ("os", "submodule", [("os", "a.py", "standard"), ("os.path", "b.py", "standard")]),
+    ("models", "submodule", [("models", "b.py", "custom"), ("models.graph_model", "a.py", "custom")]),
+    ("models.", "prefix", [("models.graph_model", "a.py", "custom")]),
+    ("models", "prefix", [("models", "b.py", "custom"), ("models.graph_model", "a.py", "custom"), ("modelsx", "b.py", "custom")]),
+    ("missing", "prefix", []),
+    ("os", "unknown", [("os", "a.py", "standard")]),
+])
+def test_find_libraries(index, query, match, expected):
+    assert list(index.find_libraries(query, match=match)) == expected
+
+
+def test_find_modules(index):
+    assert list(index.find_modules("Path")) == [("Path", "a.py", "standard"), ("Path", "b.py", "custom"), ("Path", "c.py", "standard")]
+    assert list(index.find_modules("Pa", match="prefix")) == [("Path", "a.py", "standard"), ("Path", "b.py", "custom"), ("Path", "c.py", "standard")]
+
+
+def test_update_and_remove(index):
+    index.update("c.py", {"standard": {"json": ["loads"]}, "custom": {}})
+    assert list(index.find_libraries("pathlib")) == [("pathlib", "a.py", "standard")]
+    assert list(index.find_libraries("json")) == [("json", "c.py", "standard")]
+    assert list(index.find_libraries("j", match="prefix")) == [("json", "c.py", "standard")]
+
+    index.update("a.py", None)
+    assert list(index.find_libraries("os")) == []
+    assert "os" not in index.libraries
+    assert list(index.find_modules("Path")) == [("Path", "b.py", "custom")]
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {"first.py": "import os\nfrom pathlib import Path\nfrom os.path import join\n", "second.py": "from pathlib import Path, PurePath\nimport os\n"}
+
+
+@pytest.fixture
+def dependency_model(scan) -> DependencyModel:
+    return scan()
+
+
+def test_dependency_model_queries_match_a_full_scan(dependency_model):
+    expected = [
+        {"file": path, "import": "os", "type": import_type}
+        for path, data in dependency_model.imports.items()
+        for import_type in ("standard", "custom") if "os" in data[import_type]
+    ]
+    assert list(dependency_model.find_by_library("os")) == expected
+    assert len(list(dependency_model.find_by_module("Path"))) == 2
+    assert sorted(dependency_model.find_by_library("os", file_only=True, match="submodule")) == sorted(dependency_model.imports)
+
+
+def test_dependency_model_reindexes_replaced_imports(dependency_model):
+    dependency_model.imports = {"x.py": {"standard": {"re": []}, "custom": {}}}
+    assert list(dependency_model.find_by_library("re", file_only=True)) == ["x.py"]
+    assert list(dependency_model.find_by_library("os")) == []
+
+
+def test_dependency_model_reindexes_files_written_in_place(dependency_model):
+    path = next(path for path in dependency_model.imports if path.endswith("first.py"))
+    dependency_model.imports[path] = {"standard": {"json": []}, "custom": {}}
+    assert list(dependency_model.find_by_library("json", file_only=True)) == [path]
+    assert path not in list(dependency_model.find_by_library("os", file_only=True))
+
+    del dependency_model.imports[path]
+    assert list(dependency_model.find_by_library("json")) == []
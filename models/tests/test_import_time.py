@@ -0,0 +1,56 @@
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+
+REPOSITORY_ROOT: Path = Path(__file__).resolve().parents[2]
+PLOTTING_MODULES: list = ["matplotlib", "seaborn", "pandas", "networkx"]
+# generous, so that only a heavy dependency creeping back into the import path trips it
+IMPORT_BUDGET_SECONDS: float = 1.5
+
+
+def run_in_subprocess(code: str) -> dict:
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPOSITORY_ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_scan_and_query_do_not_import_plotting_stack(tmp_path):
+    (tmp_path / "a.py").write_text("import os\nfrom b import run\n")
+    (tmp_path / "b.py").write_text("import a\n")
+    code: str = f"""
+import sys, json
+from time import perf_counter
+start = perf_counter()
+from models.graph_model import GraphModel
+from models.import_model import ImportModel
+from models.dependency_model import DependencyModel
+from models.file_reader_model import FileReaderModel
+from models.file_collector_model import FileCollectorModel
+elapsed = perf_counter() - start
+model = DependencyModel(
+    graph_class=GraphModel, file_collector=FileCollectorModel(), file_import_class=ImportModel,
+    file_reader_class=FileReaderModel, root_directory={tmp_path.as_posix()!r}, autobuild=True,
+)
+list(model.find_by_library("os"))
+model.find_import_cycles()
+model.graph_instance.get_adjacency_arrays()
+model.export_graph({(tmp_path / "edges.graphml.gz").as_posix()!r})
+model.export_imports({(tmp_path / "imports.csv").as_posix()!r})
+print(json.dumps({{"elapsed": elapsed, "loaded": [name for name in {PLOTTING_MODULES!r} if name in sys.modules]}}))
+"""
+    result: dict = run_in_subprocess(code)
+    assert result["loaded"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_plotting_stack_loads_on_demand():
+    code: str = """
+import sys, json
+from models.graph_model import GraphModel
+graph = GraphModel(data=[{"file": "a.py", "import": "os"}])
+graph.list_edges()
+print(json.dumps({"loaded": [name for name in ("pandas", "matplotlib") if name in sys.modules]}))
+"""
+    assert run_in_subprocess(code)["loaded"] == ["pandas"]
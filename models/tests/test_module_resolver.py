@@ -0,0 +1,107 @@
+import pytest
+from ..module_resolver_model import ModuleResolverModel
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {
+        "app/__init__.py": "from .core import engine\nfrom . import utils\n",
+        "app/core/__init__.py": "",
+        "app/core/engine.py": "from ..utils import helper\nimport app.utils\nimport os\n",
+        "app/utils.py": "from app.core.engine import run\n",
+        "main.py": "import app\nfrom app.core import engine as e, missing\nfrom .. import outside\n",
+    }
+
+
+@pytest.fixture
+def resolver(project) -> ModuleResolverModel:
+    root: str = project.as_posix()
+    resolver = ModuleResolverModel(root_directory=root)
+    resolver.build([f"{root}/{name}" for name in ["app/__init__.py", "app/core/__init__.py", "app/core/engine.py", "app/utils.py", "main.py"]])
+    return resolver
+
+
+@pytest.mark.parametrize("file, statement, expected", [
+    ("app/__init__.py", "from .core import engine", ["app/core/engine.py"]),
+    ("app/__init__.py", "from . import utils", ["app/utils.py"]),
+    ("app/core/engine.py", "from ..utils import helper", ["app/utils.py"]),
+    ("app/core/engine.py", "from . import *", ["app/core/__init__.py"]),
+    ("app/core/engine.py", "import app.utils", ["app/utils.py"]),
+    ("app/core/engine.py", "import os", []),
+    ("main.py", "from app.core import engine, missing", ["app/core/engine.py", "app/core/__init__.py"]),
+    ("main.py", "from .. import outside", []),
+    ("main.py", "not an import", []),
+])
+def test_resolve(resolver, project, file, statement, expected):
+    root: str = project.as_posix()
+    assert resolver.resolve(f"{root}/{file}", statement) == [f"{root}/{name}" for name in expected]
+
+
+def test_module_of(resolver, project):
+    assert resolver.module_of(f"{project.as_posix()}/app/core/__init__.py") == "app.core"
+    assert resolver.module_of(f"{project.as_posix()}/app/core/engine.py") == "app.core.engine"
+
+
+def test_package_root_resolves_imports_spelled_with_its_name(tmp_path):
+    package = tmp_path / "toolkit"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "sub" / "a.py").write_text("")
+    resolver = ModuleResolverModel(root_directory=package.as_posix())
+    resolver.build([(package / "__init__.py").as_posix(), (package / "sub" / "a.py").as_posix()])
+    assert resolver.resolve((package / "__init__.py").as_posix(), "from toolkit.sub import a") == [(package / "sub" / "a.py").as_posix()]
+
+
+def test_dependency_model_file_graph(scan, project):
+    root: str = project.as_posix()
+    model = scan()
+    dependencies: dict = model.resolve_file_dependencies()
+    assert dependencies[f"{root}/app/core/engine.py"] == [f"{root}/app/utils.py"]
+    assert dependencies[f"{root}/main.py"] == [f"{root}/app/__init__.py", f"{root}/app/core/__init__.py", f"{root}/app/core/engine.py"]
+
+    model.build_file_graph(remove_from_root_path=f"{root}/")
+    assert model.file_graph_instance.graph.has_edge("app/utils.py", "app/core/engine.py")
+
+    (project / "app" / "helpers.py").write_text("")
+    (project / "app" / "utils.py").write_text("from app.core.engine import run\nfrom . import helpers\n")
+    model.poll_changes()
+    assert model.file_dependencies[f"{root}/app/utils.py"] == [f"{root}/app/core/engine.py", f"{root}/app/helpers.py"]
+
+
+def test_dependency_model_import_cycles(scan, project):
+    root: str = project.as_posix()
+    model = scan()
+    assert model.find_import_cycles() == [{
+        "component": [f"{root}/app/core/engine.py", f"{root}/app/utils.py"],
+        "shortest_cycle": [f"{root}/app/core/engine.py", f"{root}/app/utils.py", f"{root}/app/core/engine.py"],
+    }]
+
+
+def test_dependency_model_transitive_queries(scan, project):
+    root: str = project.as_posix()
+    model = scan()
+    assert model.transitive_dependencies(f"{root}/main.py") == [
+        f"{root}/app/__init__.py", f"{root}/app/core/__init__.py", f"{root}/app/core/engine.py", f"{root}/app/utils.py",
+    ]
+    assert model.transitive_dependents(f"{root}/app/core/__init__.py") == [f"{root}/main.py"]
+    assert model.depends_on(f"{root}/app/utils.py", f"{root}/app/core/engine.py")
+
+    (project / "app" / "utils.py").write_text("from app.core.engine import run\nfrom app import core\n")
+    model.poll_changes()
+    assert model.transitive_dependents(f"{root}/app/core/__init__.py") == [
+        f"{root}/app/__init__.py", f"{root}/app/core/engine.py", f"{root}/app/utils.py", f"{root}/main.py",
+    ]
+
+
+@pytest.mark.parametrize("changed, include_changed, expected", [
+    (["app/utils.py"], True, ["app/__init__.py", "app/core/engine.py", "app/utils.py", "main.py"]),
+    (["app/core/__init__.py", "README.md", "deleted.py"], True, ["app/core/__init__.py", "main.py"]),
+    (["./main.py"], False, []),
+    ([], True, []),
+])
+def test_dependency_model_impacted_files(scan, project, changed, include_changed, expected):
+    root: str = project.as_posix()
+    model = scan()
+    assert model.impacted_files(changed, include_changed=include_changed) == [f"{root}/{name}" for name in expected]
+    assert model.impacted_files([f"{root}/{name}" for name in changed], include_changed=include_changed) == [f"{root}/{name}" for name in expected]
+    assert model.impacted_files([f"{project.name}/{name}" for name in changed], include_changed=include_changed, relative_to=project.parent) == [f"{root}/{name}" for name in expected]
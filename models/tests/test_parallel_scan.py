@@ -0,0 +1,43 @@
+import pytest
+from ..import_model import ImportModel
+
+
+class UpperCaseImportModel(ImportModel):
+    def get_libraries(self, as_json=False, indent=4):
+        libraries: dict = super().get_libraries(as_json=False)
+        return {kind: {root.upper(): names for root, names in data.items()} for kind, data in libraries.items()}
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {
+        f"package_{index % 3}/module_{index}.py": f"import os\nfrom package_{(index + 1) % 3} import module_{index + 1}\n"
+        for index in range(12)
+    }
+
+
+@pytest.mark.parametrize("workers, executor_type", [
+    (4, "thread"),
+    (3, "process"),
+    (0, "thread"),
+    (2, "unknown"),
+])
+def test_parallel_scan_matches_sequential_scan(scan, workers, executor_type):
+    sequential = scan()
+    parallel = scan(workers=workers, executor_type=executor_type)
+    assert list(parallel.imports.items()) == list(sequential.imports.items())
+    assert parallel.executor_type in ["thread", "process"]
+
+
+def test_process_pool_uses_pluggable_classes(scan):
+    model = scan(workers=2, executor_type="process", file_import_class=UpperCaseImportModel)
+    assert all("OS" in data["standard"] for data in model.imports.values())
+
+
+@pytest.mark.parametrize("workers, executor_type", [
+    (1, "thread"),
+    (2, "thread"),
+])
+def test_overridden_classes_keep_per_file_models(scan, workers, executor_type):
+    model = scan(workers=workers, executor_type=executor_type, file_import_class=UpperCaseImportModel)
+    assert all("OS" in data["standard"] for data in model.imports.values())
@@ -0,0 +1,102 @@
+import pytest
+from typing import Callable
+from concurrent.futures import ProcessPoolExecutor
+from ..graph_model import GraphModel
+from ..import_model import ImportModel
+from ..dependency_model import DependencyModel
+from ..file_reader_model import FileReaderModel
+from ..file_collector_model import FileCollectorModel
+from ..partial_index_model import PartialIndexModel
+from utilities.sharding import shard_of
+
+
+PARAMETERS: dict = {
+    "graph_class": GraphModel,
+    "file_import_class": ImportModel,
+    "file_reader_class": FileReaderModel,
+}
+
+
+@pytest.fixture
+def project_files() -> dict:
+    files: dict = {
+        f"{package}{nested}/module_{number}.py": f"import json\nfrom {package} import module_{number}\n"
+        for package in ("alpha", "beta", "gamma") for nested in ("", "/inner") for number in range(4)
+    }
+    return {**files, "setup.py": "from pathlib import Path\n", "build/generated.py": "import os\n"}
+
+
+def scan_shard(root: str, shard_index: int, shard_count: int, strategy: str, output: str) -> str:
+    PartialIndexModel.scan(
+        root, shard_index, shard_count, strategy,
+        file_collector=FileCollectorModel(exclude_directories=["build"]), **PARAMETERS
+    ).save(output)
+    return output
+
+
+@pytest.fixture
+def full_scan(scan) -> Callable[[], DependencyModel]:
+    def build() -> DependencyModel:
+        return scan(file_collector=FileCollectorModel(exclude_directories=["build"]))
+    return build
+
+
+@pytest.mark.parametrize("strategy", ["hash", "subtree"])
+def test_shards_scanned_in_processes_merge_into_full_index(full_scan, project, tmp_path_factory, strategy):
+    output = tmp_path_factory.mktemp("partials")
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        paths = list(executor.map(
+            scan_shard,
+            [project.as_posix()] * 3, range(3), [3] * 3, [strategy] * 3,
+            [(output / f"part-{shard}.json").as_posix() for shard in range(3)],
+        ))
+    partials = [PartialIndexModel.load(path) for path in paths]
+
+    assert sum(len(partial.files) for partial in partials) == 25
+    merged = PartialIndexModel.merge_all(partials)
+    assert merged.is_complete()
+    assert "build/generated.py" not in merged.files
+
+    expected = full_scan()
+    model = merged.to_dependency_model(project.as_posix(), file_collector=FileCollectorModel(), **PARAMETERS)
+    assert model.imports == expected.imports
+    assert model.import_statements == expected.import_statements
+    assert sorted(model.find_by_library("json", file_only=True)) == sorted(expected.find_by_library("json", file_only=True))
+    assert model.poll_changes().modified_files == []
+
+
+def test_subtree_shards_keep_directories_together(project):
+    for shard in range(3):
+        partial = PartialIndexModel.scan(project.as_posix(), shard, 3, "subtree", **PARAMETERS)
+        for path in partial.files:
+            assert shard_of(path.split("/")[0], 3) == shard
+
+
+def test_merge_is_associative_commutative_and_idempotent(project):
+    first, second, third = (PartialIndexModel.scan(project.as_posix(), shard, 3, **PARAMETERS) for shard in range(3))
+    conflicting = second.model_copy(update={
+        "files": {path: {**entry, "statements": ["import csv"]} for path, entry in list(second.files.items())[:2]}
+    })
+
+    assert first.merge(second).merge(third) == first.merge(second.merge(third))
+    assert first.merge(second) == second.merge(first)
+    assert second.merge(conflicting) == conflicting.merge(second)
+    assert first.merge(first) == first
+    assert first.merge(second).merge(second) == first.merge(second)
+    assert first.missing_shards() == [1, 2]
+
+
+def test_incompatible_partials_are_rejected(project):
+    hashed = PartialIndexModel.scan(project.as_posix(), 0, 2, **PARAMETERS)
+    with pytest.raises(ValueError, match="shard_count"):
+        hashed.merge(PartialIndexModel.scan(project.as_posix(), 0, 3, **PARAMETERS))
+    with pytest.raises(ValueError, match="shard_index"):
+        PartialIndexModel.scan(project.as_posix(), 2, 2, **PARAMETERS)
+
+
+def test_save_and_load_round_trip(full_scan, tmp_path_factory):
+    partial = PartialIndexModel.from_model(full_scan())
+    path = tmp_path_factory.mktemp("partials") / "full.json"
+    partial.save(path)
+    assert PartialIndexModel.load(path) == partial
+    assert partial.is_complete()
@@ -0,0 +1,120 @@
+import os
+import sys
+from typing import Callable, ClassVar, List
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from json import loads, dumps
+from ..scan_cache_model import ScanCacheModel
+from ..dependency_model import DependencyModel
+from ..file_reader_model import FileReaderModel
+
+
+class CountingFileReaderModel(FileReaderModel):
+    read_paths: ClassVar[List[str]] = []
+
+    def get_imports(self):
+        CountingFileReaderModel.read_paths.append(str(self.file_path))
+        return super().get_imports()
+
+
+@pytest.fixture
+def cache(tmp_path) -> ScanCacheModel:
+    return ScanCacheModel(cache_path=str(tmp_path / "cache" / "scan.json"))
+
+
+@pytest.fixture
+def cached_scan(scan, cache) -> Callable[[], DependencyModel]:
+    def build() -> DependencyModel:
+        CountingFileReaderModel.read_paths = []
+        return scan(file_reader_class=CountingFileReaderModel, scan_cache=cache)
+    return build
+
+
+def test_lookup_miss_store_and_hit(project, cache):
+    path: str = str(project / "a.py")
+    cache.load()
+    assert cache.lookup(path) is None
+    cache.store(path, ["import os"])
+    assert cache.lookup(path) == ["import os"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_touched_file_with_same_content_is_a_hit(project, cache):
+    path: str = str(project / "b.py")
+    cache.load()
+    cache.lookup(path)
+    cache.store(path, ["import json"])
+    status = os.stat(path)
+    os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+    assert cache.lookup(path) == ["import json"]
+    assert cache.entries[path]["mtime_ns"] == status.st_mtime_ns + 10**9
+
+
+def test_version_mismatch_discards_entries(project, cache):
+    cache.load()
+    cache.store(str(project / "a.py"), ["import os"])
+    cache.save()
+
+    data: dict = loads(open(cache.cache_path).read())
+    data["extractor"] = -1
+    open(cache.cache_path, "w").write(dumps(data))
+
+    cache.load()
+    assert cache.entries == {}
+
+
+def test_namespace_mismatch_discards_entries(project, cache):
+    cache.load(namespace="reader.A")
+    cache.store(str(project / "a.py"), ["import os"])
+    cache.save()
+    cache.load(namespace="reader.B")
+    assert cache.entries == {}
+
+
+def test_warm_scan_only_parses_changed_and_added_files(project, cache, cached_scan):
+    cold = cached_scan()
+    assert len(CountingFileReaderModel.read_paths) == 2
+
+    warm = cached_scan()
+    assert CountingFileReaderModel.read_paths == []
+    assert warm.imports == cold.imports
+
+    (project / "b.py").write_text("import json\nimport sys\n")
+    (project / "c.py").write_text("import re\n")
+    os.remove(project / "a.py")
+    changed = cached_scan()
+
+    assert sorted(os.path.basename(path) for path in CountingFileReaderModel.read_paths) == ["b.py", "c.py"]
+    assert sorted(os.path.basename(path) for path in cache.entries) == ["b.py", "c.py"]
+    assert "sys" in changed.imports[f"{project.as_posix()}/b.py"]["standard"]
+
+
+def test_cold_scan_hashes_the_bytes_the_reader_read(project, cache, cached_scan, monkeypatch):
+    def fail(file_path):
+        raise AssertionError(f"{file_path} was read again to be hashed")
+
+    monkeypatch.setattr(ScanCacheModel, "_ScanCacheModel__digest", staticmethod(fail))
+    cached_scan()
+    path: str = str(project / "b.py")
+    monkeypatch.undo()
+    assert cache.entries[path]["digest"] == ScanCacheModel._ScanCacheModel__digest(path)
+
+
+def test_concurrent_lookups_and_stores_keep_every_count(tmp_path, cache):
+    paths = []
+    for index in range(200):
+        (tmp_path / f"m{index}.py").write_text(f"import m{index - 1}\n")
+        paths.append(str(tmp_path / f"m{index}.py"))
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        cache.load()
+        for _ in range(5):
+            with ThreadPoolExecutor(8) as executor:
+                for path, imports in zip(paths, executor.map(cache.lookup, paths)):
+                    if imports is None:
+                        executor.submit(cache.store, path, ["import os"])
+    finally:
+        sys.setswitchinterval(interval)
+    assert (cache.hits, cache.misses) == (800, 200)
+    assert sorted(cache.entries) == sorted(paths)
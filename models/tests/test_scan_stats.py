@@ -0,0 +1,60 @@
+import pytest
+from json import loads
+from ..scan_cache_model import ScanCacheModel
+from ..scan_stats_model import ScanStatsModel
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {"a.py": "import os\nfrom b import run\n", "b.py": "import json\n", "broken.py": "import re\ndef broken(:\n"}
+
+
+def test_scan_records_counters_and_stages(scan, project):
+    model = scan(autobuild=True)
+    stats: ScanStatsModel = model.stats
+    assert (stats.files_walked, stats.files_parsed, stats.files_skipped) == (3, 3, 0)
+    assert stats.bytes_read == sum(path.stat().st_size for path in project.iterdir())
+    assert stats.parse_failures == 1
+    assert stats.failed_files == [f"{project.as_posix()}/broken.py"]
+    assert stats.edges_emitted == model.graph_instance.core.number_of_edges()
+    assert stats.classification_hits + stats.classification_misses > 0
+    assert stats.peak_memory >= 0
+    assert {"scan", "collect_files", "read", "classify", "index", "build_graph"} <= set(stats.stages)
+    assert stats.profile_report is None and stats.memory_report is None
+
+
+def test_cached_files_are_skipped(scan, tmp_path):
+    cache_path: str = str(tmp_path / "scan.json")
+    scan(scan_cache=ScanCacheModel(cache_path=cache_path))
+    stats: ScanStatsModel = scan(scan_cache=ScanCacheModel(cache_path=cache_path)).stats
+    assert (stats.files_walked, stats.files_parsed, stats.files_skipped, stats.bytes_read) == (3, 0, 3, 0)
+    assert {"cache_load", "cache_save"} <= set(stats.stages)
+
+
+def test_profile_and_memory_capture(scan, tmp_path):
+    stats: ScanStatsModel = scan(profile=True, trace_memory=True).stats
+    assert "cumulative" in stats.profile_report
+    assert stats.memory_report
+    assert stats.traced_peak_memory > 0
+    stats.dump_profile(tmp_path / "scan.prof")
+    assert (tmp_path / "scan.prof").stat().st_size > 0
+
+
+def test_json_dump(scan, tmp_path):
+    stats: ScanStatsModel = scan().stats
+    assert loads(stats.to_json())["files_walked"] == 3
+    stats.save(tmp_path / "stats.json")
+    assert loads((tmp_path / "stats.json").read_text())["stages"].keys() == stats.stages.keys()
+
+
+def test_dump_profile_requires_capture():
+    with pytest.raises(RuntimeError):
+        ScanStatsModel().dump_profile("unused.prof")
+
+
+def test_stage_accumulates():
+    stats = ScanStatsModel()
+    with stats.stage("work"):
+        pass
+    stats.add_time("work", 1.0)
+    assert stats.stages["work"] >= 1.0
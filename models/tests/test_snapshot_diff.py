@@ -0,0 +1,71 @@
+import pytest
+from pathlib import Path
+from typing import Callable, Optional
+from ..snapshot_diff_model import SnapshotDiffModel
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {"a.py": "import os\nimport b\n", "b.py": "import json\n", "c.py": "import re\n", "d.py": "import sys\n"}
+
+
+@pytest.fixture
+def snapshot(scan, project) -> Callable[..., str]:
+    """Scans 'root' (the project by default), resolves its file dependencies and saves a snapshot to 'file_path'."""
+    def save(file_path: Path, root: Optional[Path] = None) -> str:
+        model = scan(root_directory=(root or project).as_posix())
+        model.resolve_file_dependencies()
+        model.save_snapshot(file_path)
+        return str(file_path)
+    return save
+
+
+def test_compare(snapshot, project, tmp_path):
+    base: str = snapshot(tmp_path / "base.snapshot")
+    (project / "b.py").write_text("import json\nimport a\nimport pydantic\n")
+    (project / "c.py").unlink()
+    (project / "e.py").write_text("import re\n")
+    head: str = snapshot(tmp_path / "head.snapshot")
+
+    diff = SnapshotDiffModel.compare(base, head)
+    assert diff.added_files == ["e.py"]
+    assert diff.removed_files == ["c.py"]
+    assert diff.modified_files == ["b.py"]
+    assert diff.added_edges == [("b.py", "a", "custom"), ("b.py", "pydantic", "standard"), ("e.py", "re", "standard")]
+    assert diff.removed_edges == [("c.py", "re", "standard")]
+    assert diff.added_dependencies == [("b.py", "a.py")]
+    assert diff.new_libraries == ["a", "pydantic"]
+    assert diff.new_third_party_libraries == ["pydantic"]
+    assert diff.new_cycles == [{"component": ["a.py", "b.py"], "shortest_cycle": ["a.py", "b.py", "a.py"]}]
+    assert not diff.is_empty()
+
+
+def test_checkouts_in_different_directories(snapshot, project, tmp_path):
+    base: str = snapshot(tmp_path / "base.snapshot")
+    checkout = tmp_path / "checkout"
+    checkout.mkdir()
+    for path in project.iterdir():
+        (checkout / path.name).write_text(path.read_text())
+    assert SnapshotDiffModel.compare(base, snapshot(tmp_path / "same.snapshot", checkout)).is_empty()
+
+    (checkout / "d.py").write_text("import sys\nimport json\n")
+    diff = SnapshotDiffModel.compare(base, snapshot(tmp_path / "head.snapshot", checkout))
+    assert diff.added_files == [] and diff.removed_files == []
+    assert diff.modified_files == ["d.py"]
+    assert diff.added_edges == [("d.py", "json", "standard")]
+
+
+def test_dependencies_onto_changed_files_are_compared(snapshot, project, tmp_path):
+    (project / "a.py").write_text("import os\nimport b\nimport f\n")
+    base: str = snapshot(tmp_path / "base.snapshot")
+    (project / "f.py").write_text("")
+    diff = SnapshotDiffModel.compare(base, snapshot(tmp_path / "head.snapshot"))
+    assert diff.added_files == ["f.py"]
+    assert diff.modified_files == []
+    assert diff.added_dependencies == [("a.py", "f.py")]
+
+
+def test_unchanged_scans_have_an_empty_diff(snapshot, tmp_path):
+    diff = SnapshotDiffModel.compare(snapshot(tmp_path / "one.snapshot"), snapshot(tmp_path / "two.snapshot"))
+    assert diff.is_empty()
+    assert diff == SnapshotDiffModel()
@@ -0,0 +1,66 @@
+import time
+import pytest
+from ..dependency_model import DependencyModel
+from utilities.snapshot import Snapshot
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {
+        "pkg/__init__.py": "",
+        "pkg/a.py": "import os\nfrom pkg import b\nimport sys, json\n",
+        "pkg/b.py": "from pathlib import Path, PurePath\n",
+    }
+
+
+def test_from_snapshot_matches_scan(scan, model_classes, project, tmp_path):
+    scanned = scan()
+    scanned.resolve_file_dependencies()
+    scanned.save_snapshot(tmp_path / "scan.snapshot")
+
+    loaded = DependencyModel.from_snapshot(tmp_path / "scan.snapshot", autobuild=True, **model_classes)
+    assert loaded.root_directory == project.as_posix()
+    assert loaded.imports == scanned.imports
+    assert loaded.import_statements == scanned.import_statements
+    assert loaded.file_dependencies == scanned.file_dependencies
+    assert list(loaded.find_by_library("pathlib", file_only=True)) == [f"{project.as_posix()}/pkg/b.py"]
+    assert loaded.graph_instance is not None
+    assert loaded.stats.files_walked == 0
+
+
+def test_snapshot_model_picks_up_later_changes(scan, model_classes, project, tmp_path):
+    scan().save_snapshot(tmp_path / "scan.snapshot")
+    (project / "pkg" / "b.py").write_text("import re\n")
+    time.sleep(0.01)
+
+    loaded = DependencyModel.from_snapshot(tmp_path / "scan.snapshot", **model_classes)
+    event = loaded.poll_changes()
+    assert event.modified_files == [f"{project.as_posix()}/pkg/b.py"]
+    assert list(loaded.find_by_library("re", file_only=True)) == [f"{project.as_posix()}/pkg/b.py"]
+
+
+def test_from_snapshot_answers_from_the_stored_arrays(scan, model_classes, project, tmp_path, monkeypatch):
+    scanned = scan()
+    scanned.resolve_file_dependencies()
+    scanned.save_snapshot(tmp_path / "scan.snapshot")
+    read, record = [], Snapshot.record
+    monkeypatch.setattr(Snapshot, "record", lambda self, file_index: read.append(file_index) or record(self, file_index))
+
+    loaded = DependencyModel.from_snapshot(tmp_path / "scan.snapshot", **model_classes)
+    a, b = f"{project.as_posix()}/pkg/a.py", f"{project.as_posix()}/pkg/b.py"
+    for model in (scanned, loaded):
+        assert list(model.find_by_library("pathlib", file_only=True)) == [b]
+        assert list(model.find_by_module("Path", match="prefix")) == [{"file": b, "module": "Path", "type": "standard"}]
+        assert model.transitive_dependents(b) == [a]
+        assert model.impacted_files([b]) == [a, b]
+    assert read == []
+
+    (project / "pkg" / "b.py").write_text("import re\n")
+    (project / "pkg" / "a.py").write_text("import os\n")
+    time.sleep(0.01)
+    for model in (scanned, loaded):
+        model.poll_changes()
+        assert list(model.find_by_library("pathlib", file_only=True)) == []
+        assert list(model.find_by_library("re", file_only=True)) == [b]
+        assert model.transitive_dependents(b) == []
+    assert loaded.imports == scanned.imports
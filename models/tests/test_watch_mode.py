@@ -0,0 +1,122 @@
+import pytest
+from functools import partial
+from typing import Callable
+from ..dependency_model import DependencyModel
+from ..file_reader_model import FileReaderModel
+from ..abstract_models.abstract_graph_model import AbstractGraphModel
+
+
+class StaticGraphModel(AbstractGraphModel):
+    builds = 0
+
+    def __init__(self, data, top_n_imports=0):
+        StaticGraphModel.builds += 1
+        self.data = data
+
+    def display(self) -> None:
+        pass
+
+    def save(self, local_save_path: str = None) -> None:
+        pass
+
+
+class EditingFileReaderModel(FileReaderModel):
+    def get_imports(self):
+        imports = super().get_imports()
+        with open(self.file_path, "a") as file:
+            file.write("import json\n")
+        return imports
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {"watched_alpha.py": "from pathlib import PurePosixPath\n", "watched_beta.py": "import os\n"}
+
+
+@pytest.fixture
+def build(scan) -> Callable[..., DependencyModel]:
+    return partial(scan, import_type="standard", autobuild=True)
+
+
+def test_poll_without_changes_returns_empty_event(build):
+    model = build()
+    events = []
+    model.subscribe(events.append)
+    assert model.poll_changes().is_empty()
+    assert events == []
+
+
+def test_modified_file_patches_imports_index_and_graph(project, build):
+    model = build()
+    alpha: str = f"{project.as_posix()}/watched_alpha.py"
+    events = []
+    model.subscribe(events.append)
+
+    (project / "watched_alpha.py").write_text("from pathlib import PureWindowsPath\nimport json\n")
+    event = model.poll_changes()
+
+    assert events == [event]
+    assert event.modified_files == [alpha]
+    assert event.added_edges == [(alpha, "*"), (alpha, "PureWindowsPath")]
+    assert event.removed_edges == [(alpha, "PurePosixPath")]
+    assert "json" in model.imports[alpha]["standard"]
+    assert list(model.find_by_module("PurePosixPath")) == []
+    assert list(model.find_by_module("PureWindowsPath", file_only=True)) == [alpha]
+    assert model.graph_instance.graph.has_edge(alpha, "PureWindowsPath")
+    assert not model.graph_instance.graph.has_edge(alpha, "PurePosixPath")
+    assert "PureWindowsPath" in model.graph_instance.imports
+
+
+def test_added_and_removed_files(project, build):
+    model = build()
+    beta: str = f"{project.as_posix()}/watched_beta.py"
+    gamma: str = f"{project.as_posix()}/watched_gamma.py"
+
+    (project / "watched_beta.py").unlink()
+    (project / "watched_gamma.py").write_text("from shutil import copyfileobj\n")
+    event = model.poll_changes()
+
+    assert event.added_files == [gamma]
+    assert event.removed_files == [beta]
+    assert (beta, "*") in event.removed_edges
+    assert beta not in model.imports
+    assert list(model.find_by_library("os")) == []
+    assert model.graph_instance.graph.has_edge(gamma, "copyfileobj")
+
+
+def test_refresh_paths_and_unsubscribe(project, build):
+    model = build()
+    events = []
+    model.subscribe(events.append)
+    model.unsubscribe(events.append)
+
+    (project / "watched_beta.py").write_text("import os\nfrom sys import argv\n")
+    event = model.refresh_paths([f"{project.as_posix()}/watched_beta.py"])
+    assert event.added_edges == [(f"{project.as_posix()}/watched_beta.py", "argv")]
+    assert events == []
+
+
+def test_watch_runs_bounded_cycles(project, build):
+    model = build()
+    (project / "watched_beta.py").write_text("import os\nimport re\n")
+    model.watch(interval=0, max_cycles=2)
+    assert "re" in model.imports[f"{project.as_posix()}/watched_beta.py"]["standard"]
+
+
+def test_graph_without_incremental_support_is_rebuilt(project, build):
+    model = build(graph_class=StaticGraphModel)
+    builds: int = StaticGraphModel.builds
+    (project / "watched_beta.py").write_text("import os\nfrom re import compile\n")
+    model.poll_changes()
+    assert StaticGraphModel.builds == builds + 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_files_edited_while_being_read_are_found_again(scan, workers):
+    model = scan(file_reader_class=EditingFileReaderModel, workers=workers)
+    changed, removed = model.find_changes()
+    assert sorted(changed) == sorted(model.imports) and removed == []
+
+    model.file_reader_class = FileReaderModel
+    model.refresh_paths(changed)
+    assert model.find_changes() == ([], [])
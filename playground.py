@@ -19,6 +19,10 @@ def play():
         # exclude_end_characters="__",                              # [Optional] exclude files ending with particular characters
         import_type=imports_type,                                   # [Optional] options: custom, standard, all 
         # remove_from_root_path="",                                 # [Optional] shorted the path on the displayed matrix PNG, e.g.: "C:/Users/.../Desktop/"
+        # workers=4,                                              # [Optional] number of parallel workers, 0 uses all CPU cores (default: 1)
+        # executor_type="process",                                # [Optional] options: thread, process
+        # profile=True,                                           # [Optional] capture a cProfile report in dependency_collector.stats
+        # trace_memory=True,                                      # [Optional] capture a tracemalloc report in dependency_collector.stats
         autobuild=True,                                             # [Optional] can be skipped, but the it obligatory to build it by invoking build_graph()
     )
 
@@ -28,3 +32,5 @@ def play():
         img_title="Adjacency Matrix",       
         local_save_path=""                                          # [Oblicatory] If you want to save a file locally, a full path must be provided (Path or str)               
     )
+
+    # print(dependency_collector.stats.to_json())                 # [Optional] per-stage timings and counters of the scan
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+from typing import List, Optional
+from argparse import ArgumentParser, Namespace
+from models.graph_model import GraphModel
+from models.import_model import ImportModel
+from models.scan_cache_model import ScanCacheModel
+from models.file_reader_model import FileReaderModel
+from models.file_collector_model import FileCollectorModel
+from models.partial_index_model import PartialIndexModel
+from utilities.sharding import SHARD_STRATEGIES
+
+
+def parse_arguments(arguments: Optional[List[str]] = None) -> Namespace:
+    parser = ArgumentParser(
+        description="Scan a tree in shards (e.g. one CI job per shard) and merge the partial indexes. Example: "
+                    "python shard.py scan --shard 0 --shards 4 --output part-0.json; "
+                    "python shard.py merge part-*.json --snapshot index.snapshot"
+    )
+    commands = parser.add_subparsers(dest="action", required=True)
+
+    scan = commands.add_parser("scan", help="scan one shard and write its partial index")
+    scan.add_argument("--root", default=Path.cwd().as_posix(), help="project root directory to scan (default: current directory)")
+    scan.add_argument("--shard", type=int, required=True, help="index of the shard to scan, from 0")
+    scan.add_argument("--shards", type=int, required=True, help="total number of shards")
+    scan.add_argument("--strategy", choices=SHARD_STRATEGIES, default="hash", help="split by file path hash or by subtree")
+    scan.add_argument("--depth", type=int, default=1, help="directory depth of the subtrees (subtree strategy)")
+    scan.add_argument("--cache", default=None, help="scan cache file; reused between runs to skip unchanged files")
+    scan.add_argument("--workers", type=int, default=1, help="number of parallel workers, 0 uses all CPU cores")
+    scan.add_argument("--output", required=True, help="partial index file to write")
+
+    merge = commands.add_parser("merge", help="merge partial indexes")
+    merge.add_argument("inputs", nargs="+", help="partial index files")
+    merge.add_argument("--output", default=None, help="merged partial index file to write")
+    merge.add_argument("--snapshot", default=None, help="binary snapshot to write (see DependencyModel.from_snapshot)")
+    merge.add_argument("--root", default=Path.cwd().as_posix(), help="root directory the snapshot paths are relative to")
+    merge.add_argument("--allow-partial", action="store_true", help="merge even when some shards are missing")
+    return parser.parse_args(arguments)
+
+
+def scan(options: Namespace) -> PartialIndexModel:
+    partial: PartialIndexModel = PartialIndexModel.scan(
+        options.root,
+        shard_index=options.shard,
+        shard_count=options.shards,
+        shard_strategy=options.strategy,
+        shard_depth=options.depth,
+        graph_class=GraphModel,
+        file_import_class=ImportModel,
+        file_reader_class=FileReaderModel,
+        file_collector=FileCollectorModel(),
+        scan_cache=ScanCacheModel(cache_path=options.cache) if options.cache else None,
+        workers=options.workers,
+    )
+    partial.save(options.output)
+    return partial
+
+
+def merge(options: Namespace) -> PartialIndexModel:
+    merged: PartialIndexModel = PartialIndexModel.merge_all(PartialIndexModel.load(path) for path in options.inputs)
+    if not merged.is_complete() and not options.allow_partial:
+        raise SystemExit(f"Missing shards: {', '.join(map(str, merged.missing_shards()))}.")
+    if options.output:
+        merged.save(options.output)
+    if options.snapshot:
+        merged.to_dependency_model(
+            options.root,
+            graph_class=GraphModel,
+            file_import_class=ImportModel,
+            file_reader_class=FileReaderModel,
+            file_collector=FileCollectorModel(),
+        ).save_snapshot(options.snapshot)
+    return merged
+
+
+if __name__ == "__main__":
+    parsed: Namespace = parse_arguments()
+    result: PartialIndexModel = scan(parsed) if parsed.action == "scan" else merge(parsed)
+    print(f"{len(result.files)} files, shards {result.shards} of {result.shard_count}", file=sys.stderr)
@@ -0,0 +1,39 @@
+from os import PathLike
+from time import perf_counter
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .imports import classify_imports
+from .extraction import read_import_statements
+
+
+# (path, statements, {"custom": {...}, "standard": {...}}, parsed, metrics), as DependencyModel's workers return it
+FileResult = Tuple[str, List[str], dict, bool, dict]
+
+
+def extract_file(path: str | PathLike, statements: Optional[List[str]] = None) -> FileResult:
+    """
+    Read (unless the cached statements are given) and classify one file with plain functions, the same result as
+    FileReaderModel(file_path=path).get_imports() followed by ImportModel(imports=...).get_libraries().
+    """
+    parsed: bool = statements is None
+    metrics: dict = {}
+    start: float = perf_counter()
+    if parsed:
+        records, metrics["bytes_read"], succeeded, metrics["digest"] = read_import_statements(path)
+        statements = [record.statement for record in records]
+        metrics["parse_failed"] = not succeeded
+        metrics["read"] = perf_counter() - start
+        start = perf_counter()
+    custom, standard = classify_imports(statements)
+    metrics["classify"] = perf_counter() - start
+    return path, statements, {"custom": custom, "standard": standard}, parsed, metrics
+
+
+def extract_files(jobs: Iterable[Tuple[str, Optional[List[str]]] | str]) -> Iterator[FileResult]:
+    """extract_file() for every (path, cached statements or None) job, or bare path, lazily and in input order."""
+    for job in jobs:
+        yield extract_file(job) if isinstance(job, (str, PathLike)) else extract_file(*job)
+
+
+def extract_batch(jobs: Iterable[Tuple[str, Optional[List[str]]] | str]) -> List[FileResult]:
+    """All of extract_files() at once: one call per batch of files, e.g. one task per pool worker."""
+    return list(extract_files(jobs))
@@ -0,0 +1,57 @@
+import socket
+from json import dumps, loads
+from pathlib import Path
+from typing import Any, Optional
+
+
+class DaemonClient:
+    """
+    Client of a running DaemonModel. The connection is opened once and reused, so a query costs one round trip
+    over the Unix socket: one JSON line out, one JSON line back.
+    """
+    __slots__ = ("socket_path", "timeout", "_socket", "_reader")
+
+    def __init__(self, socket_path: str | Path, timeout: Optional[float] = 5.0) -> None:
+        self.socket_path: str = str(socket_path)
+        self.timeout: Optional[float] = timeout
+        self._socket: Optional[socket.socket] = None
+        self._reader = None
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __connect(self) -> None:
+        if self._socket is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            connection.connect(self.socket_path)
+            self._socket = connection
+            self._reader = connection.makefile("rb")
+
+    # ----------------
+    # public methods
+    # ----------------
+    def request(self, command: str, **arguments) -> Any:
+        """Send one command and return its result; an error reported by the daemon is raised as RuntimeError."""
+        self.__connect()
+        self._socket.sendall(dumps({"command": command, "arguments": arguments}).encode("utf-8") + b"\n")
+        line: bytes = self._reader.readline()
+        if not line:
+            self.close()
+            raise ConnectionError(f"The dependency daemon at {self.socket_path} closed the connection.")
+        response: dict = loads(line)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "Unknown daemon error."))
+        return response.get("result")
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = self._reader = None
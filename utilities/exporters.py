@@ -0,0 +1,139 @@
+import csv
+import gzip
+from json import dumps
+from pathlib import Path
+from contextlib import contextmanager
+from xml.sax.saxutils import quoteattr
+from typing import Callable, Dict, Hashable, IO, Iterable, Iterator, List, Optional, Tuple
+
+
+EDGE_FORMATS: List[str] = ["jsonl", "csv", "dot", "graphml"]
+RECORD_FORMATS: List[str] = ["jsonl", "csv"]
+RECORD_FIELDS: List[str] = ["file", "type", "library", "module"]
+
+_SUFFIXES: Dict[str, str] = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".dot": "dot", ".gv": "dot", ".graphml": "graphml"}
+
+
+def detect_format(file_path: str | Path, export_format: Optional[str] = None) -> Tuple[str, bool]:
+    """Export format and whether to gzip, from an explicit format or the file suffix (e.g. 'edges.csv.gz')."""
+    suffixes: List[str] = [suffix.lower() for suffix in Path(file_path).suffixes]
+    compress: bool = bool(suffixes) and suffixes[-1] == ".gz"
+    if compress:
+        suffixes.pop()
+    if export_format is None:
+        export_format = _SUFFIXES.get(suffixes[-1] if suffixes else "", "jsonl")
+    return export_format.lower(), compress
+
+
+@contextmanager
+def open_output(file_path: str | Path, compress: Optional[bool] = False) -> Iterator[IO[str]]:
+    """Text handle for writing, gzip-compressed when asked for; rows go through the handle's buffer, never a whole string."""
+    if compress:
+        with gzip.open(file_path, "wt", encoding="utf-8", newline="") as handle:
+            yield handle
+    else:
+        with open(file_path, "w", encoding="utf-8", newline="") as handle:
+            yield handle
+
+
+def _dot_id(name: Hashable) -> str:
+    return '"' + str(name).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _write_jsonl_edges(handle: IO[str], edges: Iterable[Tuple[Hashable, Hashable]]) -> int:
+    count: int = 0
+    for source, target in edges:
+        handle.write(dumps({"source": source, "target": target}) + "\n")
+        count += 1
+    return count
+
+
+def _write_csv_edges(handle: IO[str], edges: Iterable[Tuple[Hashable, Hashable]]) -> int:
+    writer = csv.writer(handle)
+    writer.writerow(["source", "target"])
+    count: int = 0
+    for edge in edges:
+        writer.writerow(edge)
+        count += 1
+    return count
+
+
+def _write_dot_edges(handle: IO[str], edges: Iterable[Tuple[Hashable, Hashable]]) -> int:
+    handle.write("digraph imports {\n")
+    count: int = 0
+    for source, target in edges:
+        handle.write(f"  {_dot_id(source)} -> {_dot_id(target)};\n")
+        count += 1
+    handle.write("}\n")
+    return count
+
+
+def _write_graphml_edges(handle: IO[str], edges: Iterable[Tuple[Hashable, Hashable]]) -> int:
+    """Nodes are declared as they first appear (GraphML allows nodes and edges in any order), so only node names are kept."""
+    handle.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        '  <graph id="imports" edgedefault="directed">\n'
+    )
+    declared: set = set()
+    count: int = 0
+    for source, target in edges:
+        for node in (source, target):
+            if node not in declared:
+                declared.add(node)
+                handle.write(f"    <node id={quoteattr(str(node))}/>\n")
+        handle.write(f"    <edge source={quoteattr(str(source))} target={quoteattr(str(target))}/>\n")
+        count += 1
+    handle.write("  </graph>\n</graphml>\n")
+    return count
+
+
+_EDGE_WRITERS: Dict[str, Callable[[IO[str], Iterable[Tuple[Hashable, Hashable]]], int]] = {
+    "jsonl": _write_jsonl_edges,
+    "csv": _write_csv_edges,
+    "dot": _write_dot_edges,
+    "graphml": _write_graphml_edges,
+}
+
+
+def write_edges(
+        edges: Iterable[Tuple[Hashable, Hashable]],
+        file_path: str | Path,
+        export_format: Optional[str] = None,
+        compress: Optional[bool] = None
+    ) -> int:
+    """
+    Stream (source, target) edges to a file in JSONL, CSV, DOT or GraphML, one row at a time. The format and gzip
+    compression default to the file suffix. Returns the number of edges written.
+    """
+    export_format, detected_compression = detect_format(file_path, export_format)
+    if export_format not in EDGE_FORMATS:
+        raise ValueError(f"Unsupported edge export format '{export_format}'. Options: {', '.join(EDGE_FORMATS)}.")
+    with open_output(file_path, detected_compression if compress is None else compress) as handle:
+        return _EDGE_WRITERS[export_format](handle, edges)
+
+
+def write_records(
+        records: Iterable[dict],
+        file_path: str | Path,
+        export_format: Optional[str] = None,
+        compress: Optional[bool] = None
+    ) -> int:
+    """Stream per-file import records ({"file", "type", "library", "module"}) as JSONL or CSV. Returns the number of records written."""
+    export_format, detected_compression = detect_format(file_path, export_format)
+    if export_format not in RECORD_FORMATS:
+        raise ValueError(f"Unsupported record export format '{export_format}'. Options: {', '.join(RECORD_FORMATS)}.")
+
+    count: int = 0
+    with open_output(file_path, detected_compression if compress is None else compress) as handle:
+        if export_format == "csv":
+            writer = csv.DictWriter(handle, fieldnames=RECORD_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        else:
+            for record in records:
+                handle.write(dumps(record) + "\n")
+                count += 1
+    return count
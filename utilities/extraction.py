@@ -0,0 +1,129 @@
+from io import StringIO
+from os import PathLike
+from hashlib import blake2b
+from typing import List, NamedTuple, Tuple
+from tokenize import generate_tokens, TokenError, NAME, NEWLINE, INDENT, DEDENT, NL, COMMENT
+from ast import parse, walk, Import, ImportFrom
+
+
+# Bump whenever the shape of the emitted statements changes, so that anything persisted from a previous version is discarded.
+EXTRACTOR_VERSION: int = 1
+
+_IMPORT_KEYWORDS: frozenset = frozenset({"import", "from"})
+_SKIPPED_TOKENS: frozenset = frozenset({NEWLINE, INDENT, DEDENT, NL, COMMENT})
+
+
+class ImportStatement(NamedTuple):
+    lineno: int
+    statement: str
+
+
+class SourceImports(NamedTuple):
+    statements: List[ImportStatement]
+    bytes_read: int
+    parsed: bool
+    digest: str
+
+
+def _render(node: Import | ImportFrom) -> List[str]:
+    """Render an import node as one canonical, alias-free statement per imported root. Example: 'import os as o, sys' -> ['import os', 'import sys']."""
+    if isinstance(node, ImportFrom):
+        module: str = "." * (node.level or 0) + (node.module or "")
+        return [f"from {module} import {', '.join(alias.name for alias in node.names)}"]
+    return [f"import {alias.name}" for alias in node.names]
+
+
+def _from_nodes(nodes) -> List[ImportStatement]:
+    statements: List[ImportStatement] = [
+        ImportStatement(node.lineno, statement)
+        for node in nodes if isinstance(node, (Import, ImportFrom))
+        for statement in _render(node)
+    ]
+    statements.sort(key=lambda item: item.lineno)
+    return statements
+
+
+def _line_extract(lines: List[str], first_row: int) -> List[ImportStatement]:
+    statements: List[ImportStatement] = []
+    for row, line in enumerate(lines[first_row:], start=first_row + 1):
+        line = line.strip()
+        if line.split(" ", 1)[0] not in _IMPORT_KEYWORDS:
+            continue
+        try:
+            statements.extend(ImportStatement(row, statement) for node in parse(line).body for statement in _render(node))
+        except SyntaxError:
+            pass
+    return statements
+
+
+def _tolerant_extract(source: str) -> List[ImportStatement]:
+    """
+    Fallback for sources that do not parse as a whole (syntax errors, mixed tabs, newer grammar, ...).
+
+    The source is tokenized into logical lines, so parenthesised and backslash-continued imports stay intact,
+    and only logical lines starting with 'import' or 'from' are handed to the parser. Tokenizing stops at the
+    first unrecoverable error; the remaining lines are then checked one by one, as a last resort.
+    """
+    lines: List[str] = source.splitlines(keepends=True)
+    statements: List[ImportStatement] = []
+    start = None
+    resume_row: int = 0
+
+    try:
+        for token in generate_tokens(StringIO(source).readline):
+            if start is None:
+                if token.type in _SKIPPED_TOKENS:
+                    continue
+                start = token.start if token.type == NAME and token.string in _IMPORT_KEYWORDS else False
+            if token.type == NEWLINE:
+                if start:
+                    (first_row, first_col), last_row = start, token.end[0]
+                    segment: str = lines[first_row - 1][first_col:] + "".join(lines[first_row:last_row])
+                    try:
+                        statements.extend(
+                            ImportStatement(first_row, statement)
+                            for node in parse(segment).body
+                            for statement in _render(node)
+                            if isinstance(node, (Import, ImportFrom))
+                        )
+                    except SyntaxError:
+                        pass
+                start = None
+                resume_row = token.end[0]
+    except (TokenError, SyntaxError):
+        statements.extend(_line_extract(lines, resume_row))
+    return statements
+
+
+def parse_import_statements(source: str) -> Tuple[List[ImportStatement], bool]:
+    """Like extract_import_statements(), also telling whether the source parsed (False: the tolerant fallback was used)."""
+    if not source:
+        return [], True
+    try:
+        return _from_nodes(walk(parse(source))), True
+    except (SyntaxError, ValueError):
+        return _tolerant_extract(source), False
+
+
+def content_digest(raw: bytes) -> str:
+    """Hash identifying a file's content, e.g. to reuse cached statements of a file that was only touched."""
+    return blake2b(raw, digest_size=16).hexdigest()
+
+
+def read_import_statements(file_path: str | PathLike) -> SourceImports:
+    """
+    Read a UTF-8 file and parse its import statements. The content digest is taken from the same bytes, so a
+    cache storing the result does not have to read the file again. A missing file has no statements.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            raw: bytes = file.read()
+    except FileNotFoundError:
+        return SourceImports([], 0, True, "")
+    statements, parsed = parse_import_statements(raw.decode('utf-8'))
+    return SourceImports(statements, len(raw), parsed, content_digest(raw))
+
+
+def extract_import_statements(source: str) -> List[ImportStatement]:
+    """Parse the source once and return every import statement (including nested ones) ordered by line number."""
+    return parse_import_statements(source)[0]
@@ -0,0 +1,145 @@
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+_SHORTEST_CYCLE_WORK: int = 2_000_000
+
+
+def index_edges(edges: Iterable[Tuple[Hashable, Hashable]]) -> Tuple[List[Hashable], List[List[int]]]:
+    """Intern node names into integer ids; returns the names and the adjacency lists (by id)."""
+    ids: Dict[Hashable, int] = {}
+    names: List[Hashable] = []
+    successors: List[List[int]] = []
+    for source, target in edges:
+        for node in (source, target):
+            if node not in ids:
+                ids[node] = len(names)
+                names.append(node)
+                successors.append([])
+        successors[ids[source]].append(ids[target])
+    return names, successors
+
+
+def strongly_connected_component_ids(successors: List[List[int]]) -> List[List[int]]:
+    """
+    Tarjan's algorithm with an explicit work stack instead of recursion, so graph depth is not limited by the
+    interpreter's recursion limit. O(V + E). Components come out in reverse topological order (sinks first).
+    """
+    count: int = len(successors)
+    index: List[int] = [-1] * count
+    low: List[int] = [0] * count
+    on_stack: List[bool] = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter: int = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work: List[List[int]] = [[root, 0]]
+
+        while work:
+            frame = work[-1]
+            node, position = frame
+            edges = successors[node]
+            if position < len(edges):
+                frame[1] += 1
+                target = edges[position]
+                if index[target] == -1:
+                    index[target] = low[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = True
+                    work.append([target, 0])
+                elif on_stack[target] and index[target] < low[node]:
+                    low[node] = index[target]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[node] < low[parent]:
+                    low[parent] = low[node]
+            if low[node] == index[node]:
+                component: List[int] = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def shortest_cycle(members: List[int], successors: List[List[int]], max_work: Optional[int] = _SHORTEST_CYCLE_WORK) -> List[int]:
+    """
+    Shortest cycle inside one strongly connected component, as [a, b, ..., a]. A breadth-first search is run from
+    every member, restricted to the component and cut off at the length of the best cycle found so far.
+
+    Exact minimum cycles cost O(V * E) on huge components, so the searches stop once 'max_work' edges were examined
+    in total (None: no limit); the shortest cycle found up to then is returned.
+    """
+    inside: set = set(members)
+    best: Optional[List[int]] = None
+    work: int = 0
+
+    for source in members:
+        if source in successors[source]:
+            return [source, source]
+
+    for source in members:
+        parents: Dict[int, int] = {source: -1}
+        depth: Dict[int, int] = {source: 0}
+        queue: deque = deque([source])
+        while queue:
+            node = queue.popleft()
+            if best is not None and depth[node] + 1 >= len(best) - 1:
+                break
+            found: bool = False
+            work += len(successors[node])
+            for target in successors[node]:
+                if target == source:
+                    path: List[int] = [node]
+                    while parents[path[-1]] != -1:
+                        path.append(parents[path[-1]])
+                    best = list(reversed(path)) + [source]
+                    found = True
+                    break
+                if target in inside and target not in parents:
+                    parents[target] = node
+                    depth[target] = depth[node] + 1
+                    queue.append(target)
+            if found:
+                break
+        if best is not None and (len(best) == 3 or (max_work is not None and work >= max_work)):
+            break
+    return best or []
+
+
+def strongly_connected_components(edges: Iterable[Tuple[Hashable, Hashable]]) -> List[List[Hashable]]:
+    """All strongly connected components (including single nodes), each sorted, in reverse topological order."""
+    names, successors = index_edges(edges)
+    return [sorted(names[node] for node in component) for component in strongly_connected_component_ids(successors)]
+
+
+def find_cycles(edges: Iterable[Tuple[Hashable, Hashable]], max_work: Optional[int] = _SHORTEST_CYCLE_WORK) -> List[dict]:
+    """
+    Import cycles: every component with more than one node (or a self-loop), largest first, together with its
+    smallest cycle, e.g. {"component": ["a.py", "b.py", "c.py"], "shortest_cycle": ["a.py", "b.py", "a.py"]}.
+    """
+    names, successors = index_edges(edges)
+    cycles: List[dict] = []
+    for component in strongly_connected_component_ids(successors):
+        if len(component) == 1 and component[0] not in successors[component[0]]:
+            continue
+        cycles.append({
+            "component": sorted(names[node] for node in component),
+            "shortest_cycle": [names[node] for node in shortest_cycle(sorted(component, key=lambda node: names[node]), successors, max_work)],
+        })
+    cycles.sort(key=lambda cycle: (-len(cycle["component"]), cycle["component"]))
+    return cycles
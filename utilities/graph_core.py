@@ -0,0 +1,207 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from numpy import ndarray, array, arange, argsort, bincount, concatenate, cumsum, delete, diff, full, insert, int32, int64, ones, repeat, searchsorted, sort, unique
+
+
+def _offsets(keys: ndarray, count: int) -> ndarray:
+    return concatenate(([0], cumsum(bincount(keys, minlength=count)))).astype(int64)
+
+
+class GraphCore:
+    """
+    Directed graph over interned node names. Nodes are integer ids (first-appearance order); edges are stored once
+    in CSR form (out_indptr, targets) for forward traversal and once in CSC form (in_indptr, in_indices) for
+    reverse traversal, as int32 arrays - about 8 bytes per edge. Edges are unique and keep insertion order within
+    a source, so nodes and edges iterate in the same order as a networkx DiGraph built from the same input.
+    """
+    __slots__ = ("names", "ids", "targets", "out_indptr", "in_indptr", "in_indices")
+
+    def __init__(self, edges: Iterable[Tuple[Hashable, Hashable]] = (), nodes: Iterable[Hashable] = ()) -> None:
+        self.names: List[Hashable] = []
+        self.ids: Dict[Hashable, int] = {}
+        for node in nodes:
+            self.__intern(node)
+
+        sources: List[int] = []
+        targets: List[int] = []
+        for source, target in edges:
+            sources.append(self.__intern(source))
+            targets.append(self.__intern(target))
+        self.__index(array(sources, dtype=int32), array(targets, dtype=int32))
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __intern(self, node: Hashable) -> int:
+        node_id: Optional[int] = self.ids.get(node)
+        if node_id is None:
+            node_id = self.ids[node] = len(self.names)
+            self.names.append(node)
+        return node_id
+
+    def __index(self, sources: ndarray, targets: ndarray) -> None:
+        """Drop duplicate edges (the first one wins), order them by source and compute both offset arrays."""
+        count: int = len(self.names)
+        if len(sources):
+            _, first = unique(sources.astype(int64) * max(count, 1) + targets, return_index=True)
+            keep: ndarray = sort(first)
+            sources, targets = sources[keep], targets[keep]
+            order: ndarray = argsort(sources, kind="stable")
+            sources, targets = sources[order], targets[order]
+
+        sources = sources.astype(int32)
+        self.targets: ndarray = targets.astype(int32)
+        self.out_indptr: ndarray = _offsets(sources, count)
+        self.in_indices: ndarray = sources[argsort(self.targets, kind="stable")]
+        self.in_indptr: ndarray = _offsets(self.targets, count)
+
+    def __edge_ids(self, edges: Iterable[Tuple[Hashable, Hashable]]) -> List[Tuple[int, int]]:
+        return [(self.ids[source], self.ids[target]) for source, target in edges if source in self.ids and target in self.ids]
+
+    def __has_edge_id(self, source: int, target: int) -> bool:
+        return bool((self.targets[self.out_indptr[source]:self.out_indptr[source + 1]] == target).any())
+
+    def __column_position(self, source: int, target: int) -> int:
+        """Where 'source' sits, or belongs, among the sources of 'target' (ascending, as a full index orders them)."""
+        start, end = self.in_indptr[target], self.in_indptr[target + 1]
+        return int(start + searchsorted(self.in_indices[start:end], source))
+
+    def __grow(self, count: int) -> None:
+        """Extend both offset arrays with empty rows for nodes interned since the last index."""
+        missing: int = count + 1 - len(self.out_indptr)
+        if missing > 0:
+            self.out_indptr = concatenate((self.out_indptr, full(missing, self.out_indptr[-1], dtype=int64)))
+            self.in_indptr = concatenate((self.in_indptr, full(missing, self.in_indptr[-1], dtype=int64)))
+
+    def __shift(self, indptr: ndarray, nodes: List[int], sign: int) -> ndarray:
+        counts: ndarray = bincount(array(nodes, dtype=int64), minlength=len(indptr) - 1)
+        return indptr + sign * concatenate(([0], cumsum(counts))).astype(int64)
+
+    def __delete_edges(self, edges: List[Tuple[int, int]]) -> None:
+        row_positions: List[int] = [
+            int(self.out_indptr[source] + (self.targets[self.out_indptr[source]:self.out_indptr[source + 1]] == target).argmax())
+            for source, target in edges
+        ]
+        column_positions: List[int] = [self.__column_position(source, target) for source, target in edges]
+        self.targets = delete(self.targets, row_positions)
+        self.in_indices = delete(self.in_indices, column_positions)
+        self.out_indptr = self.__shift(self.out_indptr, [source for source, _ in edges], -1)
+        self.in_indptr = self.__shift(self.in_indptr, [target for _, target in edges], -1)
+
+    def __insert_edges(self, edges: List[Tuple[int, int]]) -> None:
+        """Edges are new and unique. np.insert keeps the given order for equal positions, hence the column sort."""
+        self.targets = insert(
+            self.targets, [int(self.out_indptr[source + 1]) for source, _ in edges], [target for _, target in edges]
+        ).astype(int32)
+        by_column: List[Tuple[int, int]] = sorted(edges, key=lambda edge: (edge[1], edge[0]))
+        self.in_indices = insert(
+            self.in_indices, [self.__column_position(source, target) for source, target in by_column], [source for source, _ in by_column]
+        ).astype(int32)
+        self.out_indptr = self.__shift(self.out_indptr, [source for source, _ in edges], 1)
+        self.in_indptr = self.__shift(self.in_indptr, [target for _, target in edges], 1)
+
+    def __drop_nodes(self, nodes: List[int]) -> None:
+        """Remove nodes without edges; ids above them move down, which keeps every order."""
+        count: int = len(self.names)
+        keep: ndarray = ones(count, dtype=bool)
+        keep[nodes] = False
+        new_ids: ndarray = (cumsum(keep) - 1).astype(int32)
+        self.targets, self.in_indices = new_ids[self.targets], new_ids[self.in_indices]
+        self.out_indptr, self.in_indptr = delete(self.out_indptr, nodes), delete(self.in_indptr, nodes)
+        for node in nodes:
+            del self.ids[self.names[node]]
+        self.names = [name for name, kept in zip(self.names, keep.tolist()) if kept]
+        for position in range(nodes[0], len(self.names)):
+            self.ids[self.names[position]] = position
+
+    # ----------------
+    # public methods
+    # ----------------
+    @property
+    def sources(self) -> ndarray:
+        """Source id of every edge, aligned with 'targets'; expanded from the CSR offsets on demand."""
+        return repeat(arange(len(self.names), dtype=int32), diff(self.out_indptr))
+
+    def number_of_nodes(self) -> int:
+        return len(self.names)
+
+    def number_of_edges(self) -> int:
+        return len(self.targets)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.ids
+
+    def has_edge(self, source: Hashable, target: Hashable) -> bool:
+        if source not in self.ids or target not in self.ids:
+            return False
+        source_id: int = self.ids[source]
+        return bool((self.targets[self.out_indptr[source_id]:self.out_indptr[source_id + 1]] == self.ids[target]).any())
+
+    def successors(self, node: Hashable) -> List[Hashable]:
+        node_id: int = self.ids[node]
+        return [self.names[target] for target in self.targets[self.out_indptr[node_id]:self.out_indptr[node_id + 1]].tolist()]
+
+    def predecessors(self, node: Hashable) -> List[Hashable]:
+        node_id: int = self.ids[node]
+        return [self.names[source] for source in self.in_indices[self.in_indptr[node_id]:self.in_indptr[node_id + 1]].tolist()]
+
+    def degree(self, node: Hashable) -> int:
+        node_id: int = self.ids[node]
+        return int(self.out_indptr[node_id + 1] - self.out_indptr[node_id] + self.in_indptr[node_id + 1] - self.in_indptr[node_id])
+
+    def edge_list(self) -> List[Tuple[Hashable, Hashable]]:
+        names: List[Hashable] = self.names
+        return [(names[source], names[target]) for source, target in zip(self.sources.tolist(), self.targets.tolist())]
+
+    def update(
+            self,
+            added: Iterable[Tuple[Hashable, Hashable]] = (),
+            removed: Iterable[Tuple[Hashable, Hashable]] = (),
+            drop_orphans: Optional[bool] = True
+        ) -> Tuple[List[Tuple[Hashable, Hashable]], List[Tuple[Hashable, Hashable]]]:
+        """
+        Remove, then add edges, patching the arrays in place of re-indexing them: removed entries are deleted from
+        their row and column, added ones are inserted at the end of their row and in source order in their column,
+        so the result is the one a full rebuild gives, at the cost of a few array copies. With drop_orphans,
+        endpoints of removed edges left without any edge are dropped and the remaining ids are compacted.
+        Returns the (added, removed) edges that actually changed the graph.
+        """
+        removed_ids: List[Tuple[int, int]] = sorted(set(self.__edge_ids(removed)))
+        removed_ids = [(source, target) for source, target in removed_ids if self.__has_edge_id(source, target)]
+        removed_edges: List[Tuple[Hashable, Hashable]] = [(self.names[source], self.names[target]) for source, target in removed_ids]
+        if removed_ids:
+            self.__delete_edges(removed_ids)
+
+        added_ids: List[Tuple[int, int]] = []
+        seen: set = set()
+        for source, target in added:
+            edge: Tuple[int, int] = (self.__intern(source), self.__intern(target))
+            if edge not in seen:
+                seen.add(edge)
+                added_ids.append(edge)
+        self.__grow(len(self.names))
+        added_ids = [(source, target) for source, target in added_ids if not self.__has_edge_id(source, target)]
+        added_edges: List[Tuple[Hashable, Hashable]] = [(self.names[source], self.names[target]) for source, target in added_ids]
+        if added_ids:
+            self.__insert_edges(added_ids)
+
+        if drop_orphans and removed_ids:
+            out_degree, in_degree = diff(self.out_indptr), diff(self.in_indptr)
+            orphans: List[int] = sorted({
+                node for edge in removed_ids for node in edge if not out_degree[node] and not in_degree[node]
+            })
+            if orphans:
+                self.__drop_nodes(orphans)
+        return added_edges, removed_edges
+
+    def nbytes(self) -> int:
+        """Bytes held by the edge and offset arrays (node names and the id table are not included)."""
+        return sum(part.nbytes for part in (self.targets, self.out_indptr, self.in_indptr, self.in_indices))
+
+    def to_networkx(self):
+        """Export as a networkx DiGraph (networkx is only imported here)."""
+        from networkx import DiGraph
+
+        graph = DiGraph()
+        graph.add_nodes_from(self.names)
+        graph.add_edges_from(self.edge_list())
+        return graph
@@ -0,0 +1,98 @@
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class IgnoreRule:
+    __slots__ = ("pattern", "negated", "directory_only", "regex")
+
+    def __init__(self, pattern: str, negated: bool, directory_only: bool, regex: re.Pattern) -> None:
+        self.pattern: str = pattern
+        self.negated: bool = negated
+        self.directory_only: bool = directory_only
+        self.regex: re.Pattern = regex
+
+
+def _translate(pattern: str) -> str:
+    """gitignore glob -> regex over '/'-separated relative paths."""
+    anchored: bool = "/" in pattern.rstrip("/")
+    pattern = pattern.strip("/")
+    parts: List[str] = []
+    i: int = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end: int = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+            else:
+                body: str = pattern[i + 1:end]
+                parts.append("[" + ("^" + body[1:] if body.startswith("!") else body) + "]")
+                i = end + 1
+        elif pattern[i] == "\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    prefix: str = "" if anchored else "(?:.*/)?"
+    return f"^{prefix}{''.join(parts)}$"
+
+
+def parse_ignore_patterns(lines: List[str]) -> List[IgnoreRule]:
+    rules: List[IgnoreRule] = []
+    for line in lines:
+        line = line.rstrip("\n").rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated: bool = line.startswith("!")
+        if negated or line.startswith("\\"):
+            line = line[1:]
+        directory_only: bool = line.endswith("/")
+        if line.strip("/"):
+            rules.append(IgnoreRule(line, negated, directory_only, re.compile(_translate(line))))
+    return rules
+
+
+def read_ignore_file(file_path: str | Path) -> List[IgnoreRule]:
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+            return parse_ignore_patterns(file.readlines())
+    except OSError:
+        return []
+
+
+def is_ignored(rule_sets: List[Tuple[str, List[IgnoreRule]]], relative_path: str, is_directory: bool) -> bool:
+    """
+    Apply .gitignore semantics. rule_sets is ordered from the outermost to the innermost ignore file, each paired
+    with the directory (relative to the walk root) it lives in; the last matching rule wins and '!' re-includes.
+    """
+    ignored: Optional[bool] = None
+    for base, rules in rule_sets:
+        if base:
+            if not relative_path.startswith(base + "/"):
+                continue
+            path: str = relative_path[len(base) + 1:]
+        else:
+            path = relative_path
+        for rule in rules:
+            if rule.directory_only and not is_directory:
+                continue
+            if rule.regex.match(path):
+                ignored = not rule.negated
+    return bool(ignored)
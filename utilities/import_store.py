@@ -0,0 +1,276 @@
+from collections.abc import MutableMapping
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+
+
+# a file's record is one flat tuple: (layout, *items). The layout, ((import type, count, is_mapping), ...), says how
+# many of the following items belong to each import type: (library, names, nested) triples for the usual
+# {library: [names]} form (nested: names holds grouped names), or a single tuple of values for list forms.
+# Layouts, triples and names tuples are shared between files. A deferred store holds the position a record is
+# loaded from (an int) until the record is first read.
+Record = tuple
+
+_COMPACT_MINIMUM: int = 1024
+
+
+class _WriteBack:
+    """A record read from an ImportStore; changes made in place to its dicts and lists are encoded into the store again."""
+    __slots__ = ("store", "path", "record", "data")
+
+    def __init__(self, store: "ImportStore", path: str, record: Record) -> None:
+        self.store, self.path, self.record = store, path, record
+        self.data: Optional[dict] = None
+
+    def changed(self) -> None:
+        # a path assigned or deleted since it was read no longer holds this data: like a dict taken out of a dict,
+        # changing it changes nothing stored (compact() re-encodes records into equal tuples, which still count)
+        if self.store._records.get(self.path) != self.record:
+            return
+        _track(self.data, self)
+        self.store[self.path] = self.data
+        self.record = self.store._records[self.path]
+
+
+def _writing(method: Callable) -> Callable:
+    @wraps(method)
+    def write(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._owner.changed()
+        return result
+    return write
+
+
+class _TrackedDict(dict):
+    __slots__ = ("_owner",)
+    __setitem__ = _writing(dict.__setitem__)
+    __delitem__ = _writing(dict.__delitem__)
+    __ior__ = _writing(dict.__ior__)
+    clear = _writing(dict.clear)
+    pop = _writing(dict.pop)
+    popitem = _writing(dict.popitem)
+    setdefault = _writing(dict.setdefault)
+    update = _writing(dict.update)
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
+
+class _TrackedList(list):
+    __slots__ = ("_owner",)
+    __setitem__ = _writing(list.__setitem__)
+    __delitem__ = _writing(list.__delitem__)
+    __iadd__ = _writing(list.__iadd__)
+    __imul__ = _writing(list.__imul__)
+    append = _writing(list.append)
+    extend = _writing(list.extend)
+    insert = _writing(list.insert)
+    pop = _writing(list.pop)
+    remove = _writing(list.remove)
+    clear = _writing(list.clear)
+    sort = _writing(list.sort)
+    reverse = _writing(list.reverse)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+def _track(value: Any, owner: _WriteBack) -> Any:
+    """'value' with every dict and list in it (the containers of 'owner' in place) tracked for 'owner'."""
+    kind: type = type(value)
+    if kind is str:
+        return value
+    if (kind is _TrackedDict or kind is _TrackedList) and value._owner is owner:
+        base: type = dict if kind is _TrackedDict else list
+        for key, item in list(value.items() if base is dict else enumerate(value)):
+            tracked: Any = _track(item, owner)
+            if tracked is not item:
+                base.__setitem__(value, key, tracked)
+        return value
+    if kind is dict or kind is _TrackedDict or (kind is not list and isinstance(value, Mapping)):
+        value = _TrackedDict({key: _track(item, owner) for key, item in value.items()})
+    elif kind is list or kind is _TrackedList:
+        value = _TrackedList([_track(item, owner) for item in value])
+    else:
+        return value
+    value._owner = owner
+    return value
+
+
+def _container(kind: type, items: Iterable, owner: Optional[_WriteBack]) -> Any:
+    """A dict or list of 'items', tracked for 'owner' unless it is None."""
+    if owner is None:
+        return kind(items)
+    container = (_TrackedDict if kind is dict else _TrackedList)(items)
+    container._owner = owner
+    return container
+
+
+class ImportStore(MutableMapping):
+    """
+    Compact mapping of file path -> imports ({"standard": {library: [names]}, "custom": {...}}) for
+    DependencyModel.imports. Strings and tuples are canonicalised in a table of the store (not sys.intern, so
+    they are released again by compact()), and every record is one flat tuple built from them: files with the
+    same names under a library share one object instead of holding their own dicts, lists and string copies.
+    Reading a path decodes a dict in the original shape and key order; writing encodes it. Changes made in place
+    to a dict that was read are written back the same way, until the path is assigned or deleted again.
+    """
+    __slots__ = ("_records", "_shared", "_replaced", "_load", "_generation")
+
+    def __init__(self, data: Optional[Mapping[str, Any] | Iterable[Tuple[str, Any]]] = None) -> None:
+        self._records: Dict[str, Record | int] = {}
+        self._shared: Dict[tuple, tuple] = {}
+        self._replaced: int = 0
+        self._load: Optional[Callable[[int], Mapping[str, Any]]] = None
+        self._generation: int = 0
+        if isinstance(data, ImportStore):
+            self._records = dict(data._records)
+            self._shared = dict(data._shared)
+            self._load = data._load
+        elif data is not None:
+            self.update(data)
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __share(self, value: Any) -> Any:
+        return self._shared.setdefault(value, value)
+
+    def __encode_value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.__share(value)
+        if isinstance(value, (list, tuple)):
+            return self.__share(tuple(self.__encode_value(item) for item in value))
+        return value
+
+    def __encode(self, data: Mapping[str, Any]) -> Record:
+        layout: list = []
+        items: list = []
+        for import_type, libraries in data.items():
+            if isinstance(libraries, Mapping):
+                layout.append((self.__share(import_type), len(libraries), True))
+                for library, names in libraries.items():
+                    names = self.__encode_value(names or ())
+                    nested: bool = any(isinstance(name, tuple) for name in names)
+                    items.append(self.__share((self.__share(library), names, nested)))
+            else:
+                layout.append((self.__share(import_type), 1, False))
+                items.append(self.__encode_value(libraries or ()))
+        return (self.__share(tuple(layout)), *items)
+
+    @classmethod
+    def __decode_value(cls, value: Any, owner: Optional[_WriteBack] = None) -> Any:
+        if isinstance(value, tuple):
+            return _container(list, [cls.__decode_value(item, owner) for item in value], owner)
+        return value
+
+    @classmethod
+    def __decode(cls, record: Record, owner: Optional[_WriteBack] = None) -> dict:
+        decoded: dict = {}
+        position: int = 1
+        for import_type, count, is_mapping in record[0]:
+            if is_mapping:
+                decoded[import_type] = _container(dict, {
+                    library: cls.__decode_value(names, owner) if nested else _container(list, names, owner)
+                    for library, names, nested in record[position:position + count]
+                }, owner)
+            else:
+                decoded[import_type] = cls.__decode_value(record[position], owner)
+            position += count
+        return _container(dict, decoded, owner)
+
+    def __record(self, path: str) -> Record:
+        record: Record | int = self._records[path]
+        if type(record) is int:
+            record = self._records[path] = self.__encode(self._load(record))
+        return record
+
+    def __collect_garbage(self) -> None:
+        """Drop canonical tuples no record uses any more, once as many records were replaced as are stored."""
+        self._replaced += 1
+        if self._replaced > max(len(self._records), _COMPACT_MINIMUM):
+            self.compact()
+
+    # ----------------
+    # public methods
+    # ----------------
+    @classmethod
+    def deferred(cls, paths: Sequence[str], load: Callable[[int], Mapping[str, Any]]) -> "ImportStore":
+        """
+        A store of 'paths' whose records are loaded by position on first read, e.g. ImportStore.deferred(
+        snapshot.paths(), snapshot.record); membership, length and iteration never load anything.
+        """
+        store: "ImportStore" = cls()
+        store._records = dict(zip(paths, range(len(paths))))
+        store._load = load
+        return store
+
+    def __getitem__(self, path: str) -> dict:
+        owner = _WriteBack(self, path, self.__record(path))
+        owner.data = self.__decode(owner.record, owner)
+        return owner.data
+
+    def __setitem__(self, path: str, data: Mapping[str, Any]) -> None:
+        if path in self._records:
+            self.__collect_garbage()
+        self._records[path] = self.__encode(data)
+        self._generation += 1
+
+    def __delitem__(self, path: str) -> None:
+        del self._records[path]
+        self._generation += 1
+        self.__collect_garbage()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._records
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._records)} files, {len(self._shared)} shared tuples)"
+
+    def entries(self, path: str, import_type: str) -> Iterator[Tuple[Any, Sequence]]:
+        """
+        (library, names) of one import type of one file without decoding the whole record; names are tuples, with
+        grouped names as lists. List forms yield (value, ()) for each value.
+        """
+        record: Record = self.__record(path)
+        position: int = 1
+        for kind, count, is_mapping in record[0]:
+            if kind == import_type:
+                if not is_mapping:
+                    yield from ((value, ()) for value in self.__decode_value(record[position]))
+                    return
+                for library, names, nested in record[position:position + count]:
+                    yield library, (self.__decode_value(names) if nested else names)
+                return
+            position += count
+
+    def compact(self) -> None:
+        """Rebuild the canonical tuple table from the stored records only; records not loaded yet stay deferred."""
+        records: Dict[str, Record | int] = self._records
+        self._records, self._shared, self._replaced = {}, {}, 0
+        for path, record in records.items():
+            self._records[path] = record if type(record) is int else self.__encode(self.__decode(record))
+
+    def generation(self) -> int:
+        """Number of writes and deletions so far; derived data (e.g. ImportIndexModel) compares it to spot changes."""
+        return self._generation
+
+    def shared_count(self) -> int:
+        return len(self._shared)
+
+
+def iter_entries(imports: Mapping[str, Any], path: str, import_type: str) -> Iterator[Tuple[Any, Sequence]]:
+    """ImportStore.entries() for any mapping of path -> imports, e.g. a plain dict."""
+    if isinstance(imports, ImportStore):
+        yield from imports.entries(path, import_type)
+        return
+    libraries = (imports.get(path) or {}).get(import_type)
+    if isinstance(libraries, Mapping):
+        yield from libraries.items()
+    else:
+        yield from ((library, ()) for library in libraries or [])
@@ -1,9 +1,10 @@
 import re
 import sys
 from importlib import metadata
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 from functools import lru_cache
 from pkgutil import iter_modules
+from .module_index import FIRST_PARTY, get_module_index
 
 
 _REMOVE_KEYROWDS: List[str] = [
@@ -20,21 +21,22 @@ def module_in_metadata(module_name: str) -> bool:
     except metadata.PackageNotFoundError:
         return False
 
+@lru_cache(maxsize=1)
+def _iter_module_names() -> frozenset:
+    return frozenset(name for _, name, _ in iter_modules())
+
 @lru_cache(maxsize=128)
 def module_in_iters(module_name: str) -> bool:
-    return module_name in {name for _, name, _ in iter_modules()}
+    return module_name in _iter_module_names()
 
 @lru_cache(maxsize=128)
 def module_in_builtins(module_name: str) -> bool:
     return module_name in sys.builtin_module_names
 
-@lru_cache(maxsize=128)
 def module_is_standard_library(module_name: str) -> bool:
-    in_metadata: bool = module_in_metadata(module_name)
-    in_builtins: bool = module_in_builtins(module_name)
-    in_iter_modules: bool = module_in_iters(module_name)
-    return any([in_metadata, in_builtins, in_iter_modules])
-    
+    """Answered by the precomputed module index: True for the standard library and installed packages, False for first-party code."""
+    return get_module_index().is_standard(module_name)
+
 
 def _remove_renamed_imports(import_string: str) -> str:
     """Remove renamed imports from string. Example: 'import pandas as pd' will remove ' as pd' from the string."""
@@ -78,7 +80,16 @@ def find_imports(data: str):
         data = [data.replace(" ", "")]
     return data
 
-@lru_cache(maxsize=128)        
+@lru_cache(maxsize=None)
+def classify_module_kind(module_name: str) -> str:
+    """Three-way variant of classify_module(): 'stdlib', 'third-party' or 'first-party', answered by the precomputed module index."""
+    module_name: str = _remove_keywords(module_name)
+    if module_name.startswith("."):
+        return FIRST_PARTY
+    return get_module_index().classify(module_name_cleanup(module_name))
+
+
+@lru_cache(maxsize=None)
 def classify_module(module_name: str) -> bool:
     """
     When a library starts with '.' or '..' it is assumed to be a custom module.
@@ -87,21 +98,7 @@ def classify_module(module_name: str) -> bool:
     Some libraries are builtins or python's native libs. They have a dot '.' like in 'import matplotlib.pyplot' and in such case,
     root should be checked from left to right.
     """
-    module_name: str = _remove_keywords(module_name)
-    module_name: str = module_name_cleanup(module_name)
-
-    if "." in module_name:
-        elements: List[str] = module_name.split(".")
-        for element in elements:
-            if not element or element == '':
-                try:
-                    elements.remove(element)
-                except:
-                    pass
-        if module_is_standard_library(elements[0]):
-            return True
-        return False
-    return module_is_standard_library(module_name)
+    return classify_module_kind(module_name) != FIRST_PARTY
 
 
 def __split_into_module_and_imports(data: str) -> List[str]:
@@ -111,9 +108,62 @@ def __split_into_module_and_imports(data: str) -> List[str]:
     return item[0]
     
 
-@lru_cache(maxsize=128)   
+@lru_cache(maxsize=8192)
 def find_root(data: str) -> Tuple[str, bool]:
     item = __split_into_module_and_imports(data)
     root_in_standard_lib: bool = classify_module(item)
     root: str = root_cleanup(item)
     return root, root_in_standard_lib
+
+
+def _add_imported_names(libraries: dict, root: str, imported: List[str]) -> None:
+    for library in imported or []:
+        if "," in library:
+            library = [str(name.strip()).replace(" ", "") for name in library.split(",")]
+        else:
+            library = library.strip()
+
+        if root not in libraries:
+            libraries[root] = library if isinstance(library, list) else [library]
+        else:
+            libraries[root].append(library)
+
+
+def _add_imported_modules(libraries: dict, root: str) -> None:
+    if "," in root:
+        for module in root.split(","):
+            libraries.setdefault(module.strip().replace(" ", ""), [])
+    else:
+        libraries.setdefault(root, [])
+
+
+def classify_imports(
+        imports: Iterable[str], custom: Optional[dict] = None, standard: Optional[dict] = None
+    ) -> Tuple[dict, dict]:
+    """
+    Sort import statements into (custom, standard) libraries, {root: [imported names]}, adding to the given dicts.
+    The plain-function form of ImportModel.extract(), for callers that classify many files without a model each.
+    """
+    custom = {} if custom is None else custom
+    standard = {} if standard is None else standard
+    for item in imports:
+        root, is_standard_library = find_root(item)
+        libraries: dict = standard if is_standard_library else custom
+        if "from" in item:
+            _add_imported_names(libraries, root, find_imports(item))
+        else:
+            _add_imported_modules(libraries, root)
+    return custom, standard
+
+
+def classification_cache_info() -> Tuple[int, int]:
+    """(hits, misses) of the memoised statement and module classification, summed; counts only this process."""
+    statements, modules = find_root.cache_info(), classify_module.cache_info()
+    return statements.hits + modules.hits, statements.misses + modules.misses
+
+
+def clear_classification_caches() -> None:
+    """Drop memoised answers, e.g. after the module index changed."""
+    classify_module.cache_clear()
+    classify_module_kind.cache_clear()
+    find_root.cache_clear()
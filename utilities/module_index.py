@@ -0,0 +1,189 @@
+import sys
+from os import scandir
+from threading import Lock
+from contextlib import contextmanager
+from pathlib import Path
+from json import dumps, loads
+from importlib import metadata
+from pkgutil import iter_modules
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+STANDARD_LIBRARY: str = "stdlib"
+THIRD_PARTY: str = "third-party"
+FIRST_PARTY: str = "first-party"
+
+INDEX_FORMAT_VERSION: int = 2
+
+_INDEX: Optional["ModuleIndex"] = None
+# roots activated by project_root_scope() -> number of scopes currently using them
+_SCOPED_ROOTS: Dict[str, int] = {}
+_SCOPE_LOCK: Lock = Lock()
+
+
+def _environment_fingerprint() -> str:
+    """Interpreter plus import path, including each entry's mtime, so installing or removing a package changes it."""
+    entries: list = []
+    for entry in sys.path:
+        try:
+            entries.append(f"{entry}:{Path(entry or '.').stat().st_mtime_ns}")
+        except OSError:
+            entries.append(entry)
+    return "|".join([sys.executable, sys.version, *entries])
+
+
+def _project_names(root: str | Path) -> Iterable[str]:
+    """Top-level importable names of a project root: packages, modules, the same for a 'src' layout, and the root itself when it is a package."""
+    root = Path(root)
+    if (root / "__init__.py").is_file() and root.name.isidentifier():
+        yield root.name
+
+    for directory in (root, root / "src"):
+        try:
+            entries = list(scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            name: str = entry.name
+            if entry.is_dir() and name.isidentifier():
+                yield name
+            elif name.endswith(".py") and name[:-3].isidentifier():
+                yield name[:-3]
+
+
+class ModuleIndex:
+    """
+    Top-level module name -> stdlib / third-party / first-party. Names that are not indexed are first-party.
+    'modules' describes the environment only; names of project roots are kept apart, so a root can be removed again.
+    """
+    __slots__ = ("modules", "fingerprint", "project_roots", "_root_names", "_project_names")
+
+    def __init__(self, modules: Dict[str, str], fingerprint: str, project_roots: Optional[list] = None) -> None:
+        self.modules: Dict[str, str] = modules
+        self.fingerprint: str = fingerprint
+        self.project_roots: list = []
+        self._root_names: Dict[str, Tuple[str, ...]] = {}
+        # first-party name -> number of project roots providing it
+        self._project_names: Dict[str, int] = {}
+        for root in project_roots or []:
+            self.add_project_root(root)
+
+    @classmethod
+    def build(cls, project_roots: Iterable[str | Path] = ()) -> "ModuleIndex":
+        modules: Dict[str, str] = {name: THIRD_PARTY for _, name, _ in iter_modules()}
+        modules.update((name, THIRD_PARTY) for name in metadata.packages_distributions())
+        modules.update((name, STANDARD_LIBRARY) for name in sys.builtin_module_names)
+        modules.update((name, STANDARD_LIBRARY) for name in sys.stdlib_module_names)
+
+        return cls(modules=modules, fingerprint=_environment_fingerprint(), project_roots=list(project_roots))
+
+    def add_project_root(self, root: str | Path) -> None:
+        """First-party names take precedence over installed packages, but never over the standard library."""
+        root = Path(root).as_posix()
+        if root in self._root_names:
+            return
+        self.project_roots.append(root)
+        self._root_names[root] = names = tuple(set(_project_names(root)))
+        for name in names:
+            self._project_names[name] = self._project_names.get(name, 0) + 1
+
+    def remove_project_root(self, root: str | Path) -> None:
+        root = Path(root).as_posix()
+        names: Optional[Tuple[str, ...]] = self._root_names.pop(root, None)
+        if names is None:
+            return
+        self.project_roots.remove(root)
+        for name in names:
+            self._project_names[name] -= 1
+            if not self._project_names[name]:
+                del self._project_names[name]
+
+    def classify(self, module_name: str) -> str:
+        name: str = module_name.partition(".")[0]
+        kind: str = self.modules.get(name, FIRST_PARTY)
+        if kind != STANDARD_LIBRARY and name in self._project_names:
+            return FIRST_PARTY
+        return kind
+
+    def is_standard(self, module_name: str) -> bool:
+        """'standard' in this project's sense: anything importable from the environment, i.e. not first-party."""
+        return self.classify(module_name) != FIRST_PARTY
+
+    def save(self, file_path: str | Path) -> None:
+        data: dict = {
+            "version": INDEX_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "project_roots": self.project_roots,
+            "modules": self.modules,
+        }
+        Path(file_path).write_text(dumps(data), encoding="utf-8")
+
+    @classmethod
+    def load(cls, file_path: str | Path) -> Optional["ModuleIndex"]:
+        """Return the persisted index, or None when it is missing, unreadable or was built for another environment."""
+        try:
+            data: dict = loads(Path(file_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_FORMAT_VERSION or data.get("fingerprint") != _environment_fingerprint():
+            return None
+        return cls(modules=data["modules"], fingerprint=data["fingerprint"], project_roots=data["project_roots"])
+
+
+def get_module_index() -> ModuleIndex:
+    """The process-wide index, built on first use."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = ModuleIndex.build()
+    return _INDEX
+
+
+def set_module_index(index: Optional[ModuleIndex]) -> None:
+    """Install an index (e.g. one returned by ModuleIndex.load()); None drops it so the next use rebuilds it."""
+    global _INDEX
+    _INDEX = index
+    from .imports import clear_classification_caches
+    clear_classification_caches()
+
+
+def register_project_root(root: str | Path) -> None:
+    """Add a root to the process-wide index for good, e.g. in a pool worker that only serves one scan."""
+    index: ModuleIndex = get_module_index()
+    count: int = len(index.project_roots)
+    index.add_project_root(root)
+    if len(index.project_roots) != count:
+        from .imports import clear_classification_caches
+        clear_classification_caches()
+
+
+def unregister_project_root(root: str | Path) -> None:
+    index: ModuleIndex = get_module_index()
+    count: int = len(index.project_roots)
+    index.remove_project_root(root)
+    if len(index.project_roots) != count:
+        from .imports import clear_classification_caches
+        clear_classification_caches()
+
+
+@contextmanager
+def project_root_scope(root: str | Path) -> Iterator[None]:
+    """
+    Classify as first-party the names of 'root' while the block runs, then restore the index, so classification
+    does not depend on which projects were scanned earlier in the process. Roots registered for good are left alone;
+    nested and concurrent scopes of the same root share one registration.
+    """
+    root = Path(root).as_posix()
+    with _SCOPE_LOCK:
+        scoped: bool = root in _SCOPED_ROOTS or root not in get_module_index().project_roots
+        if scoped:
+            _SCOPED_ROOTS[root] = _SCOPED_ROOTS.get(root, 0) + 1
+            register_project_root(root)
+    try:
+        yield
+    finally:
+        if scoped:
+            with _SCOPE_LOCK:
+                _SCOPED_ROOTS[root] -= 1
+                if not _SCOPED_ROOTS[root]:
+                    del _SCOPED_ROOTS[root]
+                    unregister_project_root(root)
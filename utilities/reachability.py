@@ -0,0 +1,145 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from .graph_analysis import index_edges, strongly_connected_component_ids
+
+
+def _bits_to_ids(bits: int) -> List[int]:
+    """Positions of the set bits, lowest first; linear in the bit length."""
+    digits: str = bin(bits)[:1:-1]
+    ids: List[int] = []
+    position: int = digits.find("1")
+    while position != -1:
+        ids.append(position)
+        position = digits.find("1", position + 1)
+    return ids
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure of a directed graph, computed lazily. Nodes are interned to integer ids and reachable sets
+    are Python ints used as bitsets. They are computed once per strongly connected component of the condensation,
+    which is a DAG, so a node's set is the union of its successor components' sets. Bitsets and the decoded answers
+    are memoised; build a new index when the graph changes.
+    """
+    __slots__ = ("names", "ids", "component_of", "member_bits", "cyclic", "successors", "predecessors", "_bits", "_answers")
+
+    def __init__(self, edges: Iterable[Tuple[Hashable, Hashable]], nodes: Iterable[Hashable] = ()) -> None:
+        names, adjacency = index_edges(edges)
+        ids: Dict[Hashable, int] = {name: position for position, name in enumerate(names)}
+        for node in nodes:
+            if node not in ids:
+                ids[node] = len(names)
+                names.append(node)
+                adjacency.append([])
+        self.__index(names, ids, adjacency)
+
+    @classmethod
+    def from_adjacency(cls, names: List[Hashable], adjacency: List[List[int]]) -> "ReachabilityIndex":
+        """Index a graph whose nodes are already interned: adjacency[i] lists the ids of the successors of names[i]."""
+        index: "ReachabilityIndex" = cls.__new__(cls)
+        index.__index(list(names), {name: position for position, name in enumerate(names)}, adjacency)
+        return index
+
+    def __index(self, names: List[Hashable], ids: Dict[Hashable, int], adjacency: List[List[int]]) -> None:
+        components: List[List[int]] = strongly_connected_component_ids(adjacency)
+        component_of: List[int] = [0] * len(names)
+        member_bits: List[int] = []
+        for number, component in enumerate(components):
+            bits: int = 0
+            for node in component:
+                component_of[node] = number
+                bits |= 1 << node
+            member_bits.append(bits)
+
+        successors: List[set] = [set() for _ in components]
+        predecessors: List[set] = [set() for _ in components]
+        cyclic: List[bool] = [len(component) > 1 for component in components]
+        for source, targets in enumerate(adjacency):
+            for target in targets:
+                source_component, target_component = component_of[source], component_of[target]
+                if source_component == target_component:
+                    cyclic[source_component] = cyclic[source_component] or source == target
+                    continue
+                successors[source_component].add(target_component)
+                predecessors[target_component].add(source_component)
+
+        self.names: List[Hashable] = names
+        self.ids: Dict[Hashable, int] = ids
+        self.component_of: List[int] = component_of
+        self.member_bits: List[int] = member_bits
+        self.cyclic: List[bool] = cyclic
+        self.successors: List[set] = successors
+        self.predecessors: List[set] = predecessors
+        self._bits: Dict[str, Dict[int, int]] = {"descendants": {}, "ancestors": {}}
+        self._answers: Dict[str, Dict[int, Tuple[Hashable, ...]]] = {"descendants": {}, "ancestors": {}}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, node: Hashable) -> bool:
+        return node in self.ids
+
+    def __component_bits(self, direction: str, component: int) -> int:
+        """Nodes reachable from every member of 'component' (members themselves only when it is cyclic)."""
+        memo: Dict[int, int] = self._bits[direction]
+        if component in memo:
+            return memo[component]
+        neighbours: List[set] = self.successors if direction == "descendants" else self.predecessors
+
+        # iterative post-order walk over the (acyclic) condensation, filling the memo bottom-up
+        stack: List[Tuple[int, bool]] = [(component, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in memo:
+                continue
+            if not expanded:
+                stack.append((current, True))
+                stack.extend((neighbour, False) for neighbour in neighbours[current] if neighbour not in memo)
+                continue
+            bits: int = self.member_bits[current] if self.cyclic[current] else 0
+            for neighbour in neighbours[current]:
+                bits |= memo[neighbour] | self.member_bits[neighbour]
+            memo[current] = bits
+        return memo[component]
+
+    def __query(self, direction: str, node: Hashable) -> Tuple[Hashable, ...]:
+        node_id: Optional[int] = self.ids.get(node)
+        if node_id is None:
+            return ()
+        answers: Dict[int, Tuple[Hashable, ...]] = self._answers[direction]
+        if node_id not in answers:
+            bits: int = self.__component_bits(direction, self.component_of[node_id]) & ~(1 << node_id)
+            answers[node_id] = tuple(sorted(self.names[position] for position in _bits_to_ids(bits)))
+        return answers[node_id]
+
+    def descendants(self, node: Hashable) -> Tuple[Hashable, ...]:
+        """Every node reachable from 'node', excluding itself, sorted; empty for unknown nodes."""
+        return self.__query("descendants", node)
+
+    def ancestors(self, node: Hashable) -> Tuple[Hashable, ...]:
+        """Every node that reaches 'node', excluding itself, sorted; empty for unknown nodes."""
+        return self.__query("ancestors", node)
+
+    def __union(self, direction: str, nodes: Iterable[Hashable]) -> Tuple[Hashable, ...]:
+        bits: int = 0
+        for node in nodes:
+            node_id: Optional[int] = self.ids.get(node)
+            if node_id is not None:
+                bits |= self.__component_bits(direction, self.component_of[node_id])
+        return tuple(sorted(self.names[position] for position in _bits_to_ids(bits)))
+
+    def descendants_of(self, nodes: Iterable[Hashable]) -> Tuple[Hashable, ...]:
+        """Union of descendants of several nodes, OR-ed as bitsets and decoded once; given nodes appear only when reachable."""
+        return self.__union("descendants", nodes)
+
+    def ancestors_of(self, nodes: Iterable[Hashable]) -> Tuple[Hashable, ...]:
+        """Union of ancestors of several nodes, OR-ed as bitsets and decoded once; given nodes appear only when they reach one another."""
+        return self.__union("ancestors", nodes)
+
+    def reaches(self, source: Hashable, target: Hashable) -> bool:
+        """Whether a (non-empty) path leads from 'source' to 'target'; a single bit test once memoised."""
+        if source not in self.ids or target not in self.ids:
+            return False
+        source_id, target_id = self.ids[source], self.ids[target]
+        if source_id == target_id:
+            return self.cyclic[self.component_of[source_id]]
+        return bool(self.__component_bits("descendants", self.component_of[source_id]) >> target_id & 1)
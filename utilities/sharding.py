@@ -0,0 +1,35 @@
+from hashlib import blake2b
+from typing import Dict, Iterable, List
+
+
+SHARD_STRATEGIES: List[str] = ["hash", "subtree"]
+
+
+def shard_key(relative_path: str, strategy: str = "hash", depth: int = 1) -> str:
+    """The part of a root-relative path that decides its shard: the whole path, or its first 'depth' components."""
+    if strategy not in SHARD_STRATEGIES:
+        raise ValueError(f"Unsupported shard strategy '{strategy}'. Options: {', '.join(SHARD_STRATEGIES)}.")
+    relative_path = relative_path.replace("\\", "/").strip("/")
+    if strategy == "subtree":
+        return "/".join(relative_path.split("/")[:max(depth, 1)])
+    return relative_path
+
+
+def shard_of(relative_path: str, shard_count: int, strategy: str = "hash", depth: int = 1) -> int:
+    """
+    Shard (0 .. shard_count - 1) of a root-relative path. Uses a blake2b digest rather than hash(), so
+    every machine and process assigns the same files to the same shard. With strategy="subtree", everything
+    below the same first 'depth' directories lands in one shard.
+    """
+    if shard_count < 1:
+        raise ValueError("shard_count must be at least 1.")
+    digest: bytes = blake2b(shard_key(relative_path, strategy, depth).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % shard_count
+
+
+def assign_shards(relative_paths: Iterable[str], shard_count: int, strategy: str = "hash", depth: int = 1) -> Dict[int, List[str]]:
+    """Paths grouped by shard, e.g. to check how evenly a strategy splits a tree before configuring the jobs."""
+    shards: Dict[int, List[str]] = {shard: [] for shard in range(shard_count)}
+    for path in relative_paths:
+        shards[shard_of(path, shard_count, strategy, depth)].append(path)
+    return shards
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SharedTaskRegistry:
+    """
+    In-flight asyncio tasks by key: callers asking for a key that is already running await the same task instead
+    of starting another one. A caller being cancelled only cancels the task once no other caller is waiting for it.
+    """
+    __slots__ = ("_tasks", "_waiters")
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Tuple[int, Hashable], asyncio.Task] = {}
+        self._waiters: Dict[Tuple[int, Hashable], int] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return (id(asyncio.get_running_loop()), key) in self._tasks
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __forget(self, key: Tuple[int, Hashable], task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            del self._waiters[key]
+
+    # ----------------
+    # public methods
+    # ----------------
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the task running for 'key' (tasks are per event loop), starting factory() when there is none."""
+        key = (id(asyncio.get_running_loop()), key)
+        task: asyncio.Task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda finished: self.__forget(key, finished))
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters.get(key) == 1:
+                task.cancel()
+            raise
+        finally:
+            if key in self._waiters and self._tasks[key] is task:
+                self._waiters[key] -= 1
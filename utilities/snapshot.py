@@ -0,0 +1,391 @@
+from collections.abc import MutableMapping
+from hashlib import blake2b
+from json import dumps, loads
+from pathlib import Path
+from os import replace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from utilities.import_store import iter_entries
+from numpy import (
+    ndarray, argsort, array, bincount, concatenate, cumsum, empty, frombuffer, int32, int64, lexsort, memmap,
+    searchsorted, uint8, uint64, unique, zeros
+)
+
+
+SNAPSHOT_MAGIC: bytes = b"MDSNAP\x00\x01"
+SNAPSHOT_VERSION: int = 2
+IMPORT_TYPES: Tuple[str, str] = ("standard", "custom")
+
+# columns of the 'records' section; one row per imported name (module -1: plain import of the library)
+FILE, TYPE, LIBRARY, MODULE, GROUP = range(5)
+_ALIGNMENT: int = 8
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _offsets(keys: ndarray, count: int) -> ndarray:
+    """CSR offsets of rows grouped by 'keys' (sorted ids below 'count'): rows of id i are offsets[i]:offsets[i + 1]."""
+    return concatenate(([0], cumsum(bincount(keys, minlength=count)))).astype(int64)
+
+
+def _inverted(rows: ndarray, distinct: bool) -> Tuple[ndarray, ndarray, ndarray]:
+    """(keys, offsets, postings) of rows keyed on their first column, an inverted index in CSR form; postings are sorted."""
+    rows = rows[lexsort(rows.T[::-1])]
+    if distinct and len(rows):
+        rows = rows[concatenate(([True], (rows[1:] != rows[:-1]).any(axis=1)))]
+    keys, counts = unique(rows[:, 0], return_counts=True)
+    return keys.astype(int32), concatenate(([0], cumsum(counts))).astype(int64), rows[:, 1:]
+
+
+def record_digest(data: dict) -> int:
+    """64-bit digest of one file's import records; equal records give equal digests across snapshots."""
+    return int.from_bytes(blake2b(dumps(data, sort_keys=True).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class _StringTable:
+    """Collects strings while records are flattened, then assigns ids in sorted order."""
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, int] = {}
+
+    def add(self, value: str) -> str:
+        self.strings.setdefault(value, 0)
+        return value
+
+    def finish(self) -> Tuple[List[str], Dict[str, int]]:
+        ordered: List[str] = sorted(self.strings)
+        return ordered, {value: position for position, value in enumerate(ordered)}
+
+
+def _flatten_records(imports: dict, table: _StringTable) -> Iterator[Tuple[int, int, str, Optional[str], int]]:
+    """
+    (file index, type, library, module, group) rows. Nested name lists (e.g. 'import a, b' groups) keep their position
+    in 'group'; list forms ({"standard": ["os"]}) are stored as libraries without names.
+    """
+    for file_index, path in enumerate(imports):
+        for type_index, import_type in enumerate(IMPORT_TYPES):
+            for library, names in iter_entries(imports, path, import_type):
+                table.add(library)
+                if not names:
+                    yield file_index, type_index, library, None, -1
+                    continue
+                for name in names:
+                    if isinstance(name, list):
+                        for position, member in enumerate(name):
+                            yield file_index, type_index, library, table.add(str(member)), position
+                    else:
+                        yield file_index, type_index, library, table.add(str(name)), -1
+
+
+def write_snapshot(
+        file_path: str | Path,
+        imports: dict,
+        import_statements: Optional[dict] = None,
+        file_dependencies: Optional[dict] = None,
+        file_states: Optional[dict] = None,
+        metadata: Optional[dict] = None
+    ) -> None:
+    """
+    Write a scan as one binary file: magic, a small JSON header with the section table, then 8-byte aligned
+    sections - a sorted, de-duplicated string table (offsets + UTF-8 blob), int32/int64 record arrays with per-file
+    offsets, the inverted library and name indexes and the file dependency graph as CSR arrays. The file is written next to its destination and moved into place, so readers never see a partial snapshot.
+    """
+    import_statements, file_dependencies, file_states = import_statements or {}, file_dependencies or {}, file_states or {}
+    table = _StringTable()
+    paths: List[str] = [table.add(path) for path in imports]
+    rows: List[Tuple[int, int, str, Optional[str], int]] = list(_flatten_records(imports, table))
+    statements: List[Tuple[int, str]] = [
+        (file_index, table.add(statement))
+        for file_index, path in enumerate(paths) for statement in import_statements.get(path) or []
+    ]
+    strings, ids = table.finish()
+    file_ids: Dict[str, int] = {path: position for position, path in enumerate(paths)}
+
+    encoded: List[bytes] = [value.encode("utf-8") for value in strings]
+    records: ndarray = array(
+        [(file, kind, ids[library], ids[module] if module is not None else -1, group) for file, kind, library, module, group in rows],
+        dtype=int32,
+    ).reshape(-1, 5)
+    statement_rows: ndarray = array([(file, ids[statement]) for file, statement in statements], dtype=int32).reshape(-1, 2)
+    dependencies: ndarray = array(
+        [(file_ids[path], file_ids[target]) for path, targets in file_dependencies.items() if path in file_ids
+         for target in targets if target in file_ids],
+        dtype=int32,
+    ).reshape(-1, 2)
+    dependencies = dependencies[argsort(dependencies[:, 0], kind="stable")]
+    # one library posting per (file, import type), one name posting per occurrence, as ImportIndexModel counts them
+    library_keys, library_offsets, library_postings = _inverted(records[:, [LIBRARY, FILE, TYPE]], distinct=True)
+    module_keys, module_offsets, module_postings = _inverted(records[records[:, MODULE] >= 0][:, [MODULE, FILE, TYPE]], distinct=False)
+
+    sections: Dict[str, ndarray] = {
+        "string_offsets": concatenate(([0], cumsum([len(value) for value in encoded], dtype=int64))).astype(int64),
+        "string_data": frombuffer(b"".join(encoded), dtype=uint8),
+        "files": array([ids[path] for path in paths], dtype=int32),
+        "file_states": array([file_states.get(path) or (-1, -1) for path in paths], dtype=int64).reshape(-1, 2),
+        "record_digests": array([record_digest(imports[path]) for path in paths], dtype=uint64),
+        "records": records,
+        "record_offsets": _offsets(records[:, FILE], len(paths)),
+        "statements": statement_rows,
+        "statement_offsets": _offsets(statement_rows[:, 0], len(paths)),
+        "library_keys": library_keys,
+        "library_offsets": library_offsets,
+        "library_postings": library_postings,
+        "module_keys": module_keys,
+        "module_offsets": module_offsets,
+        "module_postings": module_postings,
+        # (source, target) rows grouped by source: with the offsets, the file dependency graph in CSR form
+        "dependencies": dependencies,
+        "dependency_offsets": _offsets(dependencies[:, 0], len(paths)),
+    }
+
+    layout: Dict[str, dict] = {}
+    header: dict = {"version": SNAPSHOT_VERSION, "metadata": metadata or {}, "sections": layout}
+    # the header size depends on the offsets it lists, so reserve room for the largest offsets first
+    for name, section in sections.items():
+        layout[name] = {"offset": 10 ** 15, "dtype": section.dtype.str, "shape": list(section.shape)}
+    start: int = _align(len(SNAPSHOT_MAGIC) + 8 + len(dumps(header).encode("utf-8")))
+    offset: int = start
+    for name, section in sections.items():
+        layout[name]["offset"] = offset
+        offset = _align(offset + section.nbytes)
+    header_bytes: bytes = dumps(header).encode("utf-8")
+
+    temporary: Path = Path(f"{file_path}.tmp")
+    with open(temporary, "wb") as file:
+        file.write(SNAPSHOT_MAGIC)
+        file.write(len(header_bytes).to_bytes(8, "little"))
+        file.write(header_bytes)
+        for name, section in sections.items():
+            file.write(b"\x00" * (layout[name]["offset"] - file.tell()))
+            file.write(section.tobytes())
+    replace(temporary, file_path)
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file. Opening it memory-maps the file and reads only the header, so it is cheap
+    regardless of size and the pages are shared between processes through the page cache. Strings are decoded on
+    demand; lookups by value binary-search the sorted string table, and a file's records, statements and
+    dependencies are sliced out of the arrays by their offsets, so reading one file touches only its own rows.
+    """
+    __slots__ = ("path", "metadata", "sections", "_buffer", "_strings", "_paths", "_file_ids")
+
+    def __init__(self, file_path: str | Path) -> None:
+        self.path: Path = Path(file_path)
+        self._buffer: memmap = memmap(self.path, dtype=uint8, mode="r")
+        if bytes(self._buffer[:len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{self.path} is not a dependency snapshot.")
+        length: int = int.from_bytes(bytes(self._buffer[len(SNAPSHOT_MAGIC):len(SNAPSHOT_MAGIC) + 8]), "little")
+        start: int = len(SNAPSHOT_MAGIC) + 8
+        header: dict = loads(bytes(self._buffer[start:start + length]).decode("utf-8"))
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {header.get('version')} in {self.path}.")
+
+        self.metadata: dict = header["metadata"]
+        self.sections: Dict[str, ndarray] = {}
+        for name, section in header["sections"].items():
+            count: int = 1
+            for size in section["shape"]:
+                count *= size
+            itemsize: int = empty(0, dtype=section["dtype"]).itemsize
+            raw: ndarray = self._buffer[section["offset"]:section["offset"] + count * itemsize]
+            self.sections[name] = raw.view(section["dtype"]).reshape(section["shape"])
+        self._strings: Optional[List[str]] = None
+        self._paths: Optional[List[str]] = None
+        self._file_ids: Optional[Dict[str, int]] = None
+
+    # -------------------
+    # protected methods
+    # -------------------
+    def __rows(self, section: str, offsets_section: str, file_index: int) -> List[list]:
+        offsets: ndarray = self.sections[offsets_section]
+        return self.sections[section][offsets[file_index]:offsets[file_index + 1]].tolist()
+
+    @staticmethod
+    def __decode_records(rows: Iterable[list], strings: Callable[[int], str]) -> dict:
+        data: dict = {"standard": {}, "custom": {}}
+        for _, kind, library, module, group in rows:
+            names: list = data[IMPORT_TYPES[kind]].setdefault(strings(library), [])
+            if module == -1:
+                continue
+            if group == -1:
+                names.append(strings(module))
+            elif group == 0:
+                names.append([strings(module)])
+            else:
+                names[-1].append(strings(module))
+        return data
+
+    # -------------------
+    # strings
+    # -------------------
+    def string_count(self) -> int:
+        return len(self.sections["string_offsets"]) - 1
+
+    def string(self, string_id: int) -> str:
+        offsets: ndarray = self.sections["string_offsets"]
+        return bytes(self.sections["string_data"][offsets[string_id]:offsets[string_id + 1]]).decode("utf-8")
+
+    def strings(self) -> List[str]:
+        """Every string, decoded once and cached."""
+        if self._strings is None:
+            data: bytes = bytes(self.sections["string_data"])
+            offsets: List[int] = self.sections["string_offsets"].tolist()
+            self._strings = [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+        return self._strings
+
+    def string_position(self, value: str) -> int:
+        """Id of the first string not sorting before 'value' (the string count if there is none); O(log n) decodes."""
+        encoded: bytes = value.encode("utf-8")
+        low, high = 0, self.string_count()
+        while low < high:
+            middle: int = (low + high) // 2
+            if self.string(middle).encode("utf-8") < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def string_id(self, value: str) -> Optional[int]:
+        """Id of 'value' in the sorted string table, or None."""
+        position: int = self.string_position(value)
+        if position < self.string_count() and self.string(position) == value:
+            return position
+        return None
+
+    # -------------------
+    # records
+    # -------------------
+    def paths(self) -> List[str]:
+        """Scanned paths in file index order, decoded once and cached; no other string is decoded."""
+        if self._paths is None:
+            data: bytes = bytes(self.sections["string_data"])
+            offsets: ndarray = self.sections["string_offsets"]
+            files: ndarray = self.sections["files"]
+            self._paths = [
+                data[start:end].decode("utf-8") for start, end in zip(offsets[files].tolist(), offsets[files + 1].tolist())
+            ]
+        return self._paths
+
+    def file_index(self, path: str) -> Optional[int]:
+        if self._file_ids is None:
+            self._file_ids = dict(zip(self.paths(), range(len(self.paths()))))
+        return self._file_ids.get(path)
+
+    def record(self, file_index: int) -> dict:
+        """Imports of one file, as in imports(), decoded from its own rows only."""
+        return self.__decode_records(self.__rows("records", "record_offsets", file_index), self.string)
+
+    def statements_of(self, file_index: int) -> List[str]:
+        return [self.string(statement) for _, statement in self.__rows("statements", "statement_offsets", file_index)]
+
+    def dependencies_of(self, file_index: int) -> List[str]:
+        paths: List[str] = self.paths()
+        return [paths[target] for _, target in self.__rows("dependencies", "dependency_offsets", file_index)]
+
+    def dependency_lists(self) -> List[List[int]]:
+        """Successor file indices of every file, sliced from the stored CSR arrays."""
+        targets: List[int] = self.sections["dependencies"][:, 1].tolist()
+        offsets: List[int] = self.sections["dependency_offsets"].tolist()
+        return [targets[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    def keys(self, kind: str, prefix: Optional[str] = "") -> Iterator[str]:
+        """Indexed libraries (kind 'library') or imported names ('module') starting with 'prefix', in sorted order."""
+        keys: ndarray = self.sections[f"{kind}_keys"]
+        for string_id in keys[searchsorted(keys, self.string_position(prefix)):]:
+            value: str = self.string(int(string_id))
+            if not value.startswith(prefix):
+                return
+            yield value
+
+    def postings(self, kind: str, value: str) -> ndarray:
+        """(file index, import type index) rows of one library or imported name, from the stored inverted index."""
+        string_id: Optional[int] = self.string_id(value)
+        keys: ndarray = self.sections[f"{kind}_keys"]
+        position: int = int(searchsorted(keys, string_id)) if string_id is not None else len(keys)
+        if position == len(keys) or keys[position] != string_id:
+            return empty((0, 2), dtype=int32)
+        offsets: ndarray = self.sections[f"{kind}_offsets"]
+        return self.sections[f"{kind}_postings"][offsets[position]:offsets[position + 1]]
+
+    def files_with_library(self, library: str) -> List[str]:
+        """Files importing 'library', answered from the inverted index without materialising anything else."""
+        files: ndarray = self.sections["files"]
+        return [self.string(int(files[index])) for index in dict.fromkeys(self.postings("library", library)[:, 0].tolist())]
+
+    def imports(self) -> dict:
+        """Rebuild DependencyModel.imports: path -> {"standard": {library: [names]}, "custom": {...}}."""
+        strings: List[str] = self.strings()
+        rows: List[list] = self.sections["records"].tolist()
+        offsets: List[int] = self.sections["record_offsets"].tolist()
+        return {
+            path: self.__decode_records(rows[offsets[i]:offsets[i + 1]], strings.__getitem__)
+            for i, path in enumerate(self.paths())
+        }
+
+    def import_statements(self) -> dict:
+        strings: List[str] = self.strings()
+        paths: List[str] = self.paths()
+        statements: dict = {path: [] for path in paths}
+        for file, statement in self.sections["statements"].tolist():
+            statements[paths[file]].append(strings[statement])
+        return statements
+
+    def file_dependencies(self) -> dict:
+        paths: List[str] = self.paths()
+        dependencies: dict = {}
+        for file, target in self.sections["dependencies"].tolist():
+            dependencies.setdefault(paths[file], []).append(paths[target])
+        return {path: dependencies.get(path, []) for path in paths} if dependencies else {}
+
+    def file_states(self) -> dict:
+        states: ndarray = self.sections["file_states"]
+        return {
+            path: (state if state[0] >= 0 else None)
+            for path, state in zip(self.paths(), zip(states[:, 0].tolist(), states[:, 1].tolist()))
+        }
+
+    def record_digests(self) -> Dict[str, int]:
+        return dict(zip(self.paths(), self.sections["record_digests"].tolist()))
+
+    def close(self) -> None:
+        self.sections = {}
+        self._buffer = zeros(0, dtype=uint8)
+
+
+class SnapshotMapping(MutableMapping):
+    """
+    Path -> value mapping whose values are read from a snapshot by file index on first access, e.g.
+    SnapshotMapping(snapshot.paths(), snapshot.statements_of); afterwards it behaves like a dict. Values are never
+    ints, so a pending value is simply the file index it will be read from.
+    """
+    __slots__ = ("_values", "_load")
+
+    def __init__(self, paths: Sequence[str], load: Callable[[int], Any]) -> None:
+        self._values: Dict[str, Any] = dict(zip(paths, range(len(paths))))
+        self._load: Callable[[int], Any] = load
+
+    def __getitem__(self, path: str) -> Any:
+        value: Any = self._values[path]
+        if type(value) is int:
+            value = self._values[path] = self._load(value)
+        return value
+
+    def __setitem__(self, path: str, value: Any) -> None:
+        self._values[path] = value
+
+    def __delitem__(self, path: str) -> None:
+        del self._values[path]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._values)} files)"
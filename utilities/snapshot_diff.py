@@ -0,0 +1,96 @@
+from typing import Dict, List, Set, Tuple
+from numpy import ndarray, array, isin, unique, int32
+from .snapshot import Snapshot, IMPORT_TYPES, FILE, TYPE, LIBRARY
+from .graph_analysis import find_cycles
+from .module_index import THIRD_PARTY, project_root_scope
+from .imports import classify_module_kind
+
+
+def _relative_paths(snapshot: Snapshot) -> List[str]:
+    """Paths relative to the snapshot's root directory, so scans of different checkouts match file by file."""
+    root: str = str(snapshot.metadata.get("root_directory") or ".").replace("\\", "/")
+    prefix: str = "" if root == "." else f"{root.rstrip('/')}/"
+    return [path[len(prefix):] if path.startswith(prefix) else path for path in snapshot.paths()]
+
+
+def _file_indices(files: List[str], paths: Set[str]) -> ndarray:
+    return array([position for position, path in enumerate(files) if path in paths], dtype=int32)
+
+
+def _edges_of(snapshot: Snapshot, files: List[str], paths: Set[str]) -> Set[Tuple[str, str, str]]:
+    """(file, library, import type) edges of the given files only, taken from the record array."""
+    if not paths:
+        return set()
+    records: ndarray = snapshot.sections["records"]
+    selected: ndarray = records[isin(records[:, FILE], _file_indices(files, paths))][:, [FILE, LIBRARY, TYPE]]
+    if not len(selected):
+        return set()
+    return {
+        (files[file], snapshot.string(library), IMPORT_TYPES[kind])
+        for file, library, kind in unique(selected, axis=0).tolist()
+    }
+
+
+def _dependencies_of(snapshot: Snapshot, files: List[str], paths: Set[str]) -> Set[Tuple[str, str]]:
+    """File-to-file edges from or to the given files: a changed file also changes how others resolve onto it."""
+    if not paths:
+        return set()
+    dependencies: ndarray = snapshot.sections["dependencies"]
+    indices: ndarray = _file_indices(files, paths)
+    selected: ndarray = dependencies[isin(dependencies[:, 0], indices) | isin(dependencies[:, 1], indices)]
+    return {(files[source], files[target]) for source, target in selected.tolist()}
+
+
+def _libraries(snapshot: Snapshot) -> Set[str]:
+    return {snapshot.string(library) for library in unique(snapshot.sections["records"][:, LIBRARY]).tolist()}
+
+
+def _all_dependencies(snapshot: Snapshot, files: List[str]) -> List[Tuple[str, str]]:
+    return [(files[source], files[target]) for source, target in snapshot.sections["dependencies"].tolist()]
+
+
+def diff_snapshots(base: Snapshot, head: Snapshot) -> dict:
+    """
+    Compare two scans. Files are matched by their path relative to each snapshot's root directory, which is also
+    how they are reported, so checkouts in different directories compare cleanly. They are compared by their
+    record digests first, so only files whose import records changed are decoded; edges of those files are read
+    from the record arrays, and file dependencies from or to them are compared. Libraries are compared as sets of
+    string-table entries, and cycles are searched once (linear time) in the head's file graph, keeping the
+    components that did not exist in the base and contain a changed file.
+    """
+    base_files, head_files = _relative_paths(base), _relative_paths(head)
+    base_digests: Dict[str, int] = dict(zip(base_files, base.record_digests().values()))
+    head_digests: Dict[str, int] = dict(zip(head_files, head.record_digests().values()))
+    added_files: List[str] = sorted(path for path in head_digests if path not in base_digests)
+    removed_files: List[str] = sorted(path for path in base_digests if path not in head_digests)
+    modified_files: List[str] = sorted(
+        path for path, digest in head_digests.items() if path in base_digests and base_digests[path] != digest
+    )
+
+    changed: Set[str] = set(added_files) | set(removed_files) | set(modified_files)
+    base_edges, head_edges = _edges_of(base, base_files, changed), _edges_of(head, head_files, changed)
+    base_dependencies: Set[Tuple[str, str]] = _dependencies_of(base, base_files, changed)
+    head_dependencies: Set[Tuple[str, str]] = _dependencies_of(head, head_files, changed)
+
+    new_libraries: List[str] = sorted(_libraries(head) - _libraries(base))
+    with project_root_scope(head.metadata.get("root_directory") or "."):
+        new_third_party: List[str] = [library for library in new_libraries if classify_module_kind(library) == THIRD_PARTY]
+
+    base_components: Set[frozenset] = {frozenset(cycle["component"]) for cycle in find_cycles(_all_dependencies(base, base_files))}
+    new_cycles: List[dict] = [
+        cycle for cycle in find_cycles(_all_dependencies(head, head_files))
+        if frozenset(cycle["component"]) not in base_components and changed.intersection(cycle["component"])
+    ]
+
+    return {
+        "added_files": added_files,
+        "removed_files": removed_files,
+        "modified_files": modified_files,
+        "added_edges": sorted(head_edges - base_edges),
+        "removed_edges": sorted(base_edges - head_edges),
+        "added_dependencies": sorted(head_dependencies - base_dependencies),
+        "removed_dependencies": sorted(base_dependencies - head_dependencies),
+        "new_libraries": new_libraries,
+        "new_third_party_libraries": new_third_party,
+        "new_cycles": new_cycles,
+    }
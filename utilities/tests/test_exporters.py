@@ -0,0 +1,70 @@
+import csv
+import gzip
+import json
+import pytest
+from networkx import read_graphml
+from ..exporters import detect_format, write_edges, write_records
+
+
+EDGES = [("a.py", "os"), ("a.py", 'quote"d'), ("b & c.py", "a.py")]
+
+
+@pytest.mark.parametrize("file_name, export_format, expected", [
+    ("edges.jsonl", None, ("jsonl", False)),
+    ("edges.csv.gz", None, ("csv", True)),
+    ("edges.GV", None, ("dot", False)),
+    ("edges.graphml.gz", None, ("graphml", True)),
+    ("edges", None, ("jsonl", False)),
+    ("edges.txt", "CSV", ("csv", False)),
+])
+def test_detect_format(file_name, export_format, expected):
+    assert detect_format(file_name, export_format) == expected
+
+
+def read_text(path) -> str:
+    return gzip.open(path, "rt", encoding="utf-8").read() if str(path).endswith(".gz") else path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("file_name", ["edges.jsonl", "edges.jsonl.gz"])
+def test_jsonl(tmp_path, file_name):
+    assert write_edges(iter(EDGES), tmp_path / file_name) == 3
+    rows = [json.loads(line) for line in read_text(tmp_path / file_name).splitlines()]
+    assert rows == [{"source": source, "target": target} for source, target in EDGES]
+
+
+@pytest.mark.parametrize("file_name", ["edges.csv", "edges.csv.gz"])
+def test_csv(tmp_path, file_name):
+    write_edges(iter(EDGES), tmp_path / file_name)
+    assert list(csv.reader(read_text(tmp_path / file_name).splitlines())) == [["source", "target"]] + [list(edge) for edge in EDGES]
+
+
+def test_dot(tmp_path):
+    write_edges(iter(EDGES), tmp_path / "edges.dot")
+    text = read_text(tmp_path / "edges.dot")
+    assert text.startswith("digraph imports {\n") and text.endswith("}\n")
+    assert '  "a.py" -> "quote\\"d";\n' in text
+
+
+def test_graphml_is_readable(tmp_path):
+    write_edges(iter(EDGES), tmp_path / "edges.graphml")
+    graph = read_graphml(tmp_path / "edges.graphml")
+    assert sorted(graph.edges) == sorted(EDGES)
+    assert graph.number_of_nodes() == 4
+
+
+def test_unsupported_formats(tmp_path):
+    with pytest.raises(ValueError):
+        write_edges(EDGES, tmp_path / "edges.xml", export_format="xml")
+    with pytest.raises(ValueError):
+        write_records([], tmp_path / "records.dot")
+
+
+@pytest.mark.parametrize("file_name", ["records.jsonl", "records.csv.gz"])
+def test_records(tmp_path, file_name):
+    records = [{"file": "a.py", "type": "standard", "library": "os", "module": "path"}]
+    assert write_records(iter(records), tmp_path / file_name) == 1
+    text = read_text(tmp_path / file_name)
+    if "csv" in file_name:
+        assert list(csv.DictReader(text.splitlines())) == records
+    else:
+        assert json.loads(text) == records[0]
@@ -0,0 +1,46 @@
+import pytest
+from ..extraction import ImportStatement, extract_import_statements, parse_import_statements
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('import os', ['import os']),
+    ('import numpy as np, sys', ['import numpy', 'import sys']),
+    ('from os import path as p', ['from os import path']),
+    ('from ..graph_model import GraphModel', ['from ..graph_model import GraphModel']),
+    ('from . import utils', ['from . import utils']),
+    ('from typing import (\n    List,\n    Optional as Opt,\n)', ['from typing import List, Optional']),
+    ('from os \\\n    import sep', ['from os import sep']),
+    ('x = "import os"\n# import sys', []),
+    ('', []),
+])
+def test_extract_import_statements(source, expected):
+    assert [record.statement for record in extract_import_statements(source)] == expected
+
+
+def test_nested_imports_are_ordered_by_line():
+    source: str = "import os\n\ndef run():\n    import json\n\nclass A:\n    from sys import path\n"
+    assert extract_import_statements(source) == [
+        ImportStatement(1, "import os"),
+        ImportStatement(4, "import json"),
+        ImportStatement(7, "from sys import path"),
+    ]
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('import os\nprint "legacy"\nfrom sys import (\n    path,\n)\n', [(1, 'import os'), (3, 'from sys import path')]),
+    ('import os\ndef broken(:\n    import json\n', [(1, 'import os'), (3, 'import json')]),
+    ('from x import y\n    import z\n', [(1, 'from x import y'), (2, 'import z')]),
+])
+def test_tolerant_fallback(source, expected):
+    assert [tuple(record) for record in extract_import_statements(source)] == expected
+
+
+@pytest.mark.parametrize("source, expected", [
+    ("", True),
+    ("import os\n", True),
+    ("import os\ndef broken(:\n", False),
+])
+def test_parse_import_statements_reports_fallback(source, expected):
+    records, parsed = parse_import_statements(source)
+    assert parsed == expected
+    assert records == extract_import_statements(source)
@@ -0,0 +1,46 @@
+import sys
+import pytest
+from ..graph_analysis import find_cycles, shortest_cycle, index_edges, strongly_connected_components
+
+
+@pytest.mark.parametrize("edges, expected", [
+    ([("a", "b"), ("b", "c")], [["c"], ["b"], ["a"]]),
+    ([("a", "b"), ("b", "a"), ("b", "c")], [["c"], ["a", "b"]]),
+    ([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "d")], [["d", "e"], ["a", "b", "c"]]),
+    ([], []),
+])
+def test_strongly_connected_components(edges, expected):
+    assert strongly_connected_components(edges) == expected
+
+
+def test_find_cycles_reports_smallest_cycle_per_component():
+    edges = [("a", "b"), ("b", "c"), ("c", "d"), ("d", "a"), ("c", "a"), ("x", "y"), ("y", "x"), ("z", "z"), ("q", "a")]
+    assert find_cycles(edges) == [
+        {"component": ["a", "b", "c", "d"], "shortest_cycle": ["a", "b", "c", "a"]},
+        {"component": ["x", "y"], "shortest_cycle": ["x", "y", "x"]},
+        {"component": ["z"], "shortest_cycle": ["z", "z"]},
+    ]
+
+
+def test_shortest_cycle_is_minimal():
+    names, successors = index_edges([(i, i + 1) for i in range(10)] + [(10, 0), (6, 3)])
+    members = list(range(len(names)))
+    cycle = shortest_cycle(members, successors)
+    assert [names[node] for node in cycle] == [3, 4, 5, 6, 3]
+
+
+def test_deep_graph_does_not_hit_recursion_limit():
+    size: int = sys.getrecursionlimit() * 20
+    edges = [(i, i + 1) for i in range(size)] + [(size, 0)]
+    cycles = find_cycles(edges)
+    assert len(cycles) == 1
+    assert len(cycles[0]["component"]) == size + 1
+    assert len(cycles[0]["shortest_cycle"]) == size + 2
+
+
+def test_large_graph_with_many_edges():
+    size: int = 50000
+    edges = [(i, (i * 7 + 1) % size) for i in range(size)] + [(i, (i + 3) % size) for i in range(size)]
+    edges += [(i, i + size) for i in range(size)]
+    cycles = find_cycles(edges)
+    assert sum(len(cycle["component"]) for cycle in cycles) == size
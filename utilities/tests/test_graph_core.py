@@ -0,0 +1,107 @@
+import random
+import tracemalloc
+import pytest
+from networkx import DiGraph
+from ..graph_core import GraphCore
+
+
+EDGES = [("a.py", "os"), ("b.py", "a.py"), ("a.py", "json"), ("b.py", "os"), ("a.py", "os"), ("c.py", "c.py")]
+
+
+def networkx_graph(edges) -> DiGraph:
+    graph = DiGraph()
+    graph.add_edges_from(edges)
+    return graph
+
+
+def test_matches_networkx_order():
+    core, graph = GraphCore(EDGES), networkx_graph(EDGES)
+    assert core.names == list(graph.nodes)
+    assert core.edge_list() == list(graph.edges)
+    assert core.number_of_edges() == graph.number_of_edges() == 5
+
+
+@pytest.mark.parametrize("source, target, expected", [
+    ("a.py", "os", True),
+    ("os", "a.py", False),
+    ("c.py", "c.py", True),
+    ("missing", "os", False),
+])
+def test_has_edge(source, target, expected):
+    assert GraphCore(EDGES).has_edge(source, target) == expected
+
+
+def test_forward_and_reverse_traversal():
+    core = GraphCore(EDGES)
+    assert core.successors("a.py") == ["os", "json"]
+    assert core.predecessors("os") == ["a.py", "b.py"]
+    assert core.degree("a.py") == 3
+    assert core.successors("os") == []
+
+
+@pytest.mark.parametrize("added, removed", [
+    ([("d.py", "os")], []),
+    ([], [("a.py", "json")]),
+    ([("a.py", "json")], [("a.py", "json"), ("b.py", "os")]),
+    ([("b.py", "re")], [("b.py", "a.py"), ("b.py", "os"), ("missing", "os")]),
+])
+def test_update_matches_networkx(added, removed):
+    core, graph = GraphCore(EDGES), networkx_graph(EDGES)
+    core.update(added=added, removed=removed)
+
+    graph.remove_edges_from(removed)
+    graph.add_edges_from(added)
+    graph.remove_nodes_from({node for edge in removed for node in edge if node in graph and graph.degree(node) == 0})
+
+    assert core.names == list(graph.nodes)
+    assert core.edge_list() == list(graph.edges)
+    assert all(core.ids[name] == position for position, name in enumerate(core.names))
+    assert sorted(core.predecessors("os")) == sorted(graph.predecessors("os"))
+
+
+def test_patched_arrays_equal_a_full_index():
+    generator = random.Random(3)
+    nodes = [f"n{index}" for index in range(40)]
+    edges = [(generator.choice(nodes), generator.choice(nodes)) for _ in range(200)]
+    core, graph = GraphCore(edges), networkx_graph(edges)
+    for _ in range(50):
+        present = core.edge_list()
+        removed = generator.sample(present, min(len(present), generator.randrange(6))) + [("n0", "missing")]
+        added = [(generator.choice(nodes), generator.choice(nodes + ["new"])) for _ in range(generator.randrange(6))]
+        applied_added, applied_removed = core.update(added=added, removed=removed)
+
+        graph.remove_edges_from(removed)
+        assert sorted(applied_removed) == sorted(edge for edge in set(removed) if edge in present)
+        assert applied_added == [edge for edge in dict.fromkeys(added) if not graph.has_edge(*edge)]
+        graph.add_edges_from(added)
+        graph.remove_nodes_from({node for edge in removed for node in edge if node in graph and graph.degree(node) == 0})
+
+        rebuilt = GraphCore(core.edge_list(), nodes=core.names)
+        assert core.names == list(graph.nodes) and core.edge_list() == list(graph.edges)
+        assert core.ids == rebuilt.ids
+        for name in ("targets", "out_indptr", "in_indptr", "in_indices"):
+            assert getattr(core, name).tolist() == getattr(rebuilt, name).tolist()
+
+
+def test_to_networkx():
+    graph = GraphCore(EDGES, nodes=["isolated"]).to_networkx()
+    assert isinstance(graph, DiGraph)
+    assert "isolated" in graph
+    assert list(graph.edges) == GraphCore(EDGES).edge_list()
+
+
+def test_memory_per_edge_is_an_order_of_magnitude_below_networkx():
+    generator = random.Random(0)
+    edges = [(f"file_{generator.randrange(1000)}.py", f"module_{generator.randrange(1000)}") for _ in range(200000)]
+    networkx_graph([("warm", "up")])
+
+    def allocated(build) -> int:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        graph = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        del graph
+        return used
+
+    assert allocated(lambda: networkx_graph(edges)) > 10 * allocated(lambda: GraphCore(edges))
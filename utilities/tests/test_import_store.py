@@ -0,0 +1,106 @@
+import copy
+import pickle
+import pytest
+from ..import_store import ImportStore
+
+
+RECORDS = {
+    "a.py": {"custom": {"models": ["GraphModel", ["A", "B"]]}, "standard": {"os": [], "json": ["dumps", "loads"]}},
+    "b.py": {"standard": {"os": [], "json": ["dumps", "loads"]}, "custom": {}},
+    "c.py": {"standard": ["os"], "custom": ["custom_module"]},
+    "d.py": {"standard": [], "custom": []},
+}
+
+
+def test_round_trip_keeps_shape_and_order():
+    store = ImportStore(RECORDS)
+    assert store == RECORDS
+    assert len(store) == 4 and list(store) == list(RECORDS)
+    for path, data in RECORDS.items():
+        assert list(store[path]) == list(data)
+        assert store[path] == data
+    assert store.get("missing.py", {}) == {}
+
+
+def test_changes_made_in_place_are_written_back():
+    store = ImportStore(RECORDS)
+    generation, data = store.generation(), store["a.py"]
+    data["standard"]["os"].append("path")
+    data["standard"]["re"] = []
+    data["standard"]["re"].append("compile")
+    del data["custom"]
+    assert store["a.py"] == {"standard": {"os": ["path"], "json": ["dumps", "loads"], "re": ["compile"]}}
+    assert RECORDS["a.py"]["standard"]["os"] == [] and store.generation() == generation + 4
+    assert pickle.loads(pickle.dumps(data)) == data and type(copy.deepcopy(data)["standard"]) is dict
+
+
+def test_changes_to_reassigned_paths_are_dropped():
+    store = ImportStore(RECORDS)
+    data = store["b.py"]
+    store["b.py"] = RECORDS["d.py"]
+    data["standard"]["os"].append("path")
+    del store["b.py"]
+    data["custom"]["models"] = []
+    assert "b.py" not in store and store == {path: RECORDS[path] for path in ("a.py", "c.py", "d.py")}
+
+
+def test_writes_advance_the_generation():
+    store = ImportStore.deferred(list(RECORDS), lambda position: list(RECORDS.values())[position])
+    assert store.generation() == 0
+    store["a.py"], store.compact()
+    assert store.generation() == 0
+    store["a.py"] = RECORDS["b.py"]
+    del store["b.py"]
+    assert store.generation() == 2
+
+
+def test_repeated_imports_are_shared():
+    store = ImportStore({"a.py": RECORDS["a.py"]})
+    shared: int = store.shared_count()
+    for number in range(100):
+        store[f"copy_{number}.py"] = copy.deepcopy(RECORDS["b.py"])
+    assert store.shared_count() == shared + 1
+
+
+def test_shared_tuples_stay_bounded_under_churn():
+    store = ImportStore()
+    for generation in range(5):
+        for number in range(2000):
+            store[f"file_{number}.py"] = {"standard": {f"library_{generation}_{number}": ["name"]}, "custom": {}}
+    store.compact()
+    live: int = store.shared_count()
+    # a library string and a (library, names) triple per file, plus the layout, the names and the import types
+    assert live == 2 * 2000 + 5
+    for number in range(2000):
+        store[f"file_{number}.py"] = {"standard": {f"library_new_{number}": ["name"]}, "custom": {}}
+    # at most one compaction period of garbage on top of the live tuples
+    assert store.shared_count() <= 2 * live
+    for number in range(2000):
+        del store[f"file_{number}.py"]
+    store.compact()
+    assert store.shared_count() == 0
+
+
+def test_copy_and_pickle():
+    store = ImportStore(RECORDS)
+    assert pickle.loads(pickle.dumps(store)) == RECORDS
+    assert copy.deepcopy(store) == RECORDS
+    assert ImportStore(store) == store
+
+
+def test_deferred_store_loads_records_on_first_read():
+    loaded = []
+
+    def load(position):
+        loaded.append(position)
+        return list(RECORDS.values())[position]
+
+    store = ImportStore.deferred(list(RECORDS), load)
+    assert len(store) == 4 and list(store) == list(RECORDS) and "c.py" in store
+    assert loaded == []
+    assert store["b.py"] == RECORDS["b.py"] and list(store.entries("b.py", "standard"))[0] == ("os", ())
+    store.compact()
+    assert loaded == [1]
+    store["a.py"] = RECORDS["d.py"]
+    assert store == {**RECORDS, "a.py": RECORDS["d.py"]}
+    assert loaded == [1, 2, 3]
@@ -0,0 +1,101 @@
+import pytest
+from ..imports import find_root, classify_module, classify_module_kind
+from ..module_index import (
+    THIRD_PARTY,
+    FIRST_PARTY,
+    STANDARD_LIBRARY,
+    ModuleIndex,
+    get_module_index,
+    set_module_index,
+    register_project_root,
+    project_root_scope,
+)
+
+
+@pytest.fixture
+def project_files() -> dict:
+    return {"pandas": None, "json": None, "local_tool.py": "", "src/inner_package": None}
+
+
+@pytest.fixture
+def fresh_index():
+    previous = get_module_index()
+    set_module_index(None)
+    yield
+    set_module_index(previous)
+
+
+@pytest.mark.parametrize("module_name, expected", [
+    ("os", STANDARD_LIBRARY),
+    ("os.path", STANDARD_LIBRARY),
+    ("sys", STANDARD_LIBRARY),
+    ("itertools", STANDARD_LIBRARY),
+    ("pydantic", THIRD_PARTY),
+    ("numpy.linalg", THIRD_PARTY),
+    ("definitely_not_installed_module", FIRST_PARTY),
+])
+def test_classify(module_name, expected):
+    assert ModuleIndex.build().classify(module_name) == expected
+
+
+def test_project_root_overrides_third_party_but_not_stdlib(project):
+    index = ModuleIndex.build(project_roots=[project])
+    assert index.classify("pandas") == FIRST_PARTY
+    assert index.classify("json") == STANDARD_LIBRARY
+    assert index.classify("local_tool") == FIRST_PARTY
+    assert index.classify("inner_package.module") == FIRST_PARTY
+
+
+def test_save_and_load_round_trip(project, tmp_path):
+    index = ModuleIndex.build(project_roots=[project])
+    index.save(tmp_path / "index.json")
+    loaded = ModuleIndex.load(tmp_path / "index.json")
+    assert loaded.modules == index.modules
+    assert loaded.project_roots == index.project_roots
+
+
+def test_load_rejects_other_environment(tmp_path):
+    index = ModuleIndex.build()
+    index.fingerprint = "another interpreter"
+    index.save(tmp_path / "index.json")
+    assert ModuleIndex.load(tmp_path / "index.json") is None
+    assert ModuleIndex.load(tmp_path / "missing.json") is None
+
+
+@pytest.mark.parametrize("import_string, expected", [
+    ("import os", STANDARD_LIBRARY),
+    ("from pydantic", THIRD_PARTY),
+    ("numpy.linalg", THIRD_PARTY),
+    ("from .graph_model", FIRST_PARTY),
+    ("from ..os", FIRST_PARTY),
+])
+def test_classify_module_kind(import_string, expected):
+    assert classify_module_kind(import_string) == expected
+
+
+def test_registering_project_root_refreshes_cached_answers(project, fresh_index):
+    assert find_root("import pandas") == ("pandas", True)
+    assert classify_module("import pandas")
+    register_project_root(project)
+    assert find_root("import pandas") == ("pandas", False)
+    assert not classify_module("import pandas")
+
+
+def test_project_root_scope_restores_the_index(project, fresh_index):
+    assert find_root("import pandas") == ("pandas", True)
+    with project_root_scope(project):
+        with project_root_scope(project):
+            assert find_root("import pandas") == ("pandas", False)
+        assert find_root("import pandas") == ("pandas", False)
+    assert find_root("import pandas") == ("pandas", True)
+    assert get_module_index().project_roots == []
+
+
+def test_removing_a_root_keeps_names_of_other_roots(project, tmp_path_factory):
+    other = tmp_path_factory.mktemp("other")
+    (other / "pandas").mkdir()
+    index = ModuleIndex.build(project_roots=[project, other])
+    index.remove_project_root(project)
+    assert index.classify("pandas") == FIRST_PARTY
+    index.remove_project_root(other)
+    assert index.classify("pandas") == THIRD_PARTY
@@ -0,0 +1,68 @@
+import time
+import pytest
+from ..reachability import ReachabilityIndex, _bits_to_ids
+
+
+@pytest.fixture
+def index() -> ReachabilityIndex:
+    # a -> b -> c <-> d -> e, f isolated
+    return ReachabilityIndex([("a", "b"), ("b", "c"), ("c", "d"), ("d", "c"), ("d", "e")], nodes=["f"])
+
+
+@pytest.mark.parametrize("node, descendants, ancestors", [
+    ("a", ("b", "c", "d", "e"), ()),
+    ("b", ("c", "d", "e"), ("a",)),
+    ("c", ("d", "e"), ("a", "b", "d")),
+    ("e", (), ("a", "b", "c", "d")),
+    ("f", (), ()),
+    ("unknown", (), ()),
+])
+def test_descendants_and_ancestors(index, node, descendants, ancestors):
+    assert index.descendants(node) == descendants
+    assert index.ancestors(node) == ancestors
+
+
+@pytest.mark.parametrize("source, target, expected", [
+    ("a", "e", True),
+    ("e", "a", False),
+    ("c", "c", True),
+    ("a", "a", False),
+    ("a", "unknown", False),
+])
+def test_reaches(index, source, target, expected):
+    assert index.reaches(source, target) == expected
+
+
+def test_bits_to_ids():
+    assert _bits_to_ids(0) == []
+    assert _bits_to_ids(0b101001) == [0, 3, 5]
+
+
+def test_large_chain_is_memoised():
+    size: int = 50000
+    index = ReachabilityIndex([(i, i + 1) for i in range(size - 1)])
+    assert len(index.descendants(0)) == size - 1
+    assert len(index.ancestors(size - 1)) == size - 1
+
+    start: float = time.perf_counter()
+    for _ in range(1000):
+        index.descendants(0)
+    assert time.perf_counter() - start < 0.1
+
+
+def test_union_of_ancestors_and_descendants(index):
+    assert index.ancestors_of(["c", "f", "unknown"]) == ("a", "b", "c", "d")
+    assert index.ancestors_of(["b", "e"]) == ("a", "b", "c", "d")
+    assert index.descendants_of(["a", "f"]) == ("b", "c", "d", "e")
+    assert index.descendants_of([]) == ()
+
+
+def test_from_adjacency_matches_edges():
+    names = ["a", "b", "c", "d"]
+    adjacency = [[1], [2], [1], []]
+    index = ReachabilityIndex.from_adjacency(names, adjacency)
+    expected = ReachabilityIndex([(names[source], names[target]) for source, targets in enumerate(adjacency) for target in targets], nodes=names)
+    for name in names:
+        assert sorted(index.descendants(name)) == sorted(expected.descendants(name))
+        assert sorted(index.ancestors(name)) == sorted(expected.ancestors(name))
+    assert "d" in index and len(index) == 4
@@ -0,0 +1,37 @@
+import pytest
+from ..sharding import assign_shards, shard_key, shard_of
+
+
+PATHS = [f"package_{package}/module_{module}.py" for package in range(10) for module in range(20)]
+
+
+def test_shard_of_is_stable_and_in_range():
+    assert [shard_of(path, 4) for path in PATHS] == [shard_of(path, 4) for path in PATHS]
+    assert {shard_of(path, 4) for path in PATHS} == {0, 1, 2, 3}
+    assert shard_of("a/b.py", 1) == 0
+
+
+@pytest.mark.parametrize("path, strategy, depth, expected", [
+    ("a/b/c.py", "hash", 1, "a/b/c.py"),
+    ("a/b/c.py", "subtree", 1, "a"),
+    ("a/b/c.py", "subtree", 2, "a/b"),
+    ("top.py", "subtree", 2, "top.py"),
+    ("a\\b\\c.py", "subtree", 1, "a"),
+])
+def test_shard_key(path, strategy, depth, expected):
+    assert shard_key(path, strategy, depth) == expected
+
+
+def test_subtree_strategy_keeps_packages_together():
+    shards = assign_shards(PATHS, 3, strategy="subtree")
+    assert sum(len(paths) for paths in shards.values()) == len(PATHS)
+    for shard, paths in shards.items():
+        for path in paths:
+            assert shard_of(path.split("/")[0], 3) == shard
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        shard_of("a.py", 0)
+    with pytest.raises(ValueError):
+        shard_key("a.py", "random")
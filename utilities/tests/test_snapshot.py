@@ -0,0 +1,125 @@
+import time
+import pytest
+from numpy import memmap
+from ..import_store import ImportStore
+from ..snapshot import Snapshot, record_digest, write_snapshot
+
+
+IMPORTS = {
+    "root/a.py": {"standard": {"os": [], "pathlib": ["Path", "PurePath"]}, "custom": {"b": [["x", "y"], "z"]}},
+    "root/b.py": {"standard": {}, "custom": {}},
+    "root/ünïcode.py": {"standard": {"json": ["loads"]}, "custom": {}},
+}
+STATEMENTS = {"root/a.py": ["import os", "from pathlib import Path, PurePath"], "root/ünïcode.py": ["from json import loads"]}
+
+
+@pytest.fixture
+def snapshot(tmp_path) -> Snapshot:
+    write_snapshot(
+        tmp_path / "scan.snapshot",
+        imports=IMPORTS,
+        import_statements=STATEMENTS,
+        file_dependencies={"root/a.py": ["root/b.py", "elsewhere.py"], "root/b.py": []},
+        file_states={"root/a.py": (123, 45)},
+        metadata={"root_directory": "root"},
+    )
+    return Snapshot(tmp_path / "scan.snapshot")
+
+
+def test_round_trip(snapshot):
+    assert snapshot.metadata == {"root_directory": "root"}
+    assert snapshot.paths() == list(IMPORTS)
+    assert snapshot.imports() == IMPORTS
+    assert snapshot.import_statements() == {"root/a.py": STATEMENTS["root/a.py"], "root/b.py": [], "root/ünïcode.py": STATEMENTS["root/ünïcode.py"]}
+    assert snapshot.file_dependencies() == {"root/a.py": ["root/b.py"], "root/b.py": [], "root/ünïcode.py": []}
+    assert snapshot.file_states() == {"root/a.py": (123, 45), "root/b.py": None, "root/ünïcode.py": None}
+    assert snapshot.record_digests()["root/a.py"] == record_digest(IMPORTS["root/a.py"])
+
+
+@pytest.mark.parametrize("store", [dict, ImportStore])
+def test_list_forms_and_empty_names_round_trip(tmp_path, store):
+    imports = store({
+        "root/a.py": {"standard": ["os", "sys"], "custom": []},
+        "root/b.py": {"standard": {"json": []}, "custom": {"a": []}},
+    })
+    write_snapshot(tmp_path / "scan.snapshot", imports=imports)
+    snapshot = Snapshot(tmp_path / "scan.snapshot")
+    assert snapshot.imports() == {
+        "root/a.py": {"standard": {"os": [], "sys": []}, "custom": {}},
+        "root/b.py": {"standard": {"json": []}, "custom": {"a": []}},
+    }
+    assert snapshot.files_with_library("os") == ["root/a.py"]
+
+
+def test_sections_are_memory_mapped(snapshot):
+    assert isinstance(snapshot.sections["records"].base, memmap) or isinstance(snapshot.sections["records"], memmap)
+    assert snapshot.sections["records"].shape[1] == 5
+
+
+@pytest.mark.parametrize("value, found", [("os", True), ("root/ünïcode.py", True), ("PurePath", True), ("missing", False), ("", False)])
+def test_string_lookup(snapshot, value, found):
+    string_id = snapshot.string_id(value)
+    assert (string_id is not None) == found
+    if found:
+        assert snapshot.string(string_id) == value
+
+
+def test_files_with_library(snapshot):
+    assert snapshot.files_with_library("pathlib") == ["root/a.py"]
+    assert snapshot.files_with_library("missing") == []
+
+
+def test_per_file_reads_match_the_full_decode(snapshot):
+    imports, statements, dependencies = snapshot.imports(), snapshot.import_statements(), snapshot.file_dependencies()
+    for path in IMPORTS:
+        file_index = snapshot.file_index(path)
+        assert snapshot.record(file_index) == imports[path]
+        assert snapshot.statements_of(file_index) == statements[path]
+        assert snapshot.dependencies_of(file_index) == dependencies[path]
+    assert snapshot.file_index("missing.py") is None
+    assert snapshot.dependency_lists() == [[1], [], []]
+
+
+@pytest.mark.parametrize("kind, prefix, keys", [
+    ("library", "", ["b", "json", "os", "pathlib"]),
+    ("library", "p", ["pathlib"]),
+    ("module", "P", ["Path", "PurePath"]),
+    ("module", "zz", []),
+])
+def test_stored_index_keys(snapshot, kind, prefix, keys):
+    assert list(snapshot.keys(kind, prefix)) == keys
+
+
+def test_stored_index_postings(snapshot):
+    assert snapshot.postings("library", "os").tolist() == [[0, 0]]
+    assert snapshot.postings("module", "x").tolist() == [[0, 1]]
+    assert snapshot.postings("library", "Path").tolist() == []
+    assert snapshot.postings("library", "missing").tolist() == []
+
+
+def test_empty_snapshot(tmp_path):
+    write_snapshot(tmp_path / "empty.snapshot", imports={})
+    snapshot = Snapshot(tmp_path / "empty.snapshot")
+    assert snapshot.imports() == {}
+    assert snapshot.file_dependencies() == {}
+    assert snapshot.files_with_library("os") == []
+    assert snapshot.dependency_lists() == []
+
+
+def test_rejects_other_files(tmp_path):
+    (tmp_path / "other.bin").write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        Snapshot(tmp_path / "other.bin")
+
+
+def test_opening_large_snapshot_is_fast(tmp_path):
+    imports = {
+        f"root/package_{i % 100}/module_{i}.py": {"standard": {"os": ["path"], "json": []}, "custom": {f"package_{i % 7}": [f"name_{i}"]}}
+        for i in range(20000)
+    }
+    write_snapshot(tmp_path / "large.snapshot", imports=imports)
+    start = time.perf_counter()
+    snapshot = Snapshot(tmp_path / "large.snapshot")
+    assert snapshot.string_id("root/package_3/module_103.py") is not None
+    assert time.perf_counter() - start < 0.05
+    assert len(snapshot.files_with_library("package_3")) == sum(1 for i in range(20000) if i % 7 == 3)
@@ -0,0 +1,27 @@
+import time
+from ..snapshot import Snapshot, write_snapshot
+from ..snapshot_diff import diff_snapshots
+
+
+def imports_for(count: int, changed: int = 0) -> dict:
+    return {
+        f"root/module_{i}.py": {
+            "standard": {"os": ["path"]},
+            "custom": {f"module_{(i + 1) % count}": [], f"extra_{i}": []} if i < changed else {f"module_{(i + 1) % count}": []},
+        }
+        for i in range(count)
+    }
+
+
+def test_large_diff_reports_only_changed_files(tmp_path):
+    count: int = 20000
+    write_snapshot(tmp_path / "base.snapshot", imports=imports_for(count))
+    write_snapshot(tmp_path / "head.snapshot", imports=imports_for(count, changed=5))
+
+    start = time.perf_counter()
+    diff = diff_snapshots(Snapshot(tmp_path / "base.snapshot"), Snapshot(tmp_path / "head.snapshot"))
+    assert time.perf_counter() - start < 2.0
+    assert diff["modified_files"] == sorted(f"root/module_{i}.py" for i in range(5))
+    assert diff["added_edges"] == sorted((f"root/module_{i}.py", f"extra_{i}", "custom") for i in range(5))
+    assert diff["removed_edges"] == []
+    assert diff["new_libraries"] == sorted(f"extra_{i}" for i in range(5))